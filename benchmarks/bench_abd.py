@@ -0,0 +1,90 @@
+"""Benchmark of the ABD-matrix assembly of ``Laminate``.
+
+Compares the vectorized ``calc_ABD_matrix`` with the former triple-nested
+loop over the plies for different ply counts. Run from the repository root::
+
+    python -m benchmarks.bench_abd
+"""
+
+import timeit
+
+import numpy as np
+
+from clt_py.clt_py import (
+    AnisotropicMaterial,
+    FiberReinforcedMaterialUD,
+    IsotropicMaterial,
+    Laminate,
+    Ply,
+)
+
+
+def calc_ABD_matrix_loop(finalStack, z_position):
+    A = np.zeros((3, 3))
+    B = np.zeros((3, 3))
+    D = np.zeros((3, 3))
+    for i in range(3):
+        for j in range(3):
+            for k_ply in range(len(finalStack)):
+                A[i, j] += finalStack[k_ply].Q[i, j] * (
+                    z_position[k_ply + 1] - z_position[k_ply]
+                )
+                B[i, j] += (
+                    -finalStack[k_ply].Q[i, j]
+                    * 0.5
+                    * (z_position[k_ply + 1] ** 2 - z_position[k_ply] ** 2)
+                )
+                D[i, j] += (
+                    finalStack[k_ply].Q[i, j]
+                    / 3
+                    * (z_position[k_ply + 1] ** 3 - z_position[k_ply] ** 3)
+                )
+    return np.block([[A, B], [B, D]])
+
+
+def build_laminate(n_plies):
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    crp = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    plies = [Ply(crp, thickness=0.125, rotation=r) for r in (0, 45, -45, 90)]
+
+    laminate = Laminate()
+    for k_ply in range(n_plies):
+        laminate.stack.append(plies[k_ply % len(plies)])
+    laminate.update()
+    return laminate
+
+
+def main(ply_counts=(4, 16, 64, 256, 1024), number=20):
+    print(
+        "{:>8} {:>14} {:>14} {:>10}".format(
+            "plies", "loop [ms]", "numpy [ms]", "speedup"
+        )
+    )
+    for n_plies in ply_counts:
+        laminate = build_laminate(n_plies)
+        stack = laminate.get_finalStack()
+        z = laminate.get_z_positions()
+
+        reference = calc_ABD_matrix_loop(stack, z)
+        laminate.calc_completeStiffnessmatrix()
+        assert np.allclose(
+            laminate.get_stiffnessMatrix(), reference, atol=1e-12 * abs(reference).max()
+        )
+
+        t_loop = timeit.timeit(lambda: calc_ABD_matrix_loop(stack, z), number=number)
+        t_numpy = timeit.timeit(laminate.calc_completeStiffnessmatrix, number=number)
+        print(
+            "{:>8} {:>14.3f} {:>14.3f} {:>9.1f}x".format(
+                n_plies,
+                1e3 * t_loop / number,
+                1e3 * t_numpy / number,
+                t_loop / t_numpy,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark of loading laminates from a database file.
+
+Compares opening a memory mapped database with the construction of the
+``Laminate`` objects. Run from the repository root::
+
+    python -m benchmarks.bench_database
+"""
+
+import os
+import tempfile
+import timeit
+
+import numpy as np
+
+from clt_py.clt_py import (
+    AnisotropicMaterial,
+    FiberReinforcedMaterialUD,
+    IsotropicMaterial,
+)
+from clt_py.database import open_database, write_database
+from clt_py.table import LaminateTable
+
+
+def main(n_laminates=200000, n_plies=16, number=5):
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    crp = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    rotations = np.random.RandomState(0).choice(
+        [0.0, 45.0, -45.0, 90.0], (n_laminates, n_plies)
+    )
+    table = LaminateTable.from_arrays([crp], rotations, 0.125)
+
+    path = os.path.join(tempfile.mkdtemp(), "laminates.cltdb")
+    t_write = timeit.timeit(lambda: write_database(path, table), number=1)
+
+    def open_and_read():
+        with open_database(path) as database:
+            return database.get_stiffnessMatrix(n_laminates // 2).copy()
+
+    t_open = timeit.timeit(open_and_read, number=number) / number
+    database = open_database(path)
+    n_load = 200
+    t_load = timeit.timeit(
+        lambda: [database.load_laminate(k) for k in range(n_load)], number=1
+    )
+    assert np.allclose(
+        database.load_laminate(0).get_stiffnessMatrix(), table[0].get_stiffnessMatrix()
+    )
+
+    print(
+        "{} laminates with {} plies, {:.1f} MB".format(
+            n_laminates, n_plies, os.path.getsize(path) / 1e6
+        )
+    )
+    print("{:<40} {:>10.1f} ms".format("write database", 1e3 * t_write))
+    print("{:<40} {:>10.2f} ms".format("open database and read one ABD", 1e3 * t_open))
+    print(
+        "{:<40} {:>10.1f} ms".format(
+            "construct all Laminate objects (est.)",
+            1e3 * t_load / n_load * n_laminates,
+        )
+    )
+    os.remove(path)
+
+
+if __name__ == "__main__":
+    main()
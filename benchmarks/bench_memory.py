@@ -0,0 +1,89 @@
+"""Benchmark of the memory of plies and laminates.
+
+Compares ``Ply`` and ``Laminate`` objects with the struct-of-arrays storage
+of ``PlyTable`` and ``LaminateTable``. Run from the repository root::
+
+    python -m benchmarks.bench_memory
+"""
+
+import gc
+import tracemalloc
+
+import numpy as np
+
+from clt_py.clt_py import (
+    AnisotropicMaterial,
+    FiberReinforcedMaterialUD,
+    IsotropicMaterial,
+    Laminate,
+    Ply,
+)
+from clt_py.table import LaminateTable, PlyTable
+
+
+def traced_memory(function):
+    """Result of ``function`` and the memory allocated for it in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = function()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, size
+
+
+def build_laminates(material, rotations):
+    laminates = []
+    for stack in rotations:
+        laminate = Laminate(lazy=True)
+        laminate.addPlies(Ply(material, thickness=0.125, rotation=r) for r in stack)
+        laminate.update()
+        laminates.append(laminate)
+    return laminates
+
+
+def main(n_laminates=2000, n_plies=16):
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    crp = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    rotations = np.random.RandomState(0).choice(
+        [0.0, 45.0, -45.0, 90.0], (n_laminates, n_plies)
+    )
+    n_total = n_laminates * n_plies
+
+    plies, m_plies = traced_memory(
+        lambda: [Ply(crp, thickness=0.125, rotation=r) for r in rotations.ravel()]
+    )
+    del plies
+    _, m_ply_table = traced_memory(lambda: PlyTable([crp], rotations, 0.125))
+
+    laminates, m_laminates = traced_memory(lambda: build_laminates(crp, rotations))
+    table, m_laminate_table = traced_memory(
+        lambda: LaminateTable.from_arrays([crp], rotations, 0.125)
+    )
+    ABD, m_ABD = traced_memory(table.get_stiffnessMatrices)
+    assert np.allclose(ABD[0], laminates[0].get_stiffnessMatrix())
+
+    print("{:<32} {:>12}".format("{} plies".format(n_total), "[bytes/ply]"))
+    print("{:<32} {:>12.0f}".format("Ply objects", m_plies / n_total))
+    print("{:<32} {:>12.0f}".format("PlyTable", m_ply_table / n_total))
+    print(
+        "{:<32} {:>12}".format("{} laminates".format(n_laminates), "[bytes/laminate]")
+    )
+    print("{:<32} {:>12.0f}".format("Laminate objects", m_laminates / n_laminates))
+    print(
+        "{:<32} {:>12.0f}".format(
+            "LaminateTable with ABD",
+            (m_laminate_table + m_ABD) / n_laminates,
+        )
+    )
+    print(
+        "reduction laminates: {:.1f}x".format(m_laminates / (m_laminate_table + m_ABD))
+    )
+
+
+if __name__ == "__main__":
+    main()
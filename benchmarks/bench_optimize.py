@@ -0,0 +1,85 @@
+"""Benchmark of the fitness evaluation of a genetic algorithm.
+
+Compares the evaluation of whole populations by
+``optimize.evaluate_chromosomes`` with individuals built by ``addPly`` and
+``update``. Run from the repository root::
+
+    python -m benchmarks.bench_optimize
+"""
+
+import timeit
+
+import numpy as np
+
+from clt_py.clt_py import (
+    AnisotropicMaterial,
+    FiberReinforcedMaterialUD,
+    IsotropicMaterial,
+    Laminate,
+    Ply,
+)
+from clt_py.optimize import BucklingLoad, GeneticOptimizer, evaluate_chromosomes
+
+ANGLES = np.array([0.0, 45.0, -45.0, 90.0])
+
+
+def loop_evaluation(material, population, objective):
+    values = []
+    for chromosome in population:
+        laminate = Laminate(symetric=True)
+        for gene in chromosome:
+            laminate.addPly(Ply(material, thickness=0.125, rotation=ANGLES[gene]))
+        laminate.update()
+        values.append(objective(laminate.get_stiffnessMatrix()[np.newaxis], None)[0])
+    return np.array(values)
+
+
+def main(population_size=200, n_genes=12, n_generations=50):
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    crp = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    objective = BucklingLoad(500, 250)
+    population = np.random.RandomState(0).randint(
+        len(ANGLES), size=(population_size, n_genes)
+    )
+
+    def vectorized():
+        return evaluate_chromosomes(
+            population, ANGLES, 0.125, [crp], None, True, objective, []
+        )[0]
+
+    t_vectorized = timeit.timeit(vectorized, number=10) / 10
+    start = timeit.default_timer()
+    reference = loop_evaluation(crp, population, objective)
+    t_loop = timeit.default_timer() - start
+    assert np.allclose(reference, vectorized())
+
+    optimizer = GeneticOptimizer(
+        ANGLES,
+        n_genes,
+        0.125,
+        [crp],
+        objective,
+        population_size=population_size,
+        n_generations=n_generations,
+        seed=0,
+    )
+    start = timeit.default_timer()
+    result = optimizer.run()
+    t_run = timeit.default_timer() - start
+
+    print("population of {}, {} genes".format(population_size, n_genes))
+    print("{:<32} {:>10.2f} ms".format("addPly and update", 1e3 * t_loop))
+    print("{:<32} {:>10.2f} ms".format("vectorized", 1e3 * t_vectorized))
+    print("speedup: {:.0f}x".format(t_loop / t_vectorized))
+    print(
+        "{} generations: {:.2f} s, {} evaluations, best {:.1f}".format(
+            n_generations, t_run, result.n_evaluations, result.objective
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Benchmark of panel buckling and natural frequency screening.
+
+Compares the vectorized functions of ``clt_py.panel`` with a loop over
+designs and half-wave numbers. Run from the repository root::
+
+    python -m benchmarks.bench_panel
+"""
+
+import math
+import timeit
+
+import numpy as np
+
+from clt_py.batch import calc_ABD_matrices
+from clt_py.clt_py import (
+    AnisotropicMaterial,
+    FiberReinforcedMaterialUD,
+    IsotropicMaterial,
+)
+from clt_py.panel import calc_bucklingLoads, calc_naturalFrequencies
+
+
+def loop_screening(D, arealMass, a, b, load_ratio, max_m=10, max_n=10):
+    results = []
+    for k in range(len(D)):
+        D11, D22 = D[k, 0, 0], D[k, 1, 1]
+        D3 = D[k, 0, 1] + 2 * D[k, 2, 2]
+        N_x, f = math.inf, math.inf
+        for m in range(1, max_m + 1):
+            for n in range(1, max_n + 1):
+                alpha, beta = m / a[k], n / b[k]
+                stiffness = math.pi**4 * (
+                    D11 * alpha**4 + 2 * D3 * alpha**2 * beta**2 + D22 * beta**4
+                )
+                denominator = math.pi**2 * (alpha**2 + load_ratio[k] * beta**2)
+                if denominator > 0:
+                    N_x = min(N_x, stiffness / denominator)
+                f = min(f, math.sqrt(stiffness / arealMass) / (2 * math.pi))
+        results.append((N_x, f))
+    return np.array(results)
+
+
+def main(n_designs=100000, n_loop=2000):
+    matMat = IsotropicMaterial(rho=1.32e-9, E=3.65e3, v=0.3)
+    matFib = AnisotropicMaterial(
+        rho=1.74e-9, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    crp = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    random = np.random.RandomState(0)
+    rotations = random.choice([0.0, 45.0, -45.0, 90.0], (n_designs, 8))
+    ABD = calc_ABD_matrices(rotations, 0.125, [crp], symetric=True)
+    D = ABD[:, 3:, 3:]
+    arealMass = crp.rho * 16 * 0.125
+    a = random.uniform(200, 800, n_designs)
+    b = random.uniform(100, 400, n_designs)
+    load_ratio = random.uniform(-0.5, 1, n_designs)
+
+    def vectorized():
+        return (
+            calc_bucklingLoads(D, a, b, load_ratio).values,
+            calc_naturalFrequencies(D, arealMass, a, b).values[:, 0],
+        )
+
+    t_vectorized = timeit.timeit(vectorized, number=1)
+    start = timeit.default_timer()
+    reference = loop_screening(D[:n_loop], arealMass, a, b, load_ratio)
+    t_loop = (timeit.default_timer() - start) / n_loop * n_designs
+    N_x, f = vectorized()
+    assert np.allclose(reference, np.stack([N_x[:n_loop], f[:n_loop]], axis=-1))
+
+    print("{} designs, 10 x 10 half-wave numbers".format(n_designs))
+    print("{:<32} {:>10.2f} s".format("loop (extrapolated)", t_loop))
+    print("{:<32} {:>10.2f} s".format("vectorized", t_vectorized))
+    print("speedup: {:.0f}x".format(t_loop / t_vectorized))
+
+
+if __name__ == "__main__":
+    main()
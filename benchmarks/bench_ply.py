@@ -0,0 +1,109 @@
+"""Benchmark of the construction of ``Ply`` objects.
+
+Compares the closed-form transformation from the material invariants with
+the former transformation by inverted rotation matrices, both uncached, and
+the gain of ``PLY_STIFFNESS_CACHE`` for repeated angles separately. Run from the repository root::
+
+    python -m benchmarks.bench_ply
+"""
+
+import math
+import timeit
+
+import numpy as np
+
+from clt_py.clt_py import (
+    PLY_STIFFNESS_CACHE,
+    AnisotropicMaterial,
+    FiberReinforcedMaterialUD,
+    IsotropicMaterial,
+    Ply,
+)
+
+
+class PlyInverse(Ply):
+    """Ply with the former transformation by numerical matrix inversion."""
+
+    def calc_matrices(self):
+        c = math.cos(self.rotRad)
+        s = math.sin(self.rotRad)
+        rotStress = np.array(
+            [
+                [c**2, s**2, 2 * s * c],
+                [s**2, c**2, -2 * s * c],
+                [-s * c, s * c, c**2 - s**2],
+            ]
+        )
+        rotElongation = np.array(
+            [
+                [c**2, s**2, s * c],
+                [s**2, c**2, -s * c],
+                [-2 * s * c, 2 * s * c, c**2 - s**2],
+            ]
+        )
+        S = np.matmul(
+            rotElongation,
+            np.matmul(self.mat.complianceMatrix, np.linalg.inv(rotStress)),
+        )
+        Q = np.matmul(
+            rotStress,
+            np.matmul(self.mat.stiffnessMatrix, np.linalg.inv(rotElongation)),
+        )
+        alpha = rotElongation @ self.mat.alpha
+        beta = rotElongation @ self.mat.beta
+        return rotElongation, rotStress, Q, S, alpha, beta
+
+
+def build_plies(ply_class, material, rotations):
+    return [ply_class(material, thickness=0.125, rotation=r) for r in rotations]
+
+
+def main(n_plies=2000, number=5):
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    crp = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    rotations = np.random.RandomState(0).uniform(-90, 90, n_plies)
+
+    for reference, ply in zip(
+        build_plies(PlyInverse, crp, rotations[:10]),
+        build_plies(Ply, crp, rotations[:10]),
+    ):
+        assert np.allclose(reference.Q, ply.Q)
+        assert np.allclose(reference.S, ply.S)
+        assert np.allclose(reference.alpha, ply.alpha)
+
+    maxsize = PLY_STIFFNESS_CACHE.maxsize
+    PLY_STIFFNESS_CACHE.maxsize = 0
+    PLY_STIFFNESS_CACHE.clear()
+    t_inverse = timeit.timeit(
+        lambda: build_plies(PlyInverse, crp, rotations), number=number
+    )
+    t_closed = timeit.timeit(lambda: build_plies(Ply, crp, rotations), number=number)
+    PLY_STIFFNESS_CACHE.maxsize = maxsize
+    PLY_STIFFNESS_CACHE.clear()
+    repeated = np.resize([0.0, 45.0, -45.0, 90.0], n_plies)
+    t_cached = timeit.timeit(lambda: build_plies(Ply, crp, repeated), number=number)
+
+    n_total = n_plies * number
+    print("{:<32} {:>12}".format("ply construction", "[us/ply]"))
+    print(
+        "{:<32} {:>12.2f}".format(
+            "inverted rotation matrices", 1e6 * t_inverse / n_total
+        )
+    )
+    print("{:<32} {:>12.2f}".format("closed form", 1e6 * t_closed / n_total))
+    print(
+        "{:<32} {:>12.2f}".format(
+            "closed form, cached 0/45/-45/90", 1e6 * t_cached / n_total
+        )
+    )
+    # uncached, the gain is only the closed form, for repeated angles most of
+    # the gain comes from PLY_STIFFNESS_CACHE
+    print("speedup closed form, uncached: {:.1f}x".format(t_inverse / t_closed))
+    print("speedup cache, repeated angles: {:.1f}x".format(t_closed / t_cached))
+
+
+if __name__ == "__main__":
+    main()
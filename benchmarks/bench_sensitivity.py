@@ -0,0 +1,101 @@
+"""Benchmark of the sensitivities of ABD-matrices.
+
+Compares ``sensitivity.calc_ABD_jacobian`` with central finite differences
+of ``Laminate`` objects, perturbed by ``Ply.set_rotation``,
+``Ply.set_thickness`` and ``FiberReinforcedMaterialUD.set_fibVolRatio``.
+Run from the repository root::
+
+    python -m benchmarks.bench_sensitivity
+"""
+
+import timeit
+
+import numpy as np
+
+from clt_py.clt_py import (
+    AnisotropicMaterial,
+    FiberReinforcedMaterialUD,
+    IsotropicMaterial,
+    Laminate,
+    Ply,
+)
+from clt_py.sensitivity import calc_ABD_jacobian
+
+
+def finite_differences(material, rotations, thickness, h=1e-6):
+    """Derivatives of one laminate with respect to all rotations,
+    thicknesses and the fiber-volume-ratio."""
+    laminate = Laminate()
+    plies = [Ply(material, thickness=thickness, rotation=r) for r in rotations]
+    laminate.addPlies(plies)
+    laminate.update()
+
+    def difference(perturb, reset):
+        perturb(h)
+        upper = laminate.get_stiffnessMatrix().copy()
+        perturb(-h)
+        lower = laminate.get_stiffnessMatrix().copy()
+        reset()
+        return (upper - lower) / (2 * h)
+
+    derivatives = []
+    for ply, rotation in zip(plies, rotations):
+        derivatives.append(
+            difference(
+                lambda dx: ply.set_rotation(rotation + dx),
+                lambda: ply.set_rotation(rotation),
+            )
+        )
+    for ply in plies:
+        derivatives.append(
+            difference(
+                lambda dx: ply.set_thickness(thickness + dx),
+                lambda: ply.set_thickness(thickness),
+            )
+        )
+    fibVolRatio = material.fibVolRatio
+
+    def perturb_fibVolRatio(dx):
+        material.set_fibVolRatio(fibVolRatio + dx)
+        for ply in plies:
+            ply.update()
+
+    derivatives.append(difference(perturb_fibVolRatio, lambda: perturb_fibVolRatio(0)))
+    return np.array(derivatives)
+
+
+def main(n_laminates=2000, n_plies=16, n_loop=50):
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    crp = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    rotations = np.random.RandomState(0).uniform(-90, 90, (n_laminates, n_plies))
+
+    start = timeit.default_timer()
+    reference = [finite_differences(crp, stack, 0.125) for stack in rotations[:n_loop]]
+    t_loop = (timeit.default_timer() - start) / n_loop * n_laminates
+    start = timeit.default_timer()
+    jacobian = calc_ABD_jacobian(rotations, 0.125, [crp])
+    t_analytic = timeit.default_timer() - start
+
+    analytic = np.concatenate(
+        [
+            jacobian.d_rotations[:n_loop],
+            jacobian.d_thicknesses[:n_loop],
+            jacobian.d_fibVolRatios[:n_loop],
+        ],
+        axis=1,
+    )
+    error = np.max(np.abs(analytic - np.array(reference))) / np.max(np.abs(analytic))
+
+    print("{} laminates, {} plies".format(n_laminates, n_plies))
+    print("{:<32} {:>10.2f} s".format("finite differences (extrapolated)", t_loop))
+    print("{:<32} {:>10.2f} s".format("analytic", t_analytic))
+    print(
+        "speedup: {:.0f}x, relative deviation {:.1e}".format(t_loop / t_analytic, error)
+    )
+
+
+if __name__ == "__main__":
+    main()
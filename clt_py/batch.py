@@ -0,0 +1,141 @@
+"""Vectorized evaluation of many laminates at once.
+
+The functions in this module work on plain arrays of stacking sequences
+instead of ``Ply`` and ``Laminate`` objects. They use the same formulas as
+``Ply.calc_stiffnessMatrix`` and ``Laminate.calc_completeStiffnessmatrix``.
+"""
+
+import numpy as np
+
+from .clt_py import (
+    EFFECTIVE_CONSTANTS,
+    calc_ABD_matrix,
+    calc_effectiveConstants,
+    calc_rotated_stiffnessMatrix,
+    calc_stiffnessInvariants,
+)
+
+
+def material_stiffnessMatrices(materials):
+    """Stack the stiffness matrices of materials.
+
+    :param materials: materials or stiffness matrices, shape (n_materials, 3, 3)
+    :type materials: {list of Material2D, numpy.ndarray}
+    :return: stiffness matrices, shape (n_materials, 3, 3)
+    :rtype: numpy.ndarray
+    """
+    if isinstance(materials, np.ndarray):
+        C = materials
+    else:
+        C = [getattr(mat, "stiffnessMatrix", mat) for mat in materials]
+    return np.asarray(C, dtype=float).reshape(-1, 3, 3)
+
+
+def calc_ply_stiffnessMatrices(rotations, materials, material_indices=None):
+    """Stiffness matrices Q of rotated plies.
+
+    :param rotations: ply rotations in relation to laminate axis. Unit=[°]
+    :type rotations: numpy.ndarray
+    :param materials: materials or stiffness matrices, shape (n_materials, 3, 3)
+    :type materials: {list of Material2D, numpy.ndarray}
+    :param material_indices: index into ``materials`` for every ply, \
+        broadcastable to ``rotations``, defaults to the first material
+    :type material_indices: numpy.ndarray, optional
+    :return: ply stiffness matrices, shape (rotations.shape + (3, 3))
+    :rtype: numpy.ndarray
+    """
+    rotRad = np.radians(np.asarray(rotations, dtype=float))
+    if material_indices is None:
+        material_indices = 0
+    U = calc_stiffnessInvariants(material_stiffnessMatrices(materials))
+    return calc_rotated_stiffnessMatrix(
+        U[np.broadcast_to(material_indices, rotRad.shape)], rotRad
+    )
+
+
+def calc_z_positions(thicknesses, move_reference_plane=True):
+    """Ply boundaries of stacks of plies.
+
+    :param thicknesses: ply thicknesses, shape (..., n_plies)
+    :type thicknesses: numpy.ndarray
+    :param move_reference_plane: reference plane in the middle of the laminate, \
+        defaults to True
+    :type move_reference_plane: bool, optional
+    :return: z-positions, shape (..., n_plies + 1)
+    :rtype: numpy.ndarray
+    """
+    thicknesses = np.asarray(thicknesses, dtype=float)
+    z = np.zeros(thicknesses.shape[:-1] + (thicknesses.shape[-1] + 1,))
+    np.cumsum(thicknesses, axis=-1, out=z[..., 1:])
+    if move_reference_plane:
+        z -= z[..., -1:] / 2
+    return z
+
+
+def calc_ABD_matrices(
+    rotations,
+    thicknesses,
+    materials,
+    material_indices=None,
+    symetric=False,
+    move_reference_plane=True,
+):
+    """Complete stiffness matrices (ABD-matrices) of many laminates.
+
+    Every row describes the stack of one laminate from bottom to top, \
+    equivalent to consecutive calls of ``Laminate.addPly``.
+
+    :param rotations: ply rotations. Unit=[°], shape (n_laminates, n_plies)
+    :type rotations: numpy.ndarray
+    :param thicknesses: ply thicknesses, broadcastable to ``rotations``
+    :type thicknesses: {float, numpy.ndarray}
+    :param materials: materials or stiffness matrices, shape (n_materials, 3, 3)
+    :type materials: {list of Material2D, numpy.ndarray}
+    :param material_indices: index into ``materials`` for every ply, \
+        broadcastable to ``rotations``, defaults to the first material
+    :type material_indices: numpy.ndarray, optional
+    :param symetric: mirror the stacks like ``Laminate(symetric=True)``, \
+        defaults to False
+    :type symetric: bool, optional
+    :param move_reference_plane: reference plane in the middle of the laminate, \
+        defaults to True
+    :type move_reference_plane: bool, optional
+    :return: ABD-matrices, shape (n_laminates, 6, 6)
+    :rtype: numpy.ndarray
+    """
+    rotations = np.atleast_2d(np.asarray(rotations, dtype=float))
+    if rotations.ndim != 2:
+        raise ValueError("rotations must have shape (n_laminates, n_plies)")
+    thicknesses = np.broadcast_to(np.asarray(thicknesses, dtype=float), rotations.shape)
+    if material_indices is None:
+        material_indices = 0
+    material_indices = np.broadcast_to(material_indices, rotations.shape)
+
+    if symetric:
+        rotations = np.concatenate([rotations, rotations[:, ::-1]], axis=1)
+        thicknesses = np.concatenate([thicknesses, thicknesses[:, ::-1]], axis=1)
+        material_indices = np.concatenate(
+            [material_indices, material_indices[:, ::-1]], axis=1
+        )
+
+    Q = calc_ply_stiffnessMatrices(rotations, materials, material_indices)
+    z = calc_z_positions(thicknesses, move_reference_plane)
+    return calc_ABD_matrix(Q, z)
+
+
+def calc_engineeringConstants(ABD, thickness):
+    """Effective membrane engineering constants of laminates.
+
+    Same constants as ``Laminate.get_membraneConstants``.
+
+    :param ABD: ABD-matrices, shape (..., 6, 6)
+    :type ABD: numpy.ndarray
+    :param thickness: total thickness of the laminates, shape (...)
+    :type thickness: {float, numpy.ndarray}
+    :return: E_x, E_y, G_xy and v_xy, shape (...) each
+    :rtype: dict
+    """
+    constants = calc_effectiveConstants(
+        np.linalg.inv(np.asarray(ABD, dtype=float)), thickness
+    )
+    return {name: constants[..., 0, k] for k, name in enumerate(EFFECTIVE_CONSTANTS)}
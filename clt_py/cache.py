@@ -0,0 +1,178 @@
+"""Bounded caches for computed results."""
+
+from collections import OrderedDict, namedtuple
+import os
+import tempfile
+import threading
+
+import numpy as np
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+ResultCacheInfo = namedtuple(
+    "ResultCacheInfo",
+    ["hits", "misses", "maxsize", "currsize", "nbytes", "disk_hits", "disk_misses"],
+)
+
+
+class LRUCache:
+    """Least-recently-used cache with hit/miss statistics.
+
+    Entries can be stored with a tag, all entries of a tag are dropped by
+    ``invalidate``.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        :param maxsize: maximum number of entries, 0 disables the cache, \
+            defaults to 1024
+        :type maxsize: int, optional
+        """
+        super().__init__()
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.data = OrderedDict()
+        self.tags = {}
+        self.lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.data)
+
+    def __contains__(self, key):
+        return key in self.data
+
+    def get(self, key, default=None):
+        with self.lock:
+            try:
+                value = self.data[key][0]
+            except KeyError:
+                self.misses += 1
+                return default
+            self.data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value, tag=None):
+        with self.lock:
+            if self.maxsize <= 0:
+                return
+            if key in self.data:
+                self.remove(key)
+            self.data[key] = (value, tag)
+            if tag is not None:
+                self.tags.setdefault(tag, set()).add(key)
+            while len(self.data) > self.maxsize:
+                self.remove(next(iter(self.data)))
+
+    def remove(self, key):
+        with self.lock:
+            value, tag = self.data.pop(key)
+            if tag is not None:
+                keys = self.tags[tag]
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+    def invalidate(self, tag):
+        """Drop all entries stored with ``tag``."""
+        with self.lock:
+            for key in list(self.tags.get(tag, ())):
+                self.remove(key)
+
+    def clear(self):
+        with self.lock:
+            self.data.clear()
+            self.tags.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self.data))
+
+
+class ResultCache(LRUCache):
+    """LRU cache of arrays with an optional directory as second tier.
+
+    Keys are strings, entries evicted from memory stay available in the
+    directory as ``<key>.npy`` files. Cached arrays are read-only.
+    """
+
+    def __init__(self, maxsize=1024, directory=None):
+        """
+        :param maxsize: maximum number of entries in memory, 0 disables the \
+            memory tier, defaults to 1024
+        :type maxsize: int, optional
+        :param directory: directory of the disk tier, defaults to None
+        :type directory: str, optional
+        """
+        super().__init__(maxsize)
+        self.nbytes = 0
+        self.disk_hits = 0
+        self.disk_misses = 0
+        self.directory = None
+        self.set_directory(directory)
+
+    def set_directory(self, directory):
+        """Set the directory of the disk tier, None disables it."""
+        if directory is not None:
+            os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+
+    def get_path(self, key):
+        return os.path.join(self.directory, key + ".npy")
+
+    def get(self, key, default=None):
+        with self.lock:
+            value = super().get(key)
+            if value is not None or self.directory is None:
+                return default if value is None else value
+            try:
+                value = np.load(self.get_path(key))
+            except (OSError, ValueError):
+                self.disk_misses += 1
+                return default
+            self.disk_hits += 1
+            value.setflags(write=False)
+            super().put(key, value)
+            if key in self.data:
+                self.nbytes += value.nbytes
+            return value
+
+    def put(self, key, value, tag=None):
+        value = np.array(value)
+        value.setflags(write=False)
+        with self.lock:
+            super().put(key, value, tag)
+            if key in self.data:
+                self.nbytes += value.nbytes
+            if self.directory is not None and not os.path.exists(self.get_path(key)):
+                # atomic replace, concurrent processes never read partial files
+                handle, path = tempfile.mkstemp(suffix=".npy", dir=self.directory)
+                with os.fdopen(handle, "wb") as file:
+                    np.save(file, value)
+                os.replace(path, self.get_path(key))
+        return value
+
+    def remove(self, key):
+        with self.lock:
+            self.nbytes -= self.data[key][0].nbytes
+            super().remove(key)
+
+    def clear(self):
+        """Clear the memory tier and statistics, the disk tier is kept."""
+        with self.lock:
+            super().clear()
+            self.nbytes = 0
+            self.disk_hits = 0
+            self.disk_misses = 0
+
+    def info(self):
+        return ResultCacheInfo(
+            self.hits,
+            self.misses,
+            self.maxsize,
+            len(self.data),
+            self.nbytes,
+            self.disk_hits,
+            self.disk_misses,
+        )
@@ -0,0 +1,440 @@
+"""Console script ``clt-py`` evaluating laminates from CSV or JSONL files.
+
+The input is read line by line and evaluated in chunks of a fixed number
+of laminates, results are written after every chunk. Memory is therefore
+bounded by the chunk size and the number of workers, not by the input size.
+
+Every input record describes one laminate and an optional load case:
+
+==================  ==========================================================
+field               value
+==================  ==========================================================
+id                  name of the laminate, defaults to the line number
+rotations           ply rotations in °, list or "/"-separated, bottom to top
+thicknesses         ply thickness or thicknesses, defaults to 1
+materials           material name or names of the plies
+symetric            mirror the stack, defaults to false
+move_reference      reference plane in the middle, defaults to true
+N_x ... M_xy        load case, evaluated with strength allowables if given
+==================  ==========================================================
+
+Materials are defined in a JSON file by name, see ``build_materials``.
+"""
+
+from collections import namedtuple
+import argparse
+import csv
+import itertools
+import json
+import sys
+
+import numpy as np
+
+from .batch import calc_engineeringConstants
+from .clt_py import (
+    AnisotropicMaterial,
+    FiberReinforcedMaterialUD,
+    IsotropicMaterial,
+    Material2D,
+    NotEnoughArgumentError,
+    OverDeterminedError,
+)
+from .failure import CRITERIA, evaluate_table_failure
+from .sweep import iter_map
+from .table import LaminateTable, PlyTable
+
+LOAD_FIELDS = ("N_x", "N_y", "N_xy", "M_x", "M_y", "M_xy")
+CONSTANT_FIELDS = ("E_x", "E_y", "G_xy", "v_xy")
+FAILURE_FIELDS = ("reserveFactor", "criticalPly", "criticalMode")
+ABD_FIELDS = tuple("ABD_{}{}".format(i, j) for i in range(1, 7) for j in range(1, 7))
+
+MaterialParameters = namedtuple(
+    "MaterialParameters", ["stiffnessInvariants", "complianceInvariants", "strength"]
+)
+MaterialParameters.__doc__ = """Properties of a material used by ``evaluate_records``.
+
+Chunks are sent to the workers with these compact tuples instead of
+pickled material objects.
+"""
+
+
+def material_parameters(materials):
+    """Compact ``MaterialParameters`` of materials.
+
+    :param materials: material name to material
+    :type materials: dict
+    :return: material name to parameters
+    :rtype: dict
+    """
+    return {
+        name: MaterialParameters(
+            np.array(material.stiffnessInvariants, dtype=float),
+            np.array(material.complianceInvariants, dtype=float),
+            material.strength,
+        )
+        for name, material in materials.items()
+    }
+
+
+def build_materials(definitions):
+    """Materials of a dict of definitions.
+
+    Every definition contains ``type`` ("isotropic", "anisotropic" or
+    "fiber_reinforced"), the arguments of the constructor of the material
+    and optional ``strength`` (R_para_t, R_para_c, R_ortho_t, R_ortho_c,
+    R_shear). ``matFib`` and ``matMat`` of fiber reinforced materials are
+    names of other definitions.
+
+    :param definitions: material name to definition
+    :type definitions: dict
+    :raises ValueError: Not defined material type or constituent, invalid \
+        arguments of a material
+    :return: material name to material
+    :rtype: dict
+    """
+    materials = {}
+
+    def build(name, pending=()):
+        if name in materials:
+            return materials[name]
+        if name not in definitions or name in pending:
+            raise ValueError("material '{}' is not defined".format(name))
+        arguments = dict(definitions[name])
+        if "type" not in arguments:
+            raise ValueError("material '{}' has no type".format(name))
+        kind = arguments.pop("type")
+        strength = arguments.pop("strength", None)
+        arguments.setdefault("label", name)
+        if kind == "fiber_reinforced":
+            for constituent in ("matFib", "matMat"):
+                if constituent not in arguments:
+                    raise ValueError(
+                        "material '{}' requires '{}'".format(name, constituent)
+                    )
+            for constituent in ("matFib", "matMat"):
+                arguments[constituent] = build(
+                    arguments[constituent], pending + (name,)
+                )
+        elif kind not in ("isotropic", "anisotropic"):
+            raise ValueError(
+                "type '{}' of material '{}' is not implemented".format(kind, name)
+            )
+        try:
+            if kind == "isotropic":
+                material = IsotropicMaterial(**arguments)
+            elif kind == "anisotropic":
+                material = AnisotropicMaterial(**arguments)
+            else:
+                material = FiberReinforcedMaterialUD(**arguments)
+            if strength is not None:
+                material.set_strength(*strength)
+        except (
+            TypeError,
+            NotEnoughArgumentError,
+            OverDeterminedError,
+            Material2D.NotAnisotropicError,
+            Material2D.NotIsotropicError,
+        ) as error:
+            raise ValueError(
+                "invalid arguments of material '{}': {}".format(
+                    name, str(error) or type(error).__name__
+                )
+            ) from None
+        materials[name] = material
+        return material
+
+    for name in definitions:
+        build(name)
+    return materials
+
+
+def _values(value, convert=float):
+    if isinstance(value, str):
+        return [convert(item) for item in value.split("/") if item.strip()]
+    if isinstance(value, (list, tuple)):
+        return [convert(item) for item in value]
+    return [convert(value)]
+
+
+def _flag(value, default):
+    if value is None or value == "":
+        return default
+    if isinstance(value, str):
+        return value.strip().lower() in ("1", "true", "yes")
+    return bool(value)
+
+
+def parse_record(record, number):
+    """Laminate definition of an input record.
+
+    :param record: fields of one CSV row or JSON line
+    :type record: dict
+    :param number: line number, default id
+    :type number: int
+    :raises ValueError: laminate without plies or ply arrays of different length
+    :return: id, rotations, thicknesses, material names, move_reference \
+        and load case or None
+    :rtype: tuple
+    """
+    rotations = _values(record.get("rotations", ""))
+    thicknesses = _values(record.get("thicknesses", 1.0))
+    names = _values(record.get("materials", ""), str)
+    if not rotations:
+        raise ValueError("laminate {} has no plies".format(number))
+    if len(thicknesses) == 1:
+        thicknesses = thicknesses * len(rotations)
+    if len(names) == 1:
+        names = names * len(rotations)
+    if not len(rotations) == len(thicknesses) == len(names):
+        raise ValueError(
+            "laminate {}: rotations, thicknesses and materials differ in length".format(
+                number
+            )
+        )
+    if _flag(record.get("symetric"), False):
+        rotations += rotations[::-1]
+        thicknesses += thicknesses[::-1]
+        names += names[::-1]
+
+    load = [record.get(field) for field in LOAD_FIELDS]
+    if all(value is None or value == "" for value in load):
+        load = None
+    else:
+        load = [float(value or 0) for value in load]
+    name = record.get("id")
+    if name is None or name == "":
+        name = str(number)
+    return (
+        name,
+        rotations,
+        thicknesses,
+        names,
+        _flag(record.get("move_reference"), True),
+        load,
+    )
+
+
+def _laminate_table(records, materials):
+    names = list(materials)
+    material_index = {name: k for k, name in enumerate(names)}
+    try:
+        indices = [material_index[name] for record in records for name in record[3]]
+    except KeyError as error:
+        raise ValueError("material {} is not defined".format(error)) from None
+    plies = PlyTable(
+        [materials[name] for name in names],
+        [rotation for record in records for rotation in record[1]],
+        [thickness for record in records for thickness in record[2]],
+        indices,
+    )
+    offsets = np.zeros(len(records) + 1, dtype=np.int64)
+    np.cumsum([len(record[1]) for record in records], out=offsets[1:])
+    return LaminateTable(plies, offsets, [record[4] for record in records])
+
+
+def evaluate_records(records, materials, criterion="tsai_wu"):
+    """Stiffness and failure of a chunk of parsed records.
+
+    :param records: results of ``parse_record``
+    :type records: list of tuple
+    :param materials: material name to material or ``MaterialParameters``
+    :type materials: dict
+    :param criterion: failure criterion of the load cases, defaults to "tsai_wu"
+    :type criterion: str, optional
+    :raises ValueError: Not defined material, material of a loaded \
+        laminate without strength allowables
+    :return: output rows
+    :rtype: list of dict
+    """
+    table = _laminate_table(records, materials)
+    ABD = table.get_stiffnessMatrices()
+    thickness = np.add.reduceat(table.plies.thickness, table.offsets[:-1])
+    constants = calc_engineeringConstants(ABD, thickness)
+
+    rows = []
+    for k, record in enumerate(records):
+        row = {"id": record[0], "ABD": ABD[k].tolist()}
+        row.update((name, float(values[k])) for name, values in constants.items())
+        rows.append(row)
+
+    loaded = [k for k, record in enumerate(records) if record[5] is not None]
+    if loaded:
+        failure = evaluate_table_failure(
+            table.subset(loaded),
+            [records[k][5] for k in loaded],
+            criterion,
+        )
+        for k, reserveFactor, ply, mode in zip(loaded, *failure[:3]):
+            rows[k]["reserveFactor"] = float(reserveFactor)
+            rows[k]["criticalPly"] = int(ply)
+            rows[k]["criticalMode"] = failure.modes[mode]
+    return rows
+
+
+def read_records(file, input_format):
+    """Records of a CSV or JSONL file, read line by line.
+
+    :yield: fields of every record
+    :rtype: dict
+    """
+    if input_format == "csv":
+        yield from csv.DictReader(file)
+    else:
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RowWriter:
+    def __init__(self, file, output_format):
+        """Writer of output rows as CSV or JSONL."""
+        super().__init__()
+        self.file = file
+        self.output_format = output_format
+        if output_format == "csv":
+            self.writer = csv.DictWriter(
+                file,
+                ("id",) + ABD_FIELDS + CONSTANT_FIELDS + FAILURE_FIELDS,
+                lineterminator="\n",
+            )
+            self.writer.writeheader()
+
+    def write(self, rows):
+        for row in rows:
+            if self.output_format == "csv":
+                row = dict(row)
+                row.update(zip(ABD_FIELDS, np.ravel(row.pop("ABD"))))
+                self.writer.writerow(row)
+            else:
+                self.file.write(json.dumps(row) + "\n")
+        self.file.flush()
+
+
+def _chunks(iterable, chunk_size):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _format(path, chosen):
+    if chosen is not None:
+        return chosen
+    return "csv" if str(path).lower().endswith(".csv") else "jsonl"
+
+
+def _open(path, mode):
+    if path == "-":
+        return sys.stdin if "r" in mode else sys.stdout
+    return open(path, mode, newline="")
+
+
+def run(
+    materials,
+    input_path,
+    output_path="-",
+    input_format=None,
+    output_format=None,
+    chunk_size=10000,
+    workers=0,
+    criterion="tsai_wu",
+):
+    """Evaluate all laminates of an input file.
+
+    :param materials: material name to material
+    :type materials: dict
+    :param input_path: CSV or JSONL file, "-" for stdin
+    :type input_path: str
+    :param output_path: CSV or JSONL file, "-" for stdout, defaults to "-"
+    :type output_path: str, optional
+    :param input_format: "csv" or "jsonl", defaults to the file extension
+    :type input_format: str, optional
+    :param output_format: "csv" or "jsonl", defaults to the file extension
+    :type output_format: str, optional
+    :param chunk_size: laminates per chunk, defaults to 10000
+    :type chunk_size: int, optional
+    :param workers: number of processes, 0 evaluates in this process, \
+        None uses all processors, defaults to 0
+    :type workers: int, optional
+    :param criterion: failure criterion, defaults to "tsai_wu"
+    :type criterion: str, optional
+    :return: number of evaluated laminates
+    :rtype: int
+    """
+    input_file = _open(input_path, "r")
+    output_file = _open(output_path, "w")
+    try:
+        records = (
+            parse_record(record, number)
+            for number, record in enumerate(
+                read_records(input_file, _format(input_path, input_format)), 1
+            )
+        )
+        writer = RowWriter(output_file, _format(output_path, output_format))
+        # converted once, not pickled with every chunk
+        parameters = material_parameters(materials)
+        n_laminates = 0
+        for rows in iter_map(
+            evaluate_records,
+            ((chunk, parameters, criterion) for chunk in _chunks(records, chunk_size)),
+            workers,
+        ):
+            writer.write(rows)
+            n_laminates += len(rows)
+        return n_laminates
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+
+def main(args=None):
+    """Entry point of the console script ``clt-py``."""
+    parser = argparse.ArgumentParser(
+        prog="clt-py",
+        description="Evaluate ABD-matrices, engineering constants and reserve "
+        "factors of laminates from CSV or JSONL files.",
+    )
+    parser.add_argument("materials", help="JSON file of material definitions")
+    parser.add_argument("input", help="CSV or JSONL file of laminates, - for stdin")
+    parser.add_argument(
+        "-o", "--output", default="-", help="CSV or JSONL file, default stdout"
+    )
+    parser.add_argument("--input-format", choices=["csv", "jsonl"])
+    parser.add_argument("--output-format", choices=["csv", "jsonl"])
+    parser.add_argument(
+        "--chunk-size", type=int, default=10000, help="laminates per chunk"
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        default=0,
+        help="worker processes, 0 evaluates in this process",
+    )
+    parser.add_argument("--criterion", choices=sorted(CRITERIA), default="tsai_wu")
+    options = parser.parse_args(args)
+
+    try:
+        with open(options.materials) as file:
+            materials = build_materials(json.load(file))
+        run(
+            materials,
+            options.input,
+            options.output,
+            options.input_format,
+            options.output_format,
+            options.chunk_size,
+            options.workers,
+            options.criterion,
+        )
+    except ValueError as error:
+        parser.exit(1, "clt-py: error: {}\n".format(error))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,17 @@
 """Main module."""
 
-from math import sqrt, sin, cos, pi, atan
+from math import sin, cos
+import contextlib
+import hashlib
 import math
+import threading
+import uuid
+import weakref
 import numpy as np
 
+from . import micromechanics
+from .cache import LRUCache, ResultCache
+
 
 class NotEnoughArgumentError(Exception):
     """Exception raised when too few arguments where passed to function."""
@@ -18,6 +26,21 @@ class OverDeterminedError(Exception):
     pass
 
 
+def new_cacheKey():
+    """Unique key for a computed state of a material.
+
+    Random instead of counted, so the keys of pickled materials stay unique
+    in other processes.
+    """
+    return uuid.uuid4().int
+
+
+# rotation and stiffness matrices of plies per (material state, rotation)
+PLY_STIFFNESS_CACHE = LRUCache(maxsize=1024)
+# ABD-matrices and derived quantities of laminates per canonical hash
+LAMINATE_CACHE = ResultCache(maxsize=4096)
+
+
 class Material2D:
     class NotAnisotropicError(Exception):
         pass
@@ -25,7 +48,26 @@ class Material2D:
     class NotIsotropicError(Exception):
         pass
 
-    def __init__(self, rho, E_para, E_ortho, G, v_para_ortho, label="material"):
+    def __init__(
+        self,
+        rho,
+        E_para,
+        E_ortho,
+        G,
+        v_para_ortho,
+        label="material",
+        alpha=0.0,
+        beta=0.0,
+    ):
+        """Orthotropic material in plane stress.
+
+        :param alpha: thermal expansion coefficients parallel and orthogonal \
+            to the fibers, a single value for both, defaults to 0
+        :type alpha: {float, list}, optional
+        :param beta: moisture expansion coefficients parallel and orthogonal \
+            to the fibers, a single value for both, defaults to 0
+        :type beta: {float, list}, optional
+        """
         super().__init__()
         self.rho = rho
         self.label = label
@@ -33,13 +75,40 @@ class Material2D:
         self.E_ortho = E_ortho
         self.G = G
         self.v_para_ortho = v_para_ortho
+        self.alpha = calc_expansionVector(alpha)
+        self.beta = calc_expansionVector(beta)
+        self.strength = None
         self.calc_poissonRatio_ortho_pata()
         self.calc_stiffness_compliance_matrices()
 
+    def set_strength(self, R_para_t, R_para_c, R_ortho_t, R_ortho_c, R_shear):
+        """Strength allowables in material axes, all values positive.
+
+        :param R_para_t: tensile strength parallel to the fibers
+        :type R_para_t: float
+        :param R_para_c: compressive strength parallel to the fibers
+        :type R_para_c: float
+        :param R_ortho_t: tensile strength orthogonal to the fibers
+        :type R_ortho_t: float
+        :param R_ortho_c: compressive strength orthogonal to the fibers
+        :type R_ortho_c: float
+        :param R_shear: in-plane shear strength
+        :type R_shear: float
+        :raises ValueError: strength not positive
+        """
+        strength = np.array([R_para_t, R_para_c, R_ortho_t, R_ortho_c, R_shear], float)
+        if np.any(strength <= 0):
+            raise ValueError("strength allowables must be positive")
+        self.strength = strength
+
     def calc_poissonRatio_ortho_pata(self):
         self.v_ortho_para = self.v_para_ortho * self.E_ortho / self.E_para
 
     def calc_stiffness_compliance_matrices(self):
+        if hasattr(self, "cache_key"):
+            PLY_STIFFNESS_CACHE.invalidate(self.cache_key)
+        self.cache_key = new_cacheKey()
+
         s_para = 1 / self.E_para
         s_ortho = 1 / self.E_ortho
         s_para_ortho = -self.v_ortho_para / self.E_ortho
@@ -49,11 +118,22 @@ class Material2D:
         self.complianceMatrix = np.array(
             [[s_para, s_para_ortho, 0], [s_para_ortho, s_ortho, 0], [0, 0, s_shear]]
         )
-        self.stiffnessMatrix = np.linalg.inv(self.complianceMatrix)
+        # closed-form inverse of the orthotropic compliance matrix
+        denominator = 1 - self.v_para_ortho * self.v_ortho_para
+        q_para = self.E_para / denominator
+        q_ortho = self.E_ortho / denominator
+        q_para_ortho = self.v_para_ortho * self.E_ortho / denominator
+        self.stiffnessMatrix = np.array(
+            [[q_para, q_para_ortho, 0], [q_para_ortho, q_ortho, 0], [0, 0, self.G]]
+        )
+        self.stiffnessInvariants = calc_stiffnessInvariants(self.stiffnessMatrix)
+        self.complianceInvariants = calc_complianceInvariants(self.complianceMatrix)
 
 
 class IsotropicMaterial(Material2D):
-    def __init__(self, rho, E=None, G=None, v=None, label="material"):
+    def __init__(
+        self, rho, E=None, G=None, v=None, label="material", alpha=0.0, beta=0.0
+    ):
         if (G is not None) and (v is not None) and (E is not None):
             raise OverDeterminedError()
         elif (
@@ -68,14 +148,129 @@ class IsotropicMaterial(Material2D):
             E = 2 * G * (1 + v)
         elif v is None:
             v = E / (2 * G) - 1
-        super().__init__(rho=rho, E_para=E, E_ortho=E, G=G, v_para_ortho=v, label=label)
+        super().__init__(
+            rho=rho,
+            E_para=E,
+            E_ortho=E,
+            G=G,
+            v_para_ortho=v,
+            label=label,
+            alpha=alpha,
+            beta=beta,
+        )
 
 
 class AnisotropicMaterial(Material2D):
     pass
 
 
-GLOBAL_FRM_LIST = []
+class _ThreadLocalVar(threading.local):
+    """Minimal ``contextvars.ContextVar`` replacement for Python 3.6."""
+
+    def __init__(self, name, default=None):
+        super().__init__()
+        self.name = name
+        self.value = default
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        token = self.value
+        self.value = value
+        return token
+
+    def reset(self, token):
+        self.value = token
+
+
+try:
+    import contextvars
+
+    # micromechanics model of materials created in the current context
+    SYSTEM_CONTEXT = contextvars.ContextVar("clt_py_system", default=None)
+    # active (registry, scope) pairs of MaterialRegistry.scope, outermost first
+    SCOPE_CONTEXT = contextvars.ContextVar("clt_py_scopes", default=())
+except ImportError:  # pragma: no cover, Python 3.6
+    SYSTEM_CONTEXT = _ThreadLocalVar("clt_py_system")
+    SCOPE_CONTEXT = _ThreadLocalVar("clt_py_scopes", default=())
+
+
+class MaterialRegistry:
+    """Weakly referenced collection of materials.
+
+    Materials are removed automatically when they are garbage collected.
+    Scopes opened with ``scope()`` additionally collect all materials
+    registered while the scope is active. Scopes are local to the current
+    thread and ``contextvars`` context, like ``use_system``.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.materials = weakref.WeakSet()
+
+    def __iter__(self):
+        return iter(list(self.materials))
+
+    def __len__(self):
+        return len(self.materials)
+
+    @property
+    def scopes(self):
+        """Active scopes of this registry in the current context, outermost first."""
+        return [scope for registry, scope in SCOPE_CONTEXT.get() if registry is self]
+
+    def register(self, material):
+        self.materials.add(material)
+        for scope in self.scopes:
+            scope.register(material)
+
+    @contextlib.contextmanager
+    def scope(self):
+        """Context manager collecting the materials created inside of it.
+
+        :yield: registry of the scope
+        :rtype: MaterialRegistry
+        """
+        scope = MaterialRegistry()
+        token = SCOPE_CONTEXT.set(SCOPE_CONTEXT.get() + ((self, scope),))
+        try:
+            yield scope
+        finally:
+            SCOPE_CONTEXT.reset(token)
+
+    def current(self):
+        """Innermost active scope or the registry itself."""
+        scopes = self.scopes
+        if scopes:
+            return scopes[-1]
+        return self
+
+
+GLOBAL_FRM_REGISTRY = MaterialRegistry()
+
+
+class _SystemDependent:
+    """Attribute of a FiberReinforcedMaterialUD depending on its micromechanics model.
+
+    Reading the attribute recomputes the material first, if its model changed
+    since the last computation.
+    """
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        instance.update_if_stale()
+        try:
+            return instance.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
 
 
 class FiberReinforcedMaterialUD(Material2D):
@@ -83,6 +278,18 @@ class FiberReinforcedMaterialUD(Material2D):
     system = "hsb"  # "prismatic_jones" or "hsb"
     possible_systems = ["prismatic_jones", "hsb"]
 
+    rho = _SystemDependent()
+    E_para = _SystemDependent()
+    E_ortho = _SystemDependent()
+    G = _SystemDependent()
+    v_para_ortho = _SystemDependent()
+    v_ortho_para = _SystemDependent()
+    complianceMatrix = _SystemDependent()
+    stiffnessMatrix = _SystemDependent()
+    stiffnessInvariants = _SystemDependent()
+    complianceInvariants = _SystemDependent()
+    cache_key = _SystemDependent()
+
     def __init__(
         self,
         matFib,
@@ -90,6 +297,7 @@ class FiberReinforcedMaterialUD(Material2D):
         fibVolRatio=0.5,
         kapa=[1.0, 1.0, 1.0],
         label="FRM_material",
+        system=None,
     ):
         """Fiber Reinforced Material containing of isotropic matrix and anisotropic fiber.
 
@@ -107,18 +315,27 @@ class FiberReinforcedMaterialUD(Material2D):
         :type kapa: list, optional
         :param label: description of material, defaults to "FRM_material"
         :type label: str, optional
+        :param system: micromechanics model of this material only, defaults \
+            to the model of the active ``use_system`` context or, outside of \
+            it, to the class-wide ``FiberReinforcedMaterialUD.system``
+        :type system: str, optional
         :raises ValueError: Not defined value for this input
         :raises Material2D.NotAnisotropicError: AnisotropicMaterial required
         :raises Material2D.NotIsotropicError: IsotropicMaterial required
         """
-        GLOBAL_FRM_LIST.append(self)
+        if system is None:
+            system = SYSTEM_CONTEXT.get()
+        if system is not None:
+            self.check_system(system)
+            self.system = system
+        GLOBAL_FRM_REGISTRY.register(self)
         self.check_matFib(matFib)
         self.matFib = matFib
         self.check_matMat(matMat)
         self.matMat = matMat
         self.fibVolRatio = fibVolRatio
         self.kapa = kapa
-        self.update()
+        self.calc_elasticProperties()
         super().__init__(
             rho=self.rho,
             E_para=self.E_para,
@@ -126,15 +343,79 @@ class FiberReinforcedMaterialUD(Material2D):
             G=self.G,
             v_para_ortho=self.v_para_ortho,
             label=label,
+            alpha=self.alpha[:2],
+            beta=self.beta[:2],
         )
 
     @classmethod
-    def set_system(cls, system):
+    def set_system(cls, system, scope=None):
+        """Set the micromechanics model.
+
+        Outside of a ``GLOBAL_FRM_REGISTRY`` scope and without ``scope`` the
+        class-wide default is changed. Materials following the default are
+        recomputed lazily on their next access, materials with an own model
+        are not affected. Otherwise the model is set per material for the
+        materials of the scope only.
+
+        :param system: "prismatic_jones" or "hsb"
+        :type system: str
+        :param scope: materials to update, defaults to the innermost active \
+            scope of ``GLOBAL_FRM_REGISTRY``
+        :type scope: {MaterialRegistry, list}, optional
+        :raises ValueError: Not defined system
+        """
+        cls.check_system(system)
+        if scope is None:
+            scope = GLOBAL_FRM_REGISTRY.current()
+            if scope is GLOBAL_FRM_REGISTRY:
+                cls.system = system
+                return
+        for elem in scope:
+            elem.set_instanceSystem(system)
+
+    @classmethod
+    @contextlib.contextmanager
+    def use_system(cls, system):
+        """Context manager selecting the model of materials created inside of it.
+
+        The selection is local to the current thread and ``contextvars``
+        context, so different models can be used concurrently.
+
+        :param system: "prismatic_jones" or "hsb"
+        :type system: str
+        :raises ValueError: Not defined system
+        """
+        cls.check_system(system)
+        token = SYSTEM_CONTEXT.set(system)
+        try:
+            yield
+        finally:
+            SYSTEM_CONTEXT.reset(token)
+
+    @classmethod
+    def check_system(cls, system):
         if system not in cls.possible_systems:
-            raise ValueError("'{system}'-system is not implemented")
-        cls.system = system
-        for elem in GLOBAL_FRM_LIST:
-            elem.update()
+            raise ValueError(f"'{system}'-system is not implemented")
+
+    def set_instanceSystem(self, system):
+        """Set the micromechanics model of this material only.
+
+        :param system: "prismatic_jones", "hsb" or None to follow the \
+            class-wide default again
+        :type system: str
+        :raises ValueError: Not defined system
+        """
+        if system is None:
+            self.__dict__.pop("system", None)
+        else:
+            self.check_system(system)
+            self.system = system
+        self.update_if_stale()
+
+    def update_if_stale(self):
+        """Recompute the material, if its model changed since the last computation."""
+        if self.__dict__.get("computed_system") != self.system:
+            self.update()
 
     def set_fibWgRatio(self, fibWgRatio):
         self.fibVolRatio = (fibWgRatio * self.matMat.rho) / (
@@ -175,80 +456,259 @@ class FiberReinforcedMaterialUD(Material2D):
             raise Material2D.NotIsotropicError()
 
     def update(self):
+        self.calc_elasticProperties()
+        self.calc_stiffness_compliance_matrices()
+
+    def calc_elasticProperties(self):
+        self.computed_system = self.system
         if self.system == self.possible_systems[0]:
             self.prismatic_jones_model()
         elif self.system == self.possible_systems[1]:
             self.hsb_model()
-        self.calc_stiffness_compliance_matrices()
+        self.calc_expansionCoefficients()
+
+    def calc_expansionCoefficients(self):
+        """Thermal and moisture expansion by the model of Schapery."""
+        for name in ("alpha", "beta"):
+            expansion = micromechanics.schapery_model(
+                self.fibVolRatio,
+                self.matFib,
+                self.matMat,
+                getattr(self.matFib, name)[:2],
+                getattr(self.matMat, name)[:2],
+            )
+            setattr(self, name, calc_expansionVector(expansion))
 
     def prismatic_jones_model(self):
-        self.E_para = self.matFib.E_para * self.fibVolRatio + self.matMat.E_para * (
-            1 - self.fibVolRatio
-        )
-        self.E_ortho = (self.matFib.E_ortho * self.matMat.E_para) / (
-            self.matMat.E_para * self.fibVolRatio
-            + self.matFib.E_ortho * (1 - self.fibVolRatio)
-        )
-        self.G = (self.matFib.G * self.matMat.G) / (
-            self.matMat.G * self.fibVolRatio + self.matFib.G * (1 - self.fibVolRatio)
-        )
-        self.v_para_ortho = (
-            self.fibVolRatio * self.matFib.v_para_ortho
-            + (1 - self.fibVolRatio) * self.matMat.v_para_ortho
+        self.set_properties(
+            micromechanics.prismatic_jones_model(
+                self.fibVolRatio, self.matFib, self.matMat
+            )
         )
-        self.calc_poissonRatio_ortho_pata()
-        self.calc_density()
 
     def hsb_model(self):
-        # helping variables
-        v = sqrt(self.fibVolRatio / pi)
-        e = 1 - self.matMat.E_para / self.matFib.E_ortho
-        g = 1 - self.matMat.G / self.matFib.G
-        q_G = (1 + 2 * g * v) / (1 - 2 * g * v)
-        q_E = (1 + 2 * e * v) / (1 - 2 * e * v)
-
-        self.E_para = self.kapa[0] * (
-            self.matFib.E_para * self.fibVolRatio
-            + self.matMat.E_para * (1 - self.fibVolRatio)
-        )
-        self.E_ortho = (
-            self.kapa[1]
-            * self.matMat.E_para
-            * (
-                1
-                - 2 * v
-                - pi / (2 * e)
-                + ((2 * atan(sqrt(q_E))) / (e * sqrt(1 - math.pow(2 * e * v, 2))))
-            )
-        )
-        self.G = (
-            self.kapa[2]
-            * self.matMat.G
-            * (
-                1
-                - 2 * v
-                - pi / (2 * g)
-                + ((2 * atan(sqrt(q_G))) / (g * sqrt(1 - math.pow(2 * g * v, 2))))
+        self.set_properties(
+            micromechanics.hsb_model(
+                self.fibVolRatio, self.matFib, self.matMat, self.kapa
             )
         )
-        self.v_para_ortho = (
-            self.matFib.v_para_ortho * self.fibVolRatio
-            + self.matMat.v_para_ortho * (1 - self.fibVolRatio)
-        )
+
+    def set_properties(self, properties):
+        self.E_para = properties.E_para
+        self.E_ortho = properties.E_ortho
+        self.G = properties.G
+        self.v_para_ortho = properties.v_para_ortho
         self.calc_poissonRatio_ortho_pata()
         self.calc_density()
 
     def calc_density(self):
-        self.rho = (
-            self.fibVolRatio
-            + self.matMat.rho / self.matFib.rho * (1 - self.fibVolRatio)
-        ) * self.matFib.rho
+        self.rho = micromechanics.calc_density(
+            self.fibVolRatio, self.matFib, self.matMat
+        )
+
+
+def calc_expansionVector(expansion):
+    """Expansion coefficients in material axes as strain vector (para, ortho, 0).
+
+    :param expansion: coefficients parallel and orthogonal to the fibers, \
+        a single value for both
+    :type expansion: {float, list}
+    :rtype: numpy.ndarray, shape (3,)
+    """
+    para, ortho = np.broadcast_to(np.asarray(expansion, dtype=float), (2,))
+    return np.array([para, ortho, 0.0])
+
+
+def _stack_matrix(rows):
+    """Arrange nested rows of scalars or equally shaped arrays to (..., n, m)."""
+    matrix = np.array(rows, dtype=float)
+    if matrix.ndim == 2:
+        return matrix
+    return np.moveaxis(matrix, (0, 1), (-2, -1))
+
+
+def _cos_sin(rotRad):
+    """Cosine and sine, with python floats for scalar angles."""
+    if isinstance(rotRad, (int, float)):
+        return cos(rotRad), sin(rotRad)
+    return np.cos(rotRad), np.sin(rotRad)
+
+
+def _split_invariants(invariants):
+    invariants = np.asarray(invariants, dtype=float)
+    if invariants.ndim == 1:
+        return invariants.tolist()
+    return np.moveaxis(invariants, -1, 0)
+
+
+def calc_rotationStressMatrix(rotRad):
+    """Stress transformation matrix for rotations in radian.
+
+    :param rotRad: rotation angle(s) in radian
+    :type rotRad: {float, numpy.ndarray}
+    :return: transformation matrix, shape (..., 3, 3)
+    :rtype: numpy.ndarray
+    """
+    c, s = _cos_sin(rotRad)
+    return _stack_matrix(
+        [
+            [c**2, s**2, 2 * s * c],
+            [s**2, c**2, -2 * s * c],
+            [-s * c, s * c, c**2 - s**2],
+        ]
+    )
+
+
+def calc_rotationElongationMatrix(rotRad):
+    """Elongation (strain) transformation matrix for rotations in radian.
+
+    :param rotRad: rotation angle(s) in radian
+    :type rotRad: {float, numpy.ndarray}
+    :return: transformation matrix, shape (..., 3, 3)
+    :rtype: numpy.ndarray
+    """
+    c, s = _cos_sin(rotRad)
+    return _stack_matrix(
+        [
+            [c**2, s**2, s * c],
+            [s**2, c**2, -s * c],
+            [-2 * s * c, 2 * s * c, c**2 - s**2],
+        ]
+    )
+
+
+def _stack_vector(components):
+    """Arrange scalars or equally shaped arrays to (..., n)."""
+    vector = np.array(components, dtype=float)
+    if vector.ndim == 1:
+        return vector
+    return np.moveaxis(vector, 0, -1)
+
+
+def _orthotropic_components(matrix):
+    """Entries 11, 12, 22 and 66 of orthotropic matrices, shape (..., 3, 3)."""
+    matrix = np.asarray(matrix, dtype=float)
+    if matrix.ndim == 2:
+        rows = matrix.tolist()
+        return rows[0][0], rows[0][1], rows[1][1], rows[2][2]
+    return matrix[..., 0, 0], matrix[..., 0, 1], matrix[..., 1, 1], matrix[..., 2, 2]
+
+
+def calc_stiffnessInvariants(stiffnessMatrix):
+    """Tsai-Pagano invariants U1 to U5 of orthotropic stiffness matrices.
+
+    :param stiffnessMatrix: stiffness matrices, shape (..., 3, 3)
+    :type stiffnessMatrix: numpy.ndarray
+    :return: invariants, shape (..., 5)
+    :rtype: numpy.ndarray
+    """
+    Q11, Q12, Q22, Q66 = _orthotropic_components(stiffnessMatrix)
+    return _stack_vector(
+        [
+            (3 * Q11 + 3 * Q22 + 2 * Q12 + 4 * Q66) / 8,
+            (Q11 - Q22) / 2,
+            (Q11 + Q22 - 2 * Q12 - 4 * Q66) / 8,
+            (Q11 + Q22 + 6 * Q12 - 4 * Q66) / 8,
+            (Q11 + Q22 - 2 * Q12 + 4 * Q66) / 8,
+        ]
+    )
+
+
+def calc_complianceInvariants(complianceMatrix):
+    """Invariants of orthotropic compliance matrices, analog to U1 to U5.
+
+    :param complianceMatrix: compliance matrices, shape (..., 3, 3)
+    :type complianceMatrix: numpy.ndarray
+    :return: invariants, shape (..., 5)
+    :rtype: numpy.ndarray
+    """
+    S11, S12, S22, S66 = _orthotropic_components(complianceMatrix)
+    return _stack_vector(
+        [
+            (3 * S11 + 3 * S22 + 2 * S12 + S66) / 8,
+            (S11 - S22) / 2,
+            (S11 + S22 - 2 * S12 - S66) / 8,
+            (S11 + S22 + 6 * S12 - S66) / 8,
+            (S11 + S22 - 2 * S12 + S66) / 2,
+        ]
+    )
+
+
+def calc_rotated_stiffnessMatrix(stiffnessInvariants, rotRad):
+    """Stiffness matrices of rotated plies from the Tsai-Pagano invariants.
+
+    Closed form of ``rotStress * stiffnessMatrix * inv(rotElongation)``.
+
+    :param stiffnessInvariants: invariants U1 to U5, shape (..., 5)
+    :type stiffnessInvariants: numpy.ndarray
+    :param rotRad: rotation angle(s) in radian, broadcastable to (...)
+    :type rotRad: {float, numpy.ndarray}
+    :return: stiffness matrices, shape (..., 3, 3)
+    :rtype: numpy.ndarray
+    """
+    return _stack_matrix(
+        _rotated_stiffnessRows(
+            _split_invariants(stiffnessInvariants), *_double_angles(rotRad)
+        )
+    )
+
+
+def _double_angles(rotRad):
+    """Cosine and sine of 2 and 4 times the rotation, signs of this module."""
+    c2, s2 = _cos_sin(2 * rotRad)
+    c4, s4 = _cos_sin(4 * rotRad)
+    # the rotation matrices of this module rotate in negative direction
+    return c2, -s2, c4, -s4
+
+
+def _rotated_stiffnessRows(invariants, c2, s2, c4, s4):
+    U1, U2, U3, U4, U5 = invariants
+    Q11 = U1 + U2 * c2 + U3 * c4
+    Q22 = U1 - U2 * c2 + U3 * c4
+    Q12 = U4 - U3 * c4
+    Q66 = U5 - U3 * c4
+    Q16 = U2 / 2 * s2 + U3 * s4
+    Q26 = U2 / 2 * s2 - U3 * s4
+    return [[Q11, Q12, Q16], [Q12, Q22, Q26], [Q16, Q26, Q66]]
+
+
+def _rotated_complianceRows(invariants, c2, s2, c4, s4):
+    W1, W2, W3, W4, W5 = invariants
+    S11 = W1 + W2 * c2 + W3 * c4
+    S22 = W1 - W2 * c2 + W3 * c4
+    S12 = W4 - W3 * c4
+    S66 = W5 - 4 * W3 * c4
+    S16 = W2 * s2 + 2 * W3 * s4
+    S26 = W2 * s2 - 2 * W3 * s4
+    return [[S11, S12, S16], [S12, S22, S26], [S16, S26, S66]]
+
+
+def calc_rotated_complianceMatrix(complianceInvariants, rotRad):
+    """Compliance matrices of rotated plies from the compliance invariants.
+
+    Closed form of ``rotElongation * complianceMatrix * inv(rotStress)``.
+
+    :param complianceInvariants: invariants, shape (..., 5)
+    :type complianceInvariants: numpy.ndarray
+    :param rotRad: rotation angle(s) in radian, broadcastable to (...)
+    :type rotRad: {float, numpy.ndarray}
+    :return: compliance matrices, shape (..., 3, 3)
+    :rtype: numpy.ndarray
+    """
+    return _stack_matrix(
+        _rotated_complianceRows(
+            _split_invariants(complianceInvariants), *_double_angles(rotRad)
+        )
+    )
 
 
 class Ply:
     def __init__(self, material, thickness=1.0, rotation=0.0):
         """Ply for building Laminates.
 
+        The matrices ``Q``, ``S``, ``rotStress`` and ``rotElongation`` are
+        shared with other plies and read-only, assign a copy to change them.
+
         :param reinforcedMat: Material for ply (reinforced, isotropic)
         :type reinforcedMat: {FiberReinforcedMaterialUD, IsotropicMaterial}
         :param thickness: Thickness of layer/ply in mm, defaults to 1
@@ -262,18 +722,77 @@ class Ply:
         self.mat = material
         self.thickness = thickness
         self.rotRad = math.radians(rotation)
+        self.laminates = weakref.WeakSet()
         self.update()
 
     def set_rotation(self, rotation):
         self.rotRad = math.radians(rotation)
         self.update()
 
+    def set_thickness(self, thickness):
+        self.thickness = thickness
+        for laminate in list(self.laminates):
+            laminate.ply_thickness_changed(self)
+
     def update(self):
-        self.calc_rotationElongationMatrix()
-        self.calc_rotationStressMatrix()
-        self.calc_stiffnessMatrix()
-        self.calc_complianceMatrix()
+        """Recalculate the ply matrices and notify the containing laminates.
+
+        Rotation, stiffness and compliance matrices and the expansion
+        coefficients are shared through ``PLY_STIFFNESS_CACHE`` between plies
+        of the same material state and rotation and are therefore read-only.
+        """
+        key = (self.mat.cache_key, self.rotRad)
+        matrices = PLY_STIFFNESS_CACHE.get(key)
+        if matrices is None:
+            matrices = self.calc_matrices()
+            PLY_STIFFNESS_CACHE.put(key, matrices, tag=key[0])
+        (
+            self.rotElongation,
+            self.rotStress,
+            self.Q,
+            self.S,
+            self.alpha,
+            self.beta,
+        ) = matrices
         self.calc_engineer_constantes()
+        if self.laminates:
+            for laminate in list(self.laminates):
+                laminate.ply_stiffness_changed(self)
+
+    def calc_matrices(self):
+        """Rotation, stiffness and compliance matrices and expansion coefficients.
+
+        Evaluated from python floats with one sine and cosine per angle and
+        stored as read-only views of a single array, which avoids the
+        overhead of creating every small array separately.
+
+        :return: rotElongation, rotStress, Q, S, alpha and beta
+        :rtype: tuple of numpy.ndarray
+        """
+        mat = self.mat
+        c, s = _cos_sin(self.rotRad)
+        cc, ss, sc = c * c, s * s, s * c
+        # double angles from c and s, negative rotation as in _double_angles
+        c2, s2 = cc - ss, -2 * sc
+        c4, s4 = c2 * c2 - s2 * s2, 2 * s2 * c2
+        a1, a2 = mat.alpha.tolist()[:2]
+        b1, b2 = mat.beta.tolist()[:2]
+        rows = [
+            [cc, ss, sc],
+            [ss, cc, -sc],
+            [-2 * sc, 2 * sc, c2],
+            [cc, ss, 2 * sc],
+            [ss, cc, -2 * sc],
+            [-sc, sc, c2],
+            *_rotated_stiffnessRows(mat.stiffnessInvariants.tolist(), c2, s2, c4, s4),
+            *_rotated_complianceRows(mat.complianceInvariants.tolist(), c2, s2, c4, s4),
+            [cc * a1 + ss * a2, ss * a1 + cc * a2, 2 * sc * (a2 - a1)],
+            [cc * b1 + ss * b2, ss * b1 + cc * b2, 2 * sc * (b2 - b1)],
+        ]
+        buffer = np.array(rows, dtype=float)
+        buffer.setflags(write=False)
+        matrices = buffer[:12].reshape(4, 3, 3)
+        return (*matrices, buffer[12], buffer[13])
 
     def check_materialType(self, material):
         if isinstance(material, FiberReinforcedMaterialUD):
@@ -286,58 +805,23 @@ class Ply:
             )
 
     def calc_rotationStressMatrix(self):
-        self.rotStress = np.array(
-            [
-                [
-                    (cos(self.rotRad)) ** 2,
-                    (sin(self.rotRad)) ** 2,
-                    2 * sin(self.rotRad) * cos(self.rotRad),
-                ],
-                [
-                    (sin(self.rotRad)) ** 2,
-                    (cos(self.rotRad)) ** 2,
-                    -2 * sin(self.rotRad) * cos(self.rotRad),
-                ],
-                [
-                    -sin(self.rotRad) * cos(self.rotRad),
-                    sin(self.rotRad) * cos(self.rotRad),
-                    (cos(self.rotRad)) ** 2 - (sin(self.rotRad)) ** 2,
-                ],
-            ]
-        )
+        self.rotStress = calc_rotationStressMatrix(self.rotRad)
 
     def calc_rotationElongationMatrix(self):
-        self.rotElongation = np.array(
-            [
-                [
-                    (cos(self.rotRad)) ** 2,
-                    (sin(self.rotRad)) ** 2,
-                    sin(self.rotRad) * cos(self.rotRad),
-                ],
-                [
-                    (sin(self.rotRad)) ** 2,
-                    (cos(self.rotRad)) ** 2,
-                    -sin(self.rotRad) * cos(self.rotRad),
-                ],
-                [
-                    -2 * sin(self.rotRad) * cos(self.rotRad),
-                    2 * sin(self.rotRad) * cos(self.rotRad),
-                    (cos(self.rotRad)) ** 2 - (sin(self.rotRad)) ** 2,
-                ],
-            ]
-        )
+        self.rotElongation = calc_rotationElongationMatrix(self.rotRad)
 
     def calc_complianceMatrix(self):
-        self.S = np.matmul(
-            self.rotElongation,
-            np.matmul(self.mat.complianceMatrix, np.linalg.inv(self.rotStress)),
+        self.S = calc_rotated_complianceMatrix(
+            self.mat.complianceInvariants, self.rotRad
         )
 
     def calc_stiffnessMatrix(self):
-        self.Q = np.matmul(
-            self.rotStress,
-            np.matmul(self.mat.stiffnessMatrix, np.linalg.inv(self.rotElongation)),
-        )
+        self.Q = calc_rotated_stiffnessMatrix(self.mat.stiffnessInvariants, self.rotRad)
+
+    def calc_expansionCoefficients(self):
+        """Thermal and moisture expansion coefficients in laminate axes."""
+        self.alpha = self.rotElongation @ self.mat.alpha
+        self.beta = self.rotElongation @ self.mat.beta
 
     def calc_engineer_constantes(self):
         self.E_1 = 1 / self.S[0, 0]
@@ -346,42 +830,293 @@ class Ply:
         self.v_12 = -self.E_1 * self.S[0, 1]
 
 
+def calc_ABD_matrix(Q, z_position):
+    """Complete stiffness matrix (ABD-matrix) of a stack of plies.
+
+    The plies are reduced in a single batched sum over the z-position
+    differences, leading dimensions are treated as independent stacks.
+
+    :param Q: stiffness matrices of the plies, shape (..., n_plies, 3, 3)
+    :type Q: numpy.ndarray
+    :param z_position: ply boundaries from bottom to top, shape (..., n_plies + 1)
+    :type z_position: numpy.ndarray
+    :return: ABD-matrix, shape (..., 6, 6)
+    :rtype: numpy.ndarray
+    """
+    Q = np.asarray(Q, dtype=float)
+    z = np.asarray(z_position, dtype=float)
+    z_bot = z[..., :-1]
+    z_top = z[..., 1:]
+
+    # A matrix: extensional stiffnesses
+    A = np.einsum("...k,...kij->...ij", z_top - z_bot, Q)
+    # B matrix: bending-extension coupling stiffnesses
+    B = -0.5 * np.einsum("...k,...kij->...ij", z_top**2 - z_bot**2, Q)
+    # D matrix: bending stiffnesses
+    D = 1 / 3 * np.einsum("...k,...kij->...ij", z_top**3 - z_bot**3, Q)
+
+    return _block_ABD(A, B, D)
+
+
+def calc_hygrothermalResultants(Q, expansion, z_position):
+    """Force and moment resultants of a unit temperature or moisture change.
+
+    The resultants are linear in the change, a change ``delta`` causes
+    ``delta`` times the unit resultants. The sign convention equals the one
+    of ``calc_ABD_matrix``.
+
+    :param Q: stiffness matrices of the plies, shape (..., n_plies, 3, 3)
+    :type Q: numpy.ndarray
+    :param expansion: expansion coefficients of the plies in laminate axes, \
+        shape (..., n_plies, 3)
+    :type expansion: numpy.ndarray
+    :param z_position: ply boundaries from bottom to top, shape (..., n_plies + 1)
+    :type z_position: numpy.ndarray
+    :return: resultants N_x, N_y, N_xy, M_x, M_y and M_xy, shape (..., 6)
+    :rtype: numpy.ndarray
+    """
+    z = np.asarray(z_position, dtype=float)
+    z_bot = z[..., :-1]
+    z_top = z[..., 1:]
+    stresses = np.einsum("...kij,...kj->...ki", Q, expansion)
+    N = np.einsum("...k,...ki->...i", z_top - z_bot, stresses)
+    M = -0.5 * np.einsum("...k,...ki->...i", z_top**2 - z_bot**2, stresses)
+    return np.concatenate([N, M], axis=-1)
+
+
+def _block_ABD(A, B, D):
+    return np.concatenate(
+        [np.concatenate([A, B], axis=-1), np.concatenate([B, D], axis=-1)], axis=-2
+    )
+
+
+def calc_laminationParameters(rotRad, z_position):
+    """Lamination parameters of stacks of plies.
+
+    The parameters are related to the mid-plane of each stack and thickness
+    weighted sums of cos(2*rotRad), sin(2*rotRad), cos(4*rotRad) and
+    sin(4*rotRad) of the plies.
+
+    :param rotRad: ply rotations in radian, shape (..., n_plies)
+    :type rotRad: numpy.ndarray
+    :param z_position: ply boundaries from bottom to top, shape (..., n_plies + 1)
+    :type z_position: numpy.ndarray
+    :return: lamination parameters, shape (..., 3, 4). Rows for A, B and D, \
+        columns for cos(2*rotRad), sin(2*rotRad), cos(4*rotRad) and sin(4*rotRad)
+    :rtype: numpy.ndarray
+    """
+    rotRad = np.asarray(rotRad, dtype=float)
+    z = np.asarray(z_position, dtype=float)
+    h = (z[..., -1] - z[..., 0])[..., np.newaxis]
+    z = z - (z[..., -1:] + z[..., :1]) / 2
+    z_bot = z[..., :-1]
+    z_top = z[..., 1:]
+
+    weights = np.stack(
+        [
+            (z_top - z_bot) / h,
+            2 * (z_top**2 - z_bot**2) / h**2,
+            4 * (z_top**3 - z_bot**3) / h**3,
+        ],
+        axis=-2,
+    )
+    trigonometric = np.stack(
+        [
+            np.cos(2 * rotRad),
+            np.sin(2 * rotRad),
+            np.cos(4 * rotRad),
+            np.sin(4 * rotRad),
+        ],
+        axis=-1,
+    )
+    return np.matmul(weights, trigonometric)
+
+
+def calc_laminationParameter_matrices(stiffnessInvariants):
+    """Constant and angle dependent parts of the ply stiffness matrix.
+
+    ``Q(rotRad) = M0 + cos(2*rotRad)*M1 + sin(2*rotRad)*M2 + cos(4*rotRad)*M3 \
+    + sin(4*rotRad)*M4``
+
+    :param stiffnessInvariants: invariants U1 to U5, shape (..., 5)
+    :type stiffnessInvariants: numpy.ndarray
+    :return: matrices M0 to M4, shape (..., 5, 3, 3)
+    :rtype: numpy.ndarray
+    """
+    U = np.asarray(stiffnessInvariants, dtype=float)
+    U1, U2, U3, U4, U5 = np.moveaxis(U, -1, 0)
+    zero = np.zeros_like(U1)
+    # the rotation matrices of this module rotate in negative direction, the
+    # sine terms change sign
+    M = [
+        [[U1, U4, zero], [U4, U1, zero], [zero, zero, U5]],
+        [[U2, zero, zero], [zero, -U2, zero], [zero, zero, zero]],
+        [[zero, zero, -U2 / 2], [zero, zero, -U2 / 2], [-U2 / 2, -U2 / 2, zero]],
+        [[U3, -U3, zero], [-U3, U3, zero], [zero, zero, -U3]],
+        [[zero, zero, -U3], [zero, zero, U3], [-U3, U3, zero]],
+    ]
+    return np.moveaxis(np.array(M, dtype=float), (0, 1, 2), (-3, -2, -1))
+
+
+def calc_ABD_from_laminationParameters(
+    stiffnessInvariants, thickness, laminationParameters, offset=0.0
+):
+    """Complete stiffness matrix (ABD-matrix) of single-material laminates.
+
+    No plies are needed, the ABD-matrix is a linear combination of the
+    matrices of ``calc_laminationParameter_matrices``.
+
+    :param stiffnessInvariants: invariants U1 to U5 of the material, shape (..., 5)
+    :type stiffnessInvariants: numpy.ndarray
+    :param thickness: total thickness of the laminates, shape (...)
+    :type thickness: {float, numpy.ndarray}
+    :param laminationParameters: lamination parameters, shape (..., 3, 4)
+    :type laminationParameters: numpy.ndarray
+    :param offset: z-position of the laminate mid-plane in relation to the \
+        reference plane, defaults to 0
+    :type offset: {float, numpy.ndarray}, optional
+    :return: ABD-matrices, shape (..., 6, 6)
+    :rtype: numpy.ndarray
+    """
+    M = calc_laminationParameter_matrices(stiffnessInvariants)
+    xi = np.asarray(laminationParameters, dtype=float)
+    h = np.asarray(thickness, dtype=float)[..., np.newaxis, np.newaxis]
+    e = np.asarray(offset, dtype=float)[..., np.newaxis, np.newaxis]
+
+    A = h * (
+        M[..., 0, :, :]
+        + np.einsum("...i,...ijk->...jk", xi[..., 0, :], M[..., 1:, :, :])
+    )
+    B = h**2 / 4 * np.einsum("...i,...ijk->...jk", xi[..., 1, :], M[..., 1:, :, :])
+    D = (
+        h**3
+        / 12
+        * (
+            M[..., 0, :, :]
+            + np.einsum("...i,...ijk->...jk", xi[..., 2, :], M[..., 1:, :, :])
+        )
+    )
+
+    # parallel axis theorem for a reference plane outside of the mid-plane
+    D = D + 2 * e * B + e**2 * A
+    B = B + e * A
+    return _block_ABD(A, -B, D)
+
+
+EFFECTIVE_CONSTANTS = ("E_x", "E_y", "G_xy", "v_xy")
+
+
+def calc_effectiveConstants(complianceMatrix, thickness):
+    """Effective membrane and flexural engineering constants of laminates.
+
+    The constants follow from the compliance matrix (inverse ABD-matrix),
+    the laminate is free to bend under membrane loads and free to stretch
+    under moments.
+
+    :param complianceMatrix: inverse ABD-matrices, shape (..., 6, 6)
+    :type complianceMatrix: numpy.ndarray
+    :param thickness: total thickness of the laminates, shape (...)
+    :type thickness: {float, numpy.ndarray}
+    :return: rows membrane and flexural constants, columns E_x, E_y, G_xy \
+        and v_xy, shape (..., 2, 4)
+    :rtype: numpy.ndarray
+    """
+    abd = np.asarray(complianceMatrix, dtype=float)
+    h = np.asarray(thickness, dtype=float)[..., np.newaxis, np.newaxis]
+    blocks = np.stack([abd[..., :3, :3], abd[..., 3:, 3:]], axis=-3)
+    diagonal = np.diagonal(blocks, axis1=-2, axis2=-1)
+    scale = np.concatenate([h, h**3 / 12], axis=-2)
+    return np.concatenate(
+        [
+            1 / (scale * diagonal),
+            (-blocks[..., 0, 1] / blocks[..., 0, 0])[..., np.newaxis],
+        ],
+        axis=-1,
+    )
+
+
 class Laminate:
-    def __init__(self, symetric=False):
+    def __init__(self, symetric=False, lazy=False):
+        """Laminate of stacked plies.
+
+        :param symetric: mirror the stack at the middle plane, defaults to False
+        :type symetric: bool, optional
+        :param lazy: only mark the laminate as changed when plies are added \
+            and recompute on the next ``get_*`` call, defaults to False
+        :type lazy: bool, optional
+        """
         super().__init__()
         self.symetric = symetric
+        self.lazy = lazy
         self.stack = []
         self.stack2 = []
         self.core = False
         self.move_reference_plane = True
+        self.reset_results()
         self.update()
 
     def addPly(self, ply):
-        if isinstance(ply, Ply):
-            if not self.core:
-                self.stack.append(ply)
-            else:
-                self.stack2.append(ply)
+        self.appendPly(ply)
+        self.changed()
+
+    def addPlies(self, plies):
+        """Add multiple plies with a single recomputation of the laminate.
+
+        :param plies: plies from bottom to top
+        :type plies: iterable of Ply
+        """
+        plies = list(plies)
+        for ply in plies:
+            self.check_plyType(ply)
+        for ply in plies:
+            self.appendPly(ply)
+        self.changed()
+
+    def appendPly(self, ply):
+        self.check_plyType(ply)
+        if not self.core:
+            self.stack.append(ply)
         else:
+            self.stack2.append(ply)
+        ply.laminates.add(self)
+
+    def check_plyType(self, ply):
+        if not isinstance(ply, Ply):
             raise TypeError()
-        self.update()
 
     def addCore(self, ply):
         if isinstance(ply, Ply):
             self.corePly = ply
         else:
             raise TypeError()
+        ply.laminates.add(self)
         self.core = True
-        self.update()
+        self.changed()
+
+    def changed(self):
+        self.dirty = True
+        if not self.lazy:
+            self.update()
 
     def update(self):
+        self.reset_results()
         self.create_finalStack()
         self.calc_z_positions()
         self.calc_completeStiffnessmatrix()
+        self.dirty = False
+
+    def update_if_dirty(self):
+        if self.dirty:
+            self.update()
 
     def set_move_reference_plane(self, boolean):
         self.move_reference_plane = boolean
-        self.update()
+        self.changed()
+
+    def set_lazy(self, boolean):
+        self.lazy = boolean
+        if not self.lazy:
+            self.update_if_dirty()
 
     def create_finalStack(self):
         if self.core and self.symetric:
@@ -392,8 +1127,12 @@ class Laminate:
             self.finalStack = self.stack + [self.corePly] + self.stack2
         else:
             self.finalStack = self.stack
+        self.ply_indices = {}
+        for k_ply, ply in enumerate(self.finalStack):
+            self.ply_indices.setdefault(id(ply), []).append(k_ply)
 
     def get_finalStack(self):
+        self.update_if_dirty()
         return self.finalStack
 
     def calc_z_positions(self):
@@ -407,47 +1146,261 @@ class Laminate:
             self.z_position = z
 
     def get_z_positions(self):
+        self.update_if_dirty()
         return self.z_position
 
     def calc_completeStiffnessmatrix(self):
-        # A matrix: extensional stiffnesses
-        A = np.zeros((3, 3))
-        for i in range(3):
-            for j in range(3):
-                for k_ply in range(len(self.finalStack)):
-                    A[i, j] += self.finalStack[k_ply].Q[i, j] * (
-                        self.z_position[k_ply + 1] - self.z_position[k_ply]
-                    )
-
-        # B matrix: bending-extension coupling stiffnesses
-        B = np.zeros((3, 3))
-        for i in range(3):
-            for j in range(3):
-                for k_ply in range(len(self.finalStack)):
-                    B[i, j] += (
-                        -self.finalStack[k_ply].Q[i, j]
-                        * 0.5
-                        * (
-                            self.z_position[k_ply + 1] ** 2
-                            - self.z_position[k_ply] ** 2
-                        )
-                    )
-        # D matrix: bending stiffnesses
-        D = np.zeros((3, 3))
-        for i in range(3):
-            for j in range(3):
-                for k_ply in range(len(self.finalStack)):
-                    D[i, j] += (
-                        self.finalStack[k_ply].Q[i, j]
-                        * 1
-                        / 3
-                        * (
-                            self.z_position[k_ply + 1] ** 3
-                            - self.z_position[k_ply] ** 3
-                        )
-                    )
-
-        self.stiffnessMatrix = np.block([[A, B], [B, D]])
+        self.Q_stack = np.array([ply.Q for ply in self.finalStack]).reshape(-1, 3, 3)
+        self.stiffnessMatrix = self.get_cachedResult(
+            "ABD",
+            lambda laminate: calc_ABD_matrix(laminate.Q_stack, laminate.z_position),
+        )
+
+    def calc_hash(self):
+        """Canonical hash of the laminate.
+
+        Laminates with the same stiffness matrices, expansion coefficients
+        and thicknesses of the plies in the final stack, the same
+        ``symetric``, ``core`` and ``move_reference_plane`` flags have the
+        same hash, independent of the ``Ply`` and material objects. The hash
+        is built from the matrices of the plies, so plies not yet updated
+        after a change of their material do not share the cached results of
+        the changed material.
+        """
+        plies = np.array(
+            [
+                np.concatenate([np.ravel(ply.Q), ply.alpha, ply.beta, [ply.thickness]])
+                for ply in self.finalStack
+            ],
+            dtype="<f8",
+        )
+        flags = np.array(
+            [self.symetric, self.core, self.move_reference_plane], dtype=np.uint8
+        )
+        digest = hashlib.sha256(b"clt_py.Laminate:3")
+        digest.update(flags.tobytes())
+        # adding zero normalizes -0.0
+        digest.update((plies.reshape(-1, 16) + 0.0).tobytes())
+        self.hash = digest.hexdigest()
+
+    def get_hash(self):
+        self.update_if_dirty()
+        if self.hash is None:
+            self.calc_hash()
+        return self.hash
+
+    def get_cachedResult(self, name, function):
+        """Derived quantity of the laminate, shared through ``LAMINATE_CACHE``.
+
+        :param name: name of the quantity
+        :type name: str
+        :param function: ``function(laminate)`` computing the quantity on a \
+            cache miss
+        :type function: callable
+        :return: read-only quantity
+        :rtype: numpy.ndarray
+        """
+        value = self.results.get(name)
+        if value is None:
+            if self.hash is None:
+                self.calc_hash()
+            key = "{}-{}".format(self.hash, name)
+            value = LAMINATE_CACHE.get(key)
+            if value is None:
+                value = LAMINATE_CACHE.put(key, function(self))
+            self.results[name] = value
+        return value
+
+    def reset_results(self):
+        """Forget hash and derived quantities after the stack changed."""
+        self.hash = None
+        self.results = {}
+
+    def ply_stiffness_changed(self, ply):
+        """Update the ABD-matrix after the stiffness matrix of a ply changed.
+
+        Only the contributions of the changed ply are replaced, all other
+        plies keep their stored stiffness matrices in ``Q_stack``.
+
+        :param ply: ply of the laminate with new stiffness matrix ``Q``
+        :type ply: Ply
+        """
+        if self.dirty or id(ply) not in self.ply_indices:
+            return
+        self.reset_results()
+        z = self.z_position
+        ABD = self.stiffnessMatrix.copy()
+        for k_ply in self.ply_indices[id(ply)]:
+            dQ = ply.Q - self.Q_stack[k_ply]
+            ABD[0:3, 0:3] += dQ * (z[k_ply + 1] - z[k_ply])
+            ABD[0:3, 3:6] += -dQ * 0.5 * (z[k_ply + 1] ** 2 - z[k_ply] ** 2)
+            ABD[3:6, 3:6] += dQ / 3 * (z[k_ply + 1] ** 3 - z[k_ply] ** 3)
+            self.Q_stack[k_ply] = ply.Q
+        ABD[3:6, 0:3] = ABD[0:3, 3:6]
+        self.stiffnessMatrix = ABD
+
+    def ply_thickness_changed(self, ply):
+        """Update z-positions and ABD-matrix after the thickness of a ply changed.
+
+        The stored stiffness matrices in ``Q_stack`` are reused, no ply is
+        recomputed.
+
+        :param ply: ply of the laminate with new thickness
+        :type ply: Ply
+        """
+        if self.dirty or id(ply) not in self.ply_indices:
+            return
+        self.reset_results()
+        self.calc_z_positions()
+        self.stiffnessMatrix = calc_ABD_matrix(self.Q_stack, self.z_position)
 
     def get_stiffnessMatrix(self):
+        self.update_if_dirty()
         return self.stiffnessMatrix
+
+    def is_decoupled(self):
+        """Symmetric laminate with reference plane in the middle, B is zero."""
+        return self.symetric and self.move_reference_plane
+
+    def calc_complianceMatrix(self):
+        ABD = self.stiffnessMatrix
+        if not self.is_decoupled():
+            return np.linalg.inv(ABD)
+        # A and D are inverted independently, B is zero
+        abd = np.zeros((6, 6))
+        abd[:3, :3] = np.linalg.inv(ABD[:3, :3])
+        abd[3:, 3:] = np.linalg.inv(ABD[3:, 3:])
+        return abd
+
+    def calc_choleskyFactor(self):
+        ABD = self.stiffnessMatrix
+        if not self.is_decoupled():
+            return np.linalg.cholesky(ABD)
+        L = np.zeros((6, 6))
+        L[:3, :3] = np.linalg.cholesky(ABD[:3, :3])
+        L[3:, 3:] = np.linalg.cholesky(ABD[3:, 3:])
+        return L
+
+    def get_complianceMatrix(self):
+        """Inverse of the ABD-matrix, computed once per stack.
+
+        :rtype: numpy.ndarray, shape (6, 6)
+        """
+        self.update_if_dirty()
+        return self.get_cachedResult("complianceMatrix", Laminate.calc_complianceMatrix)
+
+    def get_choleskyFactor(self):
+        """Lower triangular L of the ABD-matrix ``ABD = L @ L.T``.
+
+        :raises numpy.linalg.LinAlgError: ABD-matrix not positive definite
+        :rtype: numpy.ndarray, shape (6, 6)
+        """
+        self.update_if_dirty()
+        return self.get_cachedResult("choleskyFactor", Laminate.calc_choleskyFactor)
+
+    def get_thickness(self):
+        z = self.get_z_positions()
+        return z[-1] - z[0]
+
+    def get_arealMass(self):
+        """Mass per area of the laminate."""
+        return sum(ply.mat.rho * ply.thickness for ply in self.get_finalStack())
+
+    def get_effectiveConstants(self):
+        """Effective membrane and flexural engineering constants.
+
+        :return: rows membrane and flexural constants, columns E_x, E_y, \
+            G_xy and v_xy
+        :rtype: numpy.ndarray, shape (2, 4)
+        """
+        self.update_if_dirty()
+        return self.get_cachedResult(
+            "effectiveConstants",
+            lambda laminate: calc_effectiveConstants(
+                laminate.get_complianceMatrix(), laminate.get_thickness()
+            ),
+        )
+
+    def get_membraneConstants(self):
+        """Effective membrane constants E_x, E_y, G_xy and v_xy.
+
+        :rtype: dict
+        """
+        return dict(zip(EFFECTIVE_CONSTANTS, self.get_effectiveConstants()[0]))
+
+    def get_flexuralConstants(self):
+        """Effective flexural constants E_x, E_y, G_xy and v_xy.
+
+        :rtype: dict
+        """
+        return dict(zip(EFFECTIVE_CONSTANTS, self.get_effectiveConstants()[1]))
+
+    def get_hygrothermalResultants(self):
+        """Force and moment resultants of a unit temperature and moisture change.
+
+        Computed once per stack, see ``get_hygrothermalLoads``.
+
+        :return: rows thermal and moisture resultants, columns N_x, N_y, \
+            N_xy, M_x, M_y and M_xy
+        :rtype: numpy.ndarray, shape (2, 6)
+        """
+        self.update_if_dirty()
+        return self.get_cachedResult(
+            "hygrothermalResultants",
+            lambda laminate: calc_hygrothermalResultants(
+                laminate.Q_stack,
+                np.array(
+                    [
+                        [ply.alpha for ply in laminate.finalStack],
+                        [ply.beta for ply in laminate.finalStack],
+                    ]
+                ).reshape(2, -1, 3),
+                laminate.z_position,
+            ),
+        )
+
+    def get_hygrothermalLoads(self, deltaT=0.0, deltaM=0.0):
+        """Force and moment resultants of many temperature and moisture changes.
+
+        The unit resultants are scaled, the plies are not integrated again.
+
+        :param deltaT: temperature changes, shape (n_cases,)
+        :type deltaT: {float, numpy.ndarray}
+        :param deltaM: moisture changes, broadcastable to ``deltaT``
+        :type deltaM: {float, numpy.ndarray}
+        :return: resultants N_x, N_y, N_xy, M_x, M_y and M_xy, shape (n_cases, 6)
+        :rtype: numpy.ndarray
+        """
+        changes = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(deltaT, dtype=float)),
+            np.atleast_1d(np.asarray(deltaM, dtype=float)),
+        )
+        return np.stack(changes, axis=-1) @ self.get_hygrothermalResultants()
+
+    def calc_laminationParameters(self):
+        """Lamination parameters and material invariants of the laminate.
+
+        :raises ValueError: plies of different materials
+        """
+        self.update_if_dirty()
+        invariants = np.array([ply.mat.stiffnessInvariants for ply in self.finalStack])
+        if len(invariants) == 0 or not np.allclose(invariants, invariants[0]):
+            raise ValueError("lamination parameters require plies of one material")
+        self.stiffnessInvariants = invariants[0]
+        self.laminationParameters = calc_laminationParameters(
+            [ply.rotRad for ply in self.finalStack], self.z_position
+        )
+
+    def get_laminationParameters(self):
+        """Lamination parameters of the laminate.
+
+        :return: lamination parameters, rows for A, B and D, columns for \
+            cos(2*rotRad), sin(2*rotRad), cos(4*rotRad) and sin(4*rotRad)
+        :rtype: numpy.ndarray, shape (3, 4)
+        """
+        self.calc_laminationParameters()
+        return self.laminationParameters
+
+    def get_stiffnessInvariants(self):
+        self.calc_laminationParameters()
+        return self.stiffnessInvariants
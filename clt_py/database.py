@@ -0,0 +1,414 @@
+"""Binary database of materials and laminates.
+
+The file consists of a header and three sections of fixed-width records,
+which are opened with ``numpy.memmap``. Opening a database therefore only
+maps the file, records are read from disk when they are accessed.
+
+==========  ==================  ==========================================
+section     record              content
+==========  ==================  ==========================================
+header      ``HEADER_DTYPE``    magic, format version and record counts
+materials   ``MATERIAL_DTYPE``  elastic properties, expansion, strength,
+                                constituents
+plies       ``PLY_DTYPE``       material, rotation, thickness, z-positions
+laminates   ``LAMINATE_DTYPE``  first ply, number of plies, flags, ABD
+==========  ==================  ==========================================
+
+The plies of every laminate are stored as its final stack from bottom to top.
+"""
+
+import math
+import os
+
+import numpy as np
+
+from .clt_py import (
+    AnisotropicMaterial,
+    FiberReinforcedMaterialUD,
+    IsotropicMaterial,
+    Laminate,
+    Ply,
+)
+from .table import LaminateTable
+
+MAGIC = b"CLT_PYDB"
+FORMAT_VERSION = 3
+
+HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("reserved", "<u4"),
+        ("n_materials", "<u8"),
+        ("n_plies", "<u8"),
+        ("n_laminates", "<u8"),
+        ("padding", "u1", (24,)),
+    ]
+)
+MATERIAL_DTYPE = np.dtype(
+    [
+        ("kind", "u1"),
+        ("label", "S32"),
+        ("rho", "<f8"),
+        ("E_para", "<f8"),
+        ("E_ortho", "<f8"),
+        ("G", "<f8"),
+        ("v_para_ortho", "<f8"),
+        ("v_ortho_para", "<f8"),
+        ("stiffnessMatrix", "<f8", (3, 3)),
+        ("alpha", "<f8", (2,)),
+        ("beta", "<f8", (2,)),
+        ("strength", "<f8", (5,)),
+        ("matFib", "<i8"),
+        ("matMat", "<i8"),
+        ("fibVolRatio", "<f8"),
+        ("kapa", "<f8", (3,)),
+        ("system", "S16"),
+        ("own_system", "?"),
+    ]
+)
+PLY_DTYPE = np.dtype(
+    [
+        ("material", "<u4"),
+        ("rotRad", "<f8"),
+        ("thickness", "<f8"),
+        ("z_bot", "<f8"),
+        ("z_top", "<f8"),
+    ]
+)
+LAMINATE_DTYPE = np.dtype(
+    [
+        ("ply_offset", "<u8"),
+        ("n_plies", "<u4"),
+        ("core_index", "<i4"),
+        ("symetric", "?"),
+        ("move_reference_plane", "?"),
+        ("ABD", "<f8", (6, 6)),
+    ]
+)
+
+# values of MATERIAL_DTYPE["kind"]
+MATERIAL_KINDS = ("isotropic", "anisotropic", "fiber_reinforced")
+
+
+class DatabaseFormatError(Exception):
+    """Raised when a file is no database of a supported format version."""
+
+    pass
+
+
+def _truncate(text, n_bytes):
+    """UTF-8 encoded text of at most ``n_bytes``, cut at a character boundary."""
+    return text.encode()[:n_bytes].decode("utf-8", "ignore").encode()
+
+
+class _MaterialIndex:
+    """Unique materials and their constituents in order of appearance."""
+
+    def __init__(self):
+        self.materials = []
+        self.indices = {}
+
+    def add(self, material):
+        index = self.indices.get(id(material))
+        if index is None:
+            if isinstance(material, FiberReinforcedMaterialUD):
+                self.add(material.matFib)
+                self.add(material.matMat)
+            index = self.indices[id(material)] = len(self.materials)
+            self.materials.append(material)
+        return index
+
+    def records(self):
+        records = np.zeros(len(self.materials), dtype=MATERIAL_DTYPE)
+        records["matFib"] = records["matMat"] = -1
+        records["strength"] = np.nan
+        for record, material in zip(records, self.materials):
+            if isinstance(material, FiberReinforcedMaterialUD):
+                record["kind"] = 2
+                record["matFib"] = self.indices[id(material.matFib)]
+                record["matMat"] = self.indices[id(material.matMat)]
+                record["fibVolRatio"] = material.fibVolRatio
+                record["kapa"] = material.kapa
+                record["system"] = material.system.encode()
+                # the class-wide model is not restored for materials following it
+                record["own_system"] = "system" in material.__dict__
+            elif isinstance(material, IsotropicMaterial):
+                record["kind"] = 0
+            else:
+                record["kind"] = 1
+            record["label"] = _truncate(str(material.label), 32)
+            for name in ["rho", "E_para", "E_ortho", "G"]:
+                record[name] = getattr(material, name)
+            record["v_para_ortho"] = material.v_para_ortho
+            record["v_ortho_para"] = material.v_ortho_para
+            record["stiffnessMatrix"] = material.stiffnessMatrix
+            record["alpha"] = material.alpha[:2]
+            record["beta"] = material.beta[:2]
+            if material.strength is not None:
+                record["strength"] = material.strength
+        return records
+
+
+def _laminate_records(laminates, materials):
+    laminate_records = np.zeros(len(laminates), dtype=LAMINATE_DTYPE)
+    stacks = [laminate.get_finalStack() for laminate in laminates]
+    n_plies = np.array([len(stack) for stack in stacks], dtype=np.int64)
+    laminate_records["n_plies"] = n_plies
+    laminate_records["ply_offset"] = np.cumsum(n_plies) - n_plies
+
+    ply_records = np.zeros(int(n_plies.sum()), dtype=PLY_DTYPE)
+    k_ply = 0
+    for record, laminate, stack in zip(laminate_records, laminates, stacks):
+        record["symetric"] = laminate.symetric
+        record["move_reference_plane"] = laminate.move_reference_plane
+        record["core_index"] = len(laminate.stack) if laminate.core else -1
+        record["ABD"] = laminate.get_stiffnessMatrix()
+        z = laminate.get_z_positions()
+        for k, ply in enumerate(stack):
+            ply_records[k_ply] = (
+                materials.add(ply.mat),
+                ply.rotRad,
+                ply.thickness,
+                z[k],
+                z[k + 1],
+            )
+            k_ply += 1
+    return laminate_records, ply_records
+
+
+def _table_records(table, materials):
+    material_indices = np.array(
+        [materials.add(material) for material in table.plies.materials], np.int64
+    )
+    laminate_records = np.zeros(len(table), dtype=LAMINATE_DTYPE)
+    laminate_records["ply_offset"] = table.offsets[:-1]
+    laminate_records["n_plies"] = table.get_plyCounts()
+    laminate_records["core_index"] = -1
+    laminate_records["move_reference_plane"] = table.move_reference_plane
+    laminate_records["ABD"] = table.get_stiffnessMatrices()
+
+    ply_records = np.zeros(len(table.plies), dtype=PLY_DTYPE)
+    if len(material_indices):
+        ply_records["material"] = material_indices[table.plies.material_indices]
+    ply_records["rotRad"] = table.plies.rotRad
+    ply_records["thickness"] = table.plies.thickness
+    ply_records["z_bot"], ply_records["z_top"] = table.calc_z_positions()
+    return laminate_records, ply_records
+
+
+def write_database(path, laminates, materials=()):
+    """Write materials and laminates to a database file.
+
+    :param path: file to write, an existing file is overwritten
+    :type path: {str, os.PathLike}
+    :param laminates: laminates to store
+    :type laminates: {list of Laminate, LaminateTable}
+    :param materials: additional materials to store, the materials of the \
+        plies and their constituents are stored automatically
+    :type materials: list of Material2D, optional
+    """
+    index = _MaterialIndex()
+    for material in materials:
+        index.add(material)
+    if isinstance(laminates, LaminateTable):
+        laminate_records, ply_records = _table_records(laminates, index)
+    else:
+        laminate_records, ply_records = _laminate_records(list(laminates), index)
+    material_records = index.records()
+
+    header = np.zeros(1, dtype=HEADER_DTYPE)
+    header["magic"] = MAGIC
+    header["version"] = FORMAT_VERSION
+    header["n_materials"] = len(material_records)
+    header["n_plies"] = len(ply_records)
+    header["n_laminates"] = len(laminate_records)
+    with open(path, "wb") as file:
+        for records in [header, material_records, ply_records, laminate_records]:
+            file.write(records.tobytes())
+
+
+class LaminateDatabase:
+    def __init__(self, path, mode="r"):
+        """Memory mapped database of materials and laminates.
+
+        ``materials``, ``plies`` and ``laminates`` are structured arrays of
+        the records, mapped from the file.
+
+        :param path: file written by ``write_database``
+        :type path: {str, os.PathLike}
+        :param mode: ``numpy.memmap`` mode, "r+" allows to change records \
+            in place, defaults to "r"
+        :type mode: str, optional
+        :raises DatabaseFormatError: no database, unsupported version or \
+            file smaller than its header states
+        """
+        super().__init__()
+        self.path = path
+        header = np.fromfile(path, dtype=HEADER_DTYPE, count=1)
+        if len(header) != 1 or header["magic"][0] != MAGIC:
+            raise DatabaseFormatError(f"'{path}' is no clt_py database")
+        self.version = int(header["version"][0])
+        if self.version != FORMAT_VERSION:
+            raise DatabaseFormatError(
+                f"database format version {self.version} is not supported"
+            )
+
+        layout = [
+            (MATERIAL_DTYPE, int(header["n_materials"][0])),
+            (PLY_DTYPE, int(header["n_plies"][0])),
+            (LAMINATE_DTYPE, int(header["n_laminates"][0])),
+        ]
+        size = HEADER_DTYPE.itemsize + sum(
+            count * dtype.itemsize for dtype, count in layout
+        )
+        if os.path.getsize(path) < size:
+            raise DatabaseFormatError(
+                f"'{path}' is truncated, the header requires {size} bytes"
+            )
+
+        offset = HEADER_DTYPE.itemsize
+        sections = []
+        for dtype, count in layout:
+            if count:
+                sections.append(
+                    np.memmap(path, dtype=dtype, mode=mode, offset=offset, shape=count)
+                )
+            else:
+                sections.append(np.zeros(0, dtype=dtype))
+            offset += count * dtype.itemsize
+        self.materials, self.plies, self.laminates = sections
+        self.loaded_materials = {}
+
+    def __len__(self):
+        return len(self.laminates)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the mapped sections, open records stay valid."""
+        for section in [self.materials, self.plies, self.laminates]:
+            if isinstance(section, np.memmap):
+                section.flush()
+        self.materials = self.plies = self.laminates = None
+        self.loaded_materials = {}
+
+    def get_stiffnessMatrices(self):
+        """ABD-matrices of all laminates, shape (n_laminates, 6, 6)."""
+        return self.laminates["ABD"]
+
+    def get_stiffnessMatrix(self, index):
+        return self.laminates["ABD"][index]
+
+    def get_plyRecords(self, index):
+        """Ply records of the final stack of a laminate, bottom to top."""
+        record = self.laminates[index]
+        start = int(record["ply_offset"])
+        return self.plies[start : start + int(record["n_plies"])]
+
+    def get_z_positions(self, index):
+        plies = self.get_plyRecords(index)
+        return np.concatenate([plies["z_bot"][:1], plies["z_top"]])
+
+    def get_rotations(self, index):
+        """Ply rotations of a laminate. Unit=[°]"""
+        return np.degrees(self.get_plyRecords(index)["rotRad"])
+
+    def load_material(self, index):
+        """Material object of a material record.
+
+        Materials are created once per database, fiber reinforced materials
+        are recomputed from their constituents, including their expansion
+        coefficients. Their stored model is restored, if it was set per
+        material, otherwise they follow the current default model.
+
+        :param index: material record
+        :type index: int
+        :rtype: Material2D
+        """
+        index = int(index)
+        material = self.loaded_materials.get(index)
+        if material is not None:
+            return material
+        record = self.materials[index]
+        kind = MATERIAL_KINDS[record["kind"]]
+        label = record["label"].decode()
+        if kind == "fiber_reinforced":
+            material = FiberReinforcedMaterialUD(
+                matFib=self.load_material(record["matFib"]),
+                matMat=self.load_material(record["matMat"]),
+                fibVolRatio=float(record["fibVolRatio"]),
+                kapa=record["kapa"].tolist(),
+                label=label,
+                system=record["system"].decode() if record["own_system"] else None,
+            )
+        elif kind == "isotropic":
+            material = IsotropicMaterial(
+                rho=float(record["rho"]),
+                E=float(record["E_para"]),
+                v=float(record["v_para_ortho"]),
+                label=label,
+                alpha=record["alpha"].tolist(),
+                beta=record["beta"].tolist(),
+            )
+        else:
+            material = AnisotropicMaterial(
+                rho=float(record["rho"]),
+                E_para=float(record["E_para"]),
+                E_ortho=float(record["E_ortho"]),
+                G=float(record["G"]),
+                v_para_ortho=float(record["v_para_ortho"]),
+                label=label,
+                alpha=record["alpha"].tolist(),
+                beta=record["beta"].tolist(),
+            )
+        if not np.any(np.isnan(record["strength"])):
+            material.set_strength(*record["strength"].tolist())
+        self.loaded_materials[index] = material
+        return material
+
+    def load_laminate(self, index, lazy=False):
+        """Laminate object of a laminate record.
+
+        :param index: laminate record
+        :type index: int
+        :param lazy: create a lazy laminate, defaults to False
+        :type lazy: bool, optional
+        :rtype: Laminate
+        """
+        record = self.laminates[index]
+        plies = [
+            Ply(
+                self.load_material(ply["material"]),
+                thickness=float(ply["thickness"]),
+                rotation=math.degrees(ply["rotRad"]),
+            )
+            for ply in self.get_plyRecords(index)
+        ]
+        symetric = bool(record["symetric"])
+        core_index = int(record["core_index"])
+        if symetric:
+            plies = plies[: (len(plies) + 1) // 2]
+
+        laminate = Laminate(symetric=symetric, lazy=True)
+        if core_index < 0:
+            laminate.addPlies(plies)
+        else:
+            laminate.addPlies(plies[:core_index])
+            laminate.addCore(plies[core_index])
+            laminate.addPlies(plies[core_index + 1 :])
+        laminate.set_move_reference_plane(bool(record["move_reference_plane"]))
+        laminate.set_lazy(lazy)
+        return laminate
+
+
+def open_database(path, mode="r"):
+    """Open a database written by ``write_database``.
+
+    :rtype: LaminateDatabase
+    """
+    return LaminateDatabase(path, mode)
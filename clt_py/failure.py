@@ -0,0 +1,324 @@
+"""Vectorized ply failure criteria with reserve factors.
+
+The criteria work on stresses in material axes with the components
+(sigma_para, sigma_ortho, tau) in the last axis, e.g.
+``LoadResponse.materialStresses`` of shape (n_cases, n_plies, 2, 3), and on
+strength allowables ``Material2D.strength`` in the order
+(R_para_t, R_para_c, R_ortho_t, R_ortho_c, R_shear) broadcastable to the
+stresses without their last axis, e.g. shape (n_plies, 1, 5).
+
+Every criterion returns the reserve factors of its failure modes in the
+last axis: the factor the load can be scaled with until the mode fails.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .clt_py import calc_rotationStressMatrix
+from .response import LoadResponseSolver
+
+FailureResult = namedtuple(
+    "FailureResult", ["reserveFactors", "criticalPly", "criticalMode", "modes"]
+)
+FailureResult.__doc__ = """Critical failure of every load case.
+
+``reserveFactors``, ``criticalPly`` and ``criticalMode`` have the shape
+(n_cases,), ``criticalMode`` indexes into the mode names ``modes``.
+"""
+
+
+def _split(stresses, strength):
+    stresses = np.asarray(stresses, dtype=float)
+    strength = np.asarray(strength, dtype=float)
+    return (
+        stresses[..., 0],
+        stresses[..., 1],
+        stresses[..., 2],
+        tuple(strength[..., i] for i in range(5)),
+    )
+
+
+def _reserve_linear(exposure):
+    """Reserve factor of a stress exposure proportional to the load."""
+    with np.errstate(divide="ignore"):
+        return np.where(exposure > 0, 1 / np.maximum(exposure, 0), np.inf)
+
+
+def _reserve_quadratic(a, b):
+    """Positive root RF of ``a * RF**2 + b * RF = 1``."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denominator = b + np.sqrt(b**2 + 4 * np.maximum(a, 0))
+        return np.where(denominator > 0, 2 / denominator, np.inf)
+
+
+def max_stress(stresses, strength):
+    """Maximum stress criterion.
+
+    Modes: fiber tension, fiber compression, matrix tension,
+    matrix compression, shear.
+    """
+    s1, s2, t12, (Xt, Xc, Yt, Yc, S) = _split(stresses, strength)
+    return np.stack(
+        [
+            _reserve_linear(s1 / Xt),
+            _reserve_linear(-s1 / Xc),
+            _reserve_linear(s2 / Yt),
+            _reserve_linear(-s2 / Yc),
+            _reserve_linear(np.abs(t12) / S),
+        ],
+        axis=-1,
+    )
+
+
+def tsai_wu(stresses, strength, F12_star=-0.5):
+    """Tsai-Wu criterion with interaction ``F12 = F12_star * sqrt(F11 * F22)``.
+
+    Modes: tsai_wu.
+    """
+    s1, s2, t12, (Xt, Xc, Yt, Yc, S) = _split(stresses, strength)
+    F1 = 1 / Xt - 1 / Xc
+    F2 = 1 / Yt - 1 / Yc
+    F11 = 1 / (Xt * Xc)
+    F22 = 1 / (Yt * Yc)
+    F66 = 1 / S**2
+    F12 = F12_star * np.sqrt(F11 * F22)
+    a = F11 * s1**2 + F22 * s2**2 + F66 * t12**2 + 2 * F12 * s1 * s2
+    b = F1 * s1 + F2 * s2
+    return _reserve_quadratic(a, b)[..., np.newaxis]
+
+
+def hashin(stresses, strength, R_transverse_shear=None):
+    """Plane stress Hashin criterion.
+
+    Modes: fiber tension, fiber compression, matrix tension,
+    matrix compression.
+
+    :param R_transverse_shear: transverse shear strength, defaults to R_shear
+    """
+    s1, s2, t12, (Xt, Xc, Yt, Yc, S) = _split(stresses, strength)
+    S23 = S if R_transverse_shear is None else R_transverse_shear
+    tension_1 = s1 > 0
+    tension_2 = s2 > 0
+    zero = np.zeros_like(s1)
+    return np.stack(
+        [
+            _reserve_quadratic(
+                np.where(tension_1, (s1 / Xt) ** 2 + (t12 / S) ** 2, 0), zero
+            ),
+            _reserve_quadratic(np.where(tension_1, 0, (s1 / Xc) ** 2), zero),
+            _reserve_quadratic(
+                np.where(tension_2, (s2 / Yt) ** 2 + (t12 / S) ** 2, 0), zero
+            ),
+            _reserve_quadratic(
+                np.where(tension_2, 0, (s2 / (2 * S23)) ** 2 + (t12 / S) ** 2),
+                np.where(tension_2, 0, ((Yc / (2 * S23)) ** 2 - 1) * s2 / Yc),
+            ),
+        ],
+        axis=-1,
+    )
+
+
+def puck(stresses, strength, p_t=0.3, p_c=0.25):
+    """Plane stress Puck criterion, fiber failure and inter-fiber failure.
+
+    Modes: fiber tension, fiber compression, IFF mode A, IFF mode B,
+    IFF mode C.
+
+    :param p_t: inclination parameter p_ortho_para(+), defaults to 0.3 (CFRP)
+    :param p_c: inclination parameter p_ortho_para(-), defaults to 0.25 (CFRP)
+    """
+    s1, s2, t21, (Xt, Xc, Yt, Yc, S) = _split(stresses, strength)
+    t21 = np.abs(t21)
+    R_A = S / (2 * p_c) * (np.sqrt(1 + 2 * p_c * Yc / S) - 1)
+    p_oo = p_c * R_A / S
+    t21_c = S * np.sqrt(1 + 2 * p_oo)
+
+    mode_A = s2 >= 0
+    mode_B = ~mode_A & (np.abs(s2) * t21_c <= R_A * t21)
+    mode_C = ~mode_A & ~mode_B
+    with np.errstate(divide="ignore", invalid="ignore"):
+        f_A = np.sqrt((t21 / S) ** 2 + ((1 - p_t * Yt / S) * s2 / Yt) ** 2) + (
+            p_t * s2 / S
+        )
+        f_B = (np.sqrt(t21**2 + (p_c * s2) ** 2) + p_c * s2) / S
+        f_C = ((t21 / (2 * (1 + p_oo) * S)) ** 2 + (s2 / Yc) ** 2) * Yc / (-s2)
+    return np.stack(
+        [
+            _reserve_linear(s1 / Xt),
+            _reserve_linear(-s1 / Xc),
+            _reserve_linear(np.where(mode_A, f_A, 0)),
+            _reserve_linear(np.where(mode_B, f_B, 0)),
+            _reserve_linear(np.where(mode_C, f_C, 0)),
+        ],
+        axis=-1,
+    )
+
+
+CRITERIA = {
+    "max_stress": max_stress,
+    "tsai_wu": tsai_wu,
+    "hashin": hashin,
+    "puck": puck,
+}
+
+MODES = {
+    "max_stress": (
+        "fiber_tension",
+        "fiber_compression",
+        "matrix_tension",
+        "matrix_compression",
+        "shear",
+    ),
+    "tsai_wu": ("tsai_wu",),
+    "hashin": (
+        "fiber_tension",
+        "fiber_compression",
+        "matrix_tension",
+        "matrix_compression",
+    ),
+    "puck": ("fiber_tension", "fiber_compression", "iff_A", "iff_B", "iff_C"),
+}
+
+
+def get_criterion(criterion):
+    if criterion not in CRITERIA:
+        raise ValueError("'{}'-criterion is not implemented".format(criterion))
+    return CRITERIA[criterion]
+
+
+def ply_strengths(laminate):
+    """Strength allowables of the plies of a laminate, shape (n_plies, 5).
+
+    :raises ValueError: material without strength allowables
+    """
+    strengths = [ply.mat.strength for ply in laminate.get_finalStack()]
+    if any(strength is None for strength in strengths):
+        raise ValueError("all ply materials require strength allowables")
+    return np.array(strengths, dtype=float).reshape(-1, 5)
+
+
+def critical_failure(reserveFactors):
+    """Minimum reserve factor of every load case with its ply and mode.
+
+    :param reserveFactors: reserve factors, shape (n_cases, n_plies, n_points, n_modes)
+    :type reserveFactors: numpy.ndarray
+    :return: reserve factors, critical plies and critical modes, each (n_cases,)
+    :rtype: tuple
+    """
+    n_cases, n_plies, n_points, n_modes = reserveFactors.shape
+    flat = reserveFactors.reshape(n_cases, -1)
+    index = np.argmin(flat, axis=1)
+    return (
+        flat[np.arange(n_cases), index],
+        index // (n_points * n_modes),
+        index % n_modes,
+    )
+
+
+def evaluate_failure(
+    laminate, loads, criterion="tsai_wu", chunk_size=10000, solver=None, **kwargs
+):
+    """Critical reserve factor of every load case of a laminate.
+
+    The load cases are processed in chunks of ``chunk_size``, so the memory
+    of the intermediate ply stresses is bounded independent of the number
+    of load cases.
+
+    :param laminate: laminate with strength allowables for all ply materials
+    :type laminate: Laminate
+    :param loads: load cases (N_x, N_y, N_xy, M_x, M_y, M_xy), shape (n_cases, 6)
+    :type loads: numpy.ndarray
+    :param criterion: "max_stress", "tsai_wu", "hashin" or "puck", \
+        defaults to "tsai_wu"
+    :type criterion: str, optional
+    :param chunk_size: load cases per chunk, defaults to 10000
+    :type chunk_size: int, optional
+    :param solver: solver of the laminate, defaults to a new LoadResponseSolver
+    :type solver: LoadResponseSolver, optional
+    :param kwargs: parameters of the criterion
+    :raises ValueError: Not defined criterion
+    :rtype: FailureResult
+    """
+    function = get_criterion(criterion)
+    strength = ply_strengths(laminate)[:, np.newaxis, :]
+    if solver is None:
+        solver = LoadResponseSolver(laminate)
+    loads = np.asarray(loads, dtype=float).reshape(-1, 6)
+
+    n_cases = len(loads)
+    reserveFactors = np.empty(n_cases)
+    criticalPly = np.empty(n_cases, dtype=int)
+    criticalMode = np.empty(n_cases, dtype=int)
+    for start in range(0, n_cases, chunk_size):
+        chunk = slice(start, start + chunk_size)
+        stresses = solver.solve(loads[chunk]).materialStresses
+        (
+            reserveFactors[chunk],
+            criticalPly[chunk],
+            criticalMode[chunk],
+        ) = critical_failure(function(stresses, strength, **kwargs))
+    return FailureResult(reserveFactors, criticalPly, criticalMode, MODES[criterion])
+
+
+def evaluate_table_failure(table, loads, criterion="tsai_wu", **kwargs):
+    """Critical reserve factor of every laminate of a table for one load case each.
+
+    All laminates are evaluated at once, laminates with a different number
+    of plies are reduced with segment operations.
+
+    :param table: laminates with plies, strength allowables for all ply \
+        materials required
+    :type table: LaminateTable
+    :param loads: load case (N_x, N_y, N_xy, M_x, M_y, M_xy) of every \
+        laminate, shape (n_laminates, 6)
+    :type loads: numpy.ndarray
+    :param criterion: "max_stress", "tsai_wu", "hashin" or "puck", \
+        defaults to "tsai_wu"
+    :type criterion: str, optional
+    :param kwargs: parameters of the criterion
+    :raises ValueError: Not defined criterion, laminate without plies or \
+        material without strength allowables
+    :rtype: FailureResult
+    """
+    function = get_criterion(criterion)
+    plies = table.plies
+    strengths = [mat.strength for mat in plies.materials]
+    if any(strengths[k] is None for k in np.unique(plies.material_indices)):
+        raise ValueError("all ply materials require strength allowables")
+    strengths = [np.full(5, np.nan) if R is None else R for R in strengths]
+    counts = table.get_plyCounts()
+    if np.any(counts == 0):
+        raise ValueError("all laminates require plies")
+    loads = np.asarray(loads, dtype=float).reshape(-1, 6)
+
+    deformations = np.linalg.solve(
+        table.get_stiffnessMatrices(), loads[..., np.newaxis]
+    )[..., 0]
+    deformations = np.repeat(deformations, counts, axis=0)
+    z_points = np.stack(table.calc_z_positions(), axis=-1)
+    strains = (
+        deformations[:, np.newaxis, :3]
+        - z_points[..., np.newaxis] * deformations[:, np.newaxis, 3:]
+    )
+    stresses = np.einsum("pij,pkj->pki", plies.Q, strains)
+    rotStress_inv = calc_rotationStressMatrix(-plies.rotRad).reshape(-1, 3, 3)
+    materialStresses = np.einsum("pij,pkj->pki", rotStress_inv, stresses)
+    strength = np.array(strengths, dtype=float).reshape(-1, 5)[plies.material_indices]
+
+    reserveFactors = function(materialStresses, strength[:, np.newaxis, :], **kwargs)
+    n_modes = reserveFactors.shape[-1]
+    reserveFactors = reserveFactors.reshape(len(plies), -1)
+    index = np.argmin(reserveFactors, axis=1)
+    ply_reserveFactors = reserveFactors[np.arange(len(plies)), index]
+
+    # minimum per laminate: sort by laminate, then by reserve factor
+    laminate_index = np.repeat(np.arange(len(table)), counts)
+    order = np.lexsort((ply_reserveFactors, laminate_index))
+    critical = order[table.offsets[:-1]]
+    return FailureResult(
+        ply_reserveFactors[critical],
+        critical - table.offsets[:-1],
+        index[critical] % n_modes,
+        MODES[criterion],
+    )
@@ -0,0 +1,366 @@
+"""Micromechanics of unidirectional fiber reinforced materials.
+
+All functions work on scalars as well as on numpy arrays of equal or
+broadcastable shape, e.g. a sweep over the fiber-volume-ratio. Constituent
+materials are passed as objects with the attributes ``rho``, ``E_para``,
+``E_ortho``, ``G`` and ``v_para_ortho``, either ``Material2D`` instances
+or ``Constituent`` tuples of arrays.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+Constituent = namedtuple(
+    "Constituent", ["rho", "E_para", "E_ortho", "G", "v_para_ortho"]
+)
+
+UDProperties = namedtuple(
+    "UDProperties", ["rho", "E_para", "E_ortho", "G", "v_para_ortho", "v_ortho_para"]
+)
+
+UDMaterial = namedtuple(
+    "UDMaterial",
+    UDProperties._fields + ("complianceMatrix", "stiffnessMatrix"),
+)
+
+
+def as_constituent(material):
+    """Elastic properties of a material as ``Constituent``.
+
+    :param material: fiber or matrix material
+    :type material: {Material2D, Constituent}
+    :rtype: Constituent
+    """
+    return Constituent(*[getattr(material, name) for name in Constituent._fields])
+
+
+def _as_array(value):
+    value = np.asarray(value, dtype=float)
+    return value if value.ndim else value[()]
+
+
+def calc_density(fibVolRatio, matFib, matMat):
+    return (fibVolRatio + matMat.rho / matFib.rho * (1 - fibVolRatio)) * matFib.rho
+
+
+def calc_poissonRatio_ortho_para(E_para, E_ortho, v_para_ortho):
+    return v_para_ortho * E_ortho / E_para
+
+
+def prismatic_jones_model(fibVolRatio, matFib, matMat):
+    """Elastic properties by the prismatic model of Jones.
+
+    :param fibVolRatio: fiber-volume-ratio [0,1]
+    :type fibVolRatio: {float, numpy.ndarray}
+    :param matFib: fiber material
+    :type matFib: {AnisotropicMaterial, Constituent}
+    :param matMat: matrix material
+    :type matMat: {IsotropicMaterial, Constituent}
+    :rtype: UDProperties
+    """
+    phi = _as_array(fibVolRatio)
+    E_para = matFib.E_para * phi + matMat.E_para * (1 - phi)
+    E_ortho = (matFib.E_ortho * matMat.E_para) / (
+        matMat.E_para * phi + matFib.E_ortho * (1 - phi)
+    )
+    G = (matFib.G * matMat.G) / (matMat.G * phi + matFib.G * (1 - phi))
+    v_para_ortho = phi * matFib.v_para_ortho + (1 - phi) * matMat.v_para_ortho
+    return UDProperties(
+        rho=calc_density(phi, matFib, matMat),
+        E_para=E_para,
+        E_ortho=E_ortho,
+        G=G,
+        v_para_ortho=v_para_ortho,
+        v_ortho_para=calc_poissonRatio_ortho_para(E_para, E_ortho, v_para_ortho),
+    )
+
+
+def hsb_model(fibVolRatio, matFib, matMat, kapa=(1.0, 1.0, 1.0)):
+    """Elastic properties by the model of the HSB.
+
+    :param fibVolRatio: fiber-volume-ratio [0,1]
+    :type fibVolRatio: {float, numpy.ndarray}
+    :param matFib: fiber material
+    :type matFib: {AnisotropicMaterial, Constituent}
+    :param matMat: matrix material
+    :type matMat: {IsotropicMaterial, Constituent}
+    :param kapa: manufactoring reduction factors for E_para, E_ortho and G, \
+        shape (..., 3), defaults to (1, 1, 1)
+    :type kapa: {list, numpy.ndarray}, optional
+    :rtype: UDProperties
+    """
+    phi = _as_array(fibVolRatio)
+    kapa = np.asarray(kapa, dtype=float)
+
+    # helping variables
+    v = np.sqrt(phi / np.pi)
+    e = 1 - matMat.E_para / matFib.E_ortho
+    g = 1 - matMat.G / matFib.G
+    q_G = (1 + 2 * g * v) / (1 - 2 * g * v)
+    q_E = (1 + 2 * e * v) / (1 - 2 * e * v)
+
+    E_para = kapa[..., 0] * (matFib.E_para * phi + matMat.E_para * (1 - phi))
+    E_ortho = (
+        kapa[..., 1]
+        * matMat.E_para
+        * (
+            1
+            - 2 * v
+            - np.pi / (2 * e)
+            + ((2 * np.arctan(np.sqrt(q_E))) / (e * np.sqrt(1 - (2 * e * v) ** 2)))
+        )
+    )
+    G = (
+        kapa[..., 2]
+        * matMat.G
+        * (
+            1
+            - 2 * v
+            - np.pi / (2 * g)
+            + ((2 * np.arctan(np.sqrt(q_G))) / (g * np.sqrt(1 - (2 * g * v) ** 2)))
+        )
+    )
+    v_para_ortho = matFib.v_para_ortho * phi + matMat.v_para_ortho * (1 - phi)
+    return UDProperties(
+        rho=calc_density(phi, matFib, matMat),
+        E_para=E_para,
+        E_ortho=E_ortho,
+        G=G,
+        v_para_ortho=v_para_ortho,
+        v_ortho_para=calc_poissonRatio_ortho_para(E_para, E_ortho, v_para_ortho),
+    )
+
+
+def schapery_model(fibVolRatio, matFib, matMat, fibExpansion, matExpansion):
+    """Expansion coefficients by the model of Schapery.
+
+    The model applies to thermal as well as to moisture expansion.
+
+    :param fibVolRatio: fiber-volume-ratio [0,1]
+    :type fibVolRatio: {float, numpy.ndarray}
+    :param matFib: fiber material
+    :type matFib: {AnisotropicMaterial, Constituent}
+    :param matMat: matrix material
+    :type matMat: {IsotropicMaterial, Constituent}
+    :param fibExpansion: expansion of the fiber parallel and orthogonal to \
+        its axis, shape (..., 2)
+    :type fibExpansion: numpy.ndarray
+    :param matExpansion: expansion of the matrix, shape (..., 2)
+    :type matExpansion: numpy.ndarray
+    :return: expansion parallel and orthogonal to the fibers, shape (..., 2)
+    :rtype: numpy.ndarray
+    """
+    phi = _as_array(fibVolRatio)
+    fib = np.asarray(fibExpansion, dtype=float)
+    mat = np.asarray(matExpansion, dtype=float)
+    para = (
+        matFib.E_para * fib[..., 0] * phi + matMat.E_para * mat[..., 0] * (1 - phi)
+    ) / (matFib.E_para * phi + matMat.E_para * (1 - phi))
+    v_para_ortho = phi * matFib.v_para_ortho + (1 - phi) * matMat.v_para_ortho
+    ortho = (
+        (1 + matFib.v_para_ortho) * fib[..., 1] * phi
+        + (1 + matMat.v_para_ortho) * mat[..., 1] * (1 - phi)
+        - para * v_para_ortho
+    )
+    return np.stack(np.broadcast_arrays(para, ortho), axis=-1)
+
+
+def _poissonRatio_ortho_para_derivative(properties, derivatives):
+    E_para, E_ortho, v_para_ortho = (
+        properties.E_para,
+        properties.E_ortho,
+        properties.v_para_ortho,
+    )
+    return (
+        derivatives.v_para_ortho * E_ortho / E_para
+        + v_para_ortho * derivatives.E_ortho / E_para
+        - v_para_ortho * E_ortho * derivatives.E_para / E_para**2
+    )
+
+
+def prismatic_jones_model_derivative(fibVolRatio, matFib, matMat):
+    """Derivatives of ``prismatic_jones_model`` with respect to the
+    fiber-volume-ratio.
+
+    :rtype: UDProperties
+    """
+    phi = _as_array(fibVolRatio)
+    properties = prismatic_jones_model(phi, matFib, matMat)
+    E_ortho_denominator = matMat.E_para * phi + matFib.E_ortho * (1 - phi)
+    G_denominator = matMat.G * phi + matFib.G * (1 - phi)
+    derivatives = UDProperties(
+        rho=matFib.rho - matMat.rho + 0 * phi,
+        E_para=matFib.E_para - matMat.E_para + 0 * phi,
+        E_ortho=-properties.E_ortho
+        * (matMat.E_para - matFib.E_ortho)
+        / E_ortho_denominator,
+        G=-properties.G * (matMat.G - matFib.G) / G_denominator,
+        v_para_ortho=matFib.v_para_ortho - matMat.v_para_ortho + 0 * phi,
+        v_ortho_para=0,
+    )
+    return derivatives._replace(
+        v_ortho_para=_poissonRatio_ortho_para_derivative(properties, derivatives)
+    )
+
+
+def _hsb_shape_derivative(ratio, v):
+    """Derivative of the bracket term of E_ortho and G of the HSB with
+    respect to v = sqrt(fibVolRatio / pi)."""
+    s = np.sqrt(1 - (2 * ratio * v) ** 2)
+    q = (1 + 2 * ratio * v) / (1 - 2 * ratio * v)
+    return -2 + 2 / s**2 + 8 * ratio * v * np.arctan(np.sqrt(q)) / s**3
+
+
+def hsb_model_derivative(fibVolRatio, matFib, matMat, kapa=(1.0, 1.0, 1.0)):
+    """Derivatives of ``hsb_model`` with respect to the fiber-volume-ratio.
+
+    The derivatives of E_ortho and G are infinite for a fiber-volume-ratio
+    of 0.
+
+    :rtype: UDProperties
+    """
+    phi = _as_array(fibVolRatio)
+    kapa = np.asarray(kapa, dtype=float)
+    properties = hsb_model(phi, matFib, matMat, kapa)
+
+    v = np.sqrt(phi / np.pi)
+    with np.errstate(divide="ignore"):
+        dv = 1 / (2 * np.pi * v)
+    e = 1 - matMat.E_para / matFib.E_ortho
+    g = 1 - matMat.G / matFib.G
+    derivatives = UDProperties(
+        rho=matFib.rho - matMat.rho + 0 * phi,
+        E_para=kapa[..., 0] * (matFib.E_para - matMat.E_para) + 0 * phi,
+        E_ortho=kapa[..., 1] * matMat.E_para * _hsb_shape_derivative(e, v) * dv,
+        G=kapa[..., 2] * matMat.G * _hsb_shape_derivative(g, v) * dv,
+        v_para_ortho=matFib.v_para_ortho - matMat.v_para_ortho + 0 * phi,
+        v_ortho_para=0,
+    )
+    return derivatives._replace(
+        v_ortho_para=_poissonRatio_ortho_para_derivative(properties, derivatives)
+    )
+
+
+MODELS = {"prismatic_jones": prismatic_jones_model, "hsb": hsb_model}
+MODEL_DERIVATIVES = {
+    "prismatic_jones": prismatic_jones_model_derivative,
+    "hsb": hsb_model_derivative,
+}
+
+
+def _broadcast(*values):
+    return np.broadcast_arrays(*[np.asarray(x, dtype=float) for x in values])
+
+
+def calc_complianceMatrix(E_para, E_ortho, G, v_para_ortho):
+    """Compliance matrices of orthotropic materials, shape (..., 3, 3)."""
+    E_para, E_ortho, G, v_para_ortho = _broadcast(E_para, E_ortho, G, v_para_ortho)
+    S = np.zeros(E_para.shape + (3, 3))
+    S[..., 0, 0] = 1 / E_para
+    S[..., 1, 1] = 1 / E_ortho
+    S[..., 0, 1] = S[..., 1, 0] = -v_para_ortho / E_para
+    S[..., 2, 2] = 1 / G
+    return S
+
+
+def calc_stiffnessMatrix(E_para, E_ortho, G, v_para_ortho):
+    """Stiffness matrices of orthotropic materials, shape (..., 3, 3).
+
+    Closed-form inverse of ``calc_complianceMatrix``.
+    """
+    E_para, E_ortho, G, v_para_ortho = _broadcast(E_para, E_ortho, G, v_para_ortho)
+    denominator = 1 - v_para_ortho**2 * E_ortho / E_para
+    C = np.zeros(E_para.shape + (3, 3))
+    C[..., 0, 0] = E_para / denominator
+    C[..., 1, 1] = E_ortho / denominator
+    C[..., 0, 1] = C[..., 1, 0] = v_para_ortho * E_ortho / denominator
+    C[..., 2, 2] = G
+    return C
+
+
+def calc_stiffnessMatrix_derivative(
+    E_para, E_ortho, G, v_para_ortho, dE_para, dE_ortho, dG, dv_para_ortho
+):
+    """Derivatives of ``calc_stiffnessMatrix``, shape (..., 3, 3).
+
+    ``dE_para`` to ``dv_para_ortho`` are the derivatives of the elastic
+    properties with respect to the same parameter.
+    """
+    E_para, E_ortho, G, v, dE_para, dE_ortho, dG, dv = _broadcast(
+        E_para, E_ortho, G, v_para_ortho, dE_para, dE_ortho, dG, dv_para_ortho
+    )
+    denominator = 1 - v**2 * E_ortho / E_para
+    d_denominator = -(
+        2 * v * dv * E_ortho / E_para
+        + v**2 * dE_ortho / E_para
+        - v**2 * E_ortho * dE_para / E_para**2
+    )
+    dC = np.zeros(E_para.shape + (3, 3))
+    dC[..., 0, 0] = (dE_para * denominator - E_para * d_denominator) / denominator**2
+    dC[..., 1, 1] = (dE_ortho * denominator - E_ortho * d_denominator) / denominator**2
+    dC[..., 0, 1] = dC[..., 1, 0] = (
+        (dv * E_ortho + v * dE_ortho) * denominator - v * E_ortho * d_denominator
+    ) / denominator**2
+    dC[..., 2, 2] = dG
+    return dC
+
+
+def calc_ud_stiffnessDerivative(
+    fibVolRatio, matFib, matMat, kapa=(1.0, 1.0, 1.0), system="hsb"
+):
+    """Derivatives of the stiffness matrices of UD materials with respect to
+    the fiber-volume-ratio, shape (..., 3, 3).
+
+    :param system: "prismatic_jones" or "hsb", defaults to "hsb"
+    :type system: str, optional
+    :raises ValueError: Not defined system
+    :rtype: numpy.ndarray
+    """
+    if system not in MODELS:
+        raise ValueError("'{}'-system is not implemented".format(system))
+    if system == "hsb":
+        arguments = (fibVolRatio, matFib, matMat, kapa)
+    else:
+        arguments = (fibVolRatio, matFib, matMat)
+    properties = MODELS[system](*arguments)
+    derivatives = MODEL_DERIVATIVES[system](*arguments)
+    return calc_stiffnessMatrix_derivative(
+        properties.E_para,
+        properties.E_ortho,
+        properties.G,
+        properties.v_para_ortho,
+        derivatives.E_para,
+        derivatives.E_ortho,
+        derivatives.G,
+        derivatives.v_para_ortho,
+    )
+
+
+def calc_ud_material(fibVolRatio, matFib, matMat, kapa=(1.0, 1.0, 1.0), system="hsb"):
+    """Elastic properties, compliance and stiffness matrices of UD materials.
+
+    Vectorized equivalent of ``FiberReinforcedMaterialUD``.
+
+    :param system: "prismatic_jones" or "hsb", defaults to "hsb"
+    :type system: str, optional
+    :raises ValueError: Not defined system
+    :rtype: UDMaterial
+    """
+    if system not in MODELS:
+        raise ValueError("'{}'-system is not implemented".format(system))
+    if system == "hsb":
+        properties = hsb_model(fibVolRatio, matFib, matMat, kapa)
+    else:
+        properties = MODELS[system](fibVolRatio, matFib, matMat)
+    elastic = (
+        properties.E_para,
+        properties.E_ortho,
+        properties.G,
+        properties.v_para_ortho,
+    )
+    return UDMaterial(
+        *properties,
+        complianceMatrix=calc_complianceMatrix(*elastic),
+        stiffnessMatrix=calc_stiffnessMatrix(*elastic),
+    )
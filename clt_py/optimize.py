@@ -0,0 +1,410 @@
+"""Genetic algorithm for stacking sequences.
+
+Chromosomes are integer arrays indexing a discrete set of ply rotations,
+one gene per ply, or per ply of the lower half of symmetric laminates. A
+population is evaluated at once by ``batch.calc_ABD_matrices``, optionally
+in chunks on a process pool. Objectives and constraints are functions of
+the ABD-matrices and the ply rotations of the complete stacks::
+
+    optimizer = GeneticOptimizer(
+        (0, 45, -45, 90), 8, 0.125, [crp],
+        objective=BucklingLoad(500, 250),
+        constraints=[Bound(EngineeringConstant("E_x", 2.0), lower=40e3)],
+        seed=1,
+    )
+    result = optimizer.run()
+
+Functions evaluated on a process pool have to be picklable, e.g. module
+level functions or instances of the classes of this module.
+"""
+
+from collections import namedtuple
+import concurrent.futures
+import os
+
+import numpy as np
+
+from .batch import calc_ABD_matrices, material_stiffnessMatrices
+from .cache import LRUCache
+from .clt_py import EFFECTIVE_CONSTANTS, calc_effectiveConstants
+from .panel import calc_bucklingLoads
+from .sweep import iter_map
+
+OptimizationResult = namedtuple(
+    "OptimizationResult",
+    ["chromosome", "rotations", "objective", "violation", "history", "n_evaluations"],
+)
+OptimizationResult.__doc__ = """Best design of a genetic optimization.
+
+``rotations`` is the complete stack, ``history`` the best objective of every
+generation and ``n_evaluations`` the number of evaluated, not cached,
+chromosomes.
+"""
+
+
+class EngineeringConstant:
+    def __init__(self, name, thickness, flexural=False):
+        """Effective engineering constant of the laminates.
+
+        :param name: one of "E_x", "E_y", "G_xy", "v_xy"
+        :type name: str
+        :param thickness: laminate thickness
+        :type thickness: float
+        :param flexural: flexural instead of membrane constant, defaults to False
+        :type flexural: bool, optional
+        """
+        super().__init__()
+        self.index = EFFECTIVE_CONSTANTS.index(name)
+        self.thickness = thickness
+        self.flexural = flexural
+
+    def __call__(self, ABD, rotations):
+        constants = calc_effectiveConstants(np.linalg.inv(ABD), self.thickness)
+        return constants[:, int(self.flexural), self.index]
+
+
+class BucklingLoad:
+    def __init__(self, a, b, load_ratio=0.0, max_m=10, max_n=10):
+        """Critical buckling load of simply supported panels, see
+        ``panel.calc_bucklingLoads``."""
+        super().__init__()
+        self.a = a
+        self.b = b
+        self.load_ratio = load_ratio
+        self.max_m = max_m
+        self.max_n = max_n
+
+    def __call__(self, ABD, rotations):
+        return calc_bucklingLoads(
+            ABD, self.a, self.b, self.load_ratio, self.max_m, self.max_n
+        ).values
+
+
+class Balance:
+    def __init__(self, tolerance=1e-6):
+        """Constraint of balanced laminates, (|A16| + |A26|) / A11 <= tolerance."""
+        super().__init__()
+        self.tolerance = tolerance
+
+    def __call__(self, ABD, rotations):
+        coupling = np.abs(ABD[:, 0, 2]) + np.abs(ABD[:, 1, 2])
+        return coupling / ABD[:, 0, 0] - self.tolerance
+
+
+class Bound:
+    def __init__(self, function, lower=None, upper=None):
+        """Constraint of ``lower <= function(ABD, rotations) <= upper``.
+
+        :param function: quantity of the laminates, e.g. ``EngineeringConstant``
+        :type function: callable
+        :param lower: minimum, defaults to None
+        :type lower: float, optional
+        :param upper: maximum, defaults to None
+        :type upper: float, optional
+        """
+        super().__init__()
+        self.function = function
+        self.lower = lower
+        self.upper = upper
+
+    def __call__(self, ABD, rotations):
+        values = self.function(ABD, rotations)
+        violation = np.full(np.shape(values), -np.inf)
+        if self.lower is not None:
+            violation = np.maximum(violation, self.lower - values)
+        if self.upper is not None:
+            violation = np.maximum(violation, values - self.upper)
+        return violation
+
+
+def evaluate_chromosomes(
+    chromosomes,
+    angles,
+    thicknesses,
+    materials,
+    material_indices,
+    symetric,
+    objective,
+    constraints,
+):
+    """Objective and constraint violation of chromosomes.
+
+    :param chromosomes: angle indices, shape (n_chromosomes, n_genes)
+    :type chromosomes: numpy.ndarray
+    :param angles: ply rotations of the genes. Unit=[°]
+    :type angles: numpy.ndarray
+    :param thicknesses: ply thicknesses, broadcastable to ``chromosomes``
+    :type thicknesses: {float, numpy.ndarray}
+    :param materials: materials or stiffness matrices, shape (n_materials, 3, 3)
+    :type materials: {list of Material2D, numpy.ndarray}
+    :param material_indices: index into ``materials`` for every gene, or None
+    :type material_indices: numpy.ndarray
+    :param symetric: genes are the lower half of symmetric laminates
+    :type symetric: bool
+    :param objective: objective of ABD-matrices and rotations of the stacks
+    :type objective: callable
+    :param constraints: constraints of ABD-matrices and rotations, \
+        satisfied for values <= 0
+    :type constraints: list of callable
+    :return: objective values and summed positive constraint values, \
+        shape (n_chromosomes,) each
+    :rtype: tuple of numpy.ndarray
+    """
+    rotations = np.asarray(angles, dtype=float)[chromosomes]
+    ABD = calc_ABD_matrices(
+        rotations, thicknesses, materials, material_indices, symetric=symetric
+    )
+    if symetric:
+        rotations = np.concatenate([rotations, rotations[:, ::-1]], axis=1)
+    values = np.asarray(objective(ABD, rotations), dtype=float)
+    violation = np.zeros(len(chromosomes))
+    for constraint in constraints:
+        violation += np.maximum(constraint(ABD, rotations), 0)
+    return values, violation
+
+
+class GeneticOptimizer:
+    def __init__(
+        self,
+        angles,
+        n_genes,
+        thicknesses,
+        materials,
+        objective,
+        constraints=(),
+        material_indices=None,
+        symetric=True,
+        maximize=True,
+        population_size=50,
+        n_generations=100,
+        crossover_rate=0.9,
+        mutation_rate=0.05,
+        swap_rate=0.2,
+        n_elites=2,
+        tournament_size=3,
+        workers=0,
+        cache_size=100000,
+        seed=None,
+    ):
+        """Genetic algorithm of stacking sequences.
+
+        Individuals are ranked by the feasibility rules: feasible before
+        infeasible individuals, feasible by objective, infeasible by the sum
+        of their constraint violations. The selection are tournaments of the
+        ranks, followed by uniform crossover, mutation of single genes and
+        swaps of two genes, the best individuals are kept unchanged.
+
+        :param angles: ply rotations of the genes. Unit=[°]
+        :type angles: list of float
+        :param n_genes: genes per chromosome, plies of the lower half of \
+            symmetric laminates
+        :type n_genes: int
+        :param thicknesses: ply thicknesses, broadcastable to (n_genes,)
+        :type thicknesses: {float, numpy.ndarray}
+        :param materials: materials of the plies
+        :type materials: list of Material2D
+        :param objective: objective of ABD-matrices and rotations of the \
+            complete stacks, shape (n,) each
+        :type objective: callable
+        :param constraints: constraints of ABD-matrices and rotations, \
+            satisfied for values <= 0, defaults to ()
+        :type constraints: list of callable, optional
+        :param material_indices: index into ``materials`` for every gene, \
+            defaults to the first material
+        :type material_indices: numpy.ndarray, optional
+        :param symetric: mirrored stacks, defaults to True
+        :type symetric: bool, optional
+        :param maximize: maximize instead of minimize the objective, \
+            defaults to True
+        :type maximize: bool, optional
+        :param population_size: individuals per generation, defaults to 50
+        :type population_size: int, optional
+        :param n_generations: number of generations, defaults to 100
+        :type n_generations: int, optional
+        :param crossover_rate: probability of crossover of a pair of parents, \
+            defaults to 0.9
+        :type crossover_rate: float, optional
+        :param mutation_rate: probability of mutation per gene, defaults to 0.05
+        :type mutation_rate: float, optional
+        :param swap_rate: probability of swapping two genes of a child, which \
+            keeps the number of plies per rotation, defaults to 0.2
+        :type swap_rate: float, optional
+        :param n_elites: best individuals kept per generation, defaults to 2
+        :type n_elites: int, optional
+        :param tournament_size: individuals per tournament, defaults to 3
+        :type tournament_size: int, optional
+        :param workers: number of processes, 0 evaluates in this process, \
+            None uses all processors, defaults to 0
+        :type workers: int, optional
+        :param cache_size: cached evaluations of chromosomes, defaults to 100000
+        :type cache_size: int, optional
+        :param seed: seed of the random numbers, defaults to None
+        :type seed: int, optional
+        """
+        super().__init__()
+        self.angles = np.asarray(angles, dtype=float)
+        self.n_genes = n_genes
+        self.thicknesses = thicknesses
+        # the workers receive stiffness matrices instead of material objects
+        self.stiffnessMatrices = material_stiffnessMatrices(materials)
+        self.material_indices = material_indices
+        self.objective = objective
+        self.constraints = list(constraints)
+        self.symetric = symetric
+        self.maximize = maximize
+        self.population_size = population_size
+        self.n_generations = n_generations
+        self.crossover_rate = crossover_rate
+        self.mutation_rate = mutation_rate
+        self.swap_rate = swap_rate
+        self.n_elites = min(n_elites, population_size)
+        self.tournament_size = tournament_size
+        self.workers = workers
+        self.cache = LRUCache(cache_size)
+        self.n_evaluations = 0
+        self.random = np.random.RandomState(seed)
+
+    def get_rotations(self, chromosome):
+        """Ply rotations of the complete stack of a chromosome."""
+        rotations = self.angles[chromosome]
+        if self.symetric:
+            rotations = np.concatenate([rotations, rotations[..., ::-1]], axis=-1)
+        return rotations
+
+    def evaluate(self, population, executor=None):
+        """Objective and constraint violation of a population.
+
+        Chromosomes are evaluated once, repeated and cached chromosomes are
+        taken from the cache.
+
+        :param population: chromosomes, shape (n, n_genes)
+        :type population: numpy.ndarray
+        :param executor: executor of the evaluation with ``workers`` \
+            processes, defaults to evaluating in this process
+        :type executor: concurrent.futures.Executor, optional
+        :return: objective values and constraint violations, shape (n,) each
+        :rtype: tuple of numpy.ndarray
+        """
+        population = np.asarray(population)
+        keys = [chromosome.tobytes() for chromosome in population]
+        results = {}
+        new = []
+        for key, chromosome in zip(keys, population):
+            if key in results:
+                continue
+            results[key] = self.cache.get(key)
+            if results[key] is None:
+                new.append(chromosome)
+
+        if new:
+            new = np.array(new)
+            # one chunk per worker
+            n_chunks = 1 if executor is None else self.workers or os.cpu_count() or 1
+            chunks = np.array_split(new, min(n_chunks, len(new)))
+            evaluated = iter_map(
+                evaluate_chromosomes,
+                (
+                    (
+                        chunk,
+                        self.angles,
+                        self.thicknesses,
+                        self.stiffnessMatrices,
+                        self.material_indices,
+                        self.symetric,
+                        self.objective,
+                        self.constraints,
+                    )
+                    for chunk in chunks
+                ),
+                0 if executor is None else n_chunks,
+                executor,
+            )
+            for chunk, (values, violation) in zip(chunks, evaluated):
+                for chromosome, value, amount in zip(chunk, values, violation):
+                    key = chromosome.tobytes()
+                    results[key] = (float(value), float(amount))
+                    self.cache.put(key, results[key])
+            self.n_evaluations += len(new)
+
+        values, violation = np.array([results[key] for key in keys]).T
+        return values, violation
+
+    def rank(self, values, violation):
+        """Indices of the individuals from best to worst."""
+        return np.lexsort((-values if self.maximize else values, violation))
+
+    def select(self, population, ranks, n):
+        """Winners of ``n`` tournaments, lower rank wins."""
+        candidates = self.random.randint(
+            len(population), size=(n, self.tournament_size)
+        )
+        winners = candidates[np.arange(n), np.argmin(ranks[candidates], axis=1)]
+        return population[winners]
+
+    def reproduce(self, parents):
+        """Children of pairs of parents by uniform crossover, mutation and swaps."""
+        first, second = parents[0::2], parents[1::2]
+        n_pairs = len(second)
+        crossing = (self.random.rand(n_pairs) < self.crossover_rate)[:, np.newaxis]
+        swap = crossing & (self.random.rand(n_pairs, self.n_genes) < 0.5)
+        children = np.concatenate(
+            [
+                np.where(swap, second, first[:n_pairs]),
+                np.where(swap, first[:n_pairs], second),
+                first[n_pairs:],
+            ]
+        )
+        mutating = self.random.rand(*children.shape) < self.mutation_rate
+        mutations = self.random.randint(len(self.angles), size=children.shape)
+        children = np.where(mutating, mutations, children)
+
+        swapping = np.flatnonzero(self.random.rand(len(children)) < self.swap_rate)
+        genes = self.random.randint(self.n_genes, size=(2, len(swapping)))
+        children[swapping, genes[0]], children[swapping, genes[1]] = (
+            children[swapping, genes[1]],
+            children[swapping, genes[0]],
+        )
+        return children
+
+    def run(self, population=None):
+        """Optimize the stacking sequence.
+
+        :param population: initial chromosomes, defaults to random chromosomes
+        :type population: numpy.ndarray, optional
+        :return: best individual of the last generation
+        :rtype: OptimizationResult
+        """
+        if population is None:
+            population = self.random.randint(
+                len(self.angles), size=(self.population_size, self.n_genes)
+            )
+        population = np.asarray(population, dtype=np.intp)
+        if self.workers == 0:
+            return self._run(population, None)
+        with concurrent.futures.ProcessPoolExecutor(self.workers) as executor:
+            return self._run(population, executor)
+
+    def _run(self, population, executor):
+        history = []
+        n_children = self.population_size - self.n_elites
+        for generation in range(self.n_generations + 1):
+            values, violation = self.evaluate(population, executor)
+            order = self.rank(values, violation)
+            history.append(values[order[0]])
+            if generation == self.n_generations:
+                break
+            ranks = np.empty(len(order), dtype=np.intp)
+            ranks[order] = np.arange(len(order))
+            parents = self.select(population, ranks, n_children)
+            population = np.concatenate(
+                [population[order[: self.n_elites]], self.reproduce(parents)]
+            )
+        best = order[0]
+        return OptimizationResult(
+            population[best],
+            self.get_rotations(population[best]),
+            values[best],
+            violation[best],
+            np.array(history),
+            self.n_evaluations,
+        )
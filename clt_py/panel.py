@@ -0,0 +1,151 @@
+"""Closed-form screening of simply supported rectangular panels.
+
+Buckling loads and natural frequencies of specially orthotropic plates
+from the D-matrix of the laminates, the coupling terms D16 and D26 are
+neglected. All functions broadcast over the leading dimensions of the
+D-matrices, panel lengths, widths and load ratios, the half-wave numbers
+(m, n) are scanned in a loop over m, vectorized over designs and n.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+PanelResult = namedtuple("PanelResult", ["values", "m", "n"])
+PanelResult.__doc__ = """Critical values with their half-wave numbers.
+
+``m`` half-waves along the length ``a`` and ``n`` along the width ``b``.
+"""
+
+
+def _plate_stiffness(D):
+    D = np.asarray(D, dtype=float)
+    if D.shape[-2:] == (6, 6):
+        D = D[..., 3:, 3:]
+    return D[..., 0, 0], D[..., 0, 1] + 2 * D[..., 2, 2], D[..., 1, 1]
+
+
+def _mode_stiffness(D11, D12_66, D22, alpha, beta):
+    return (D11 * alpha**4 + 2 * D12_66 * alpha**2 * beta**2 + D22 * beta**4) * np.pi**4
+
+
+def calc_arealMass(thicknesses, densities):
+    """Mass per area of laminates.
+
+    :param thicknesses: ply thicknesses, shape (..., n_plies)
+    :type thicknesses: numpy.ndarray
+    :param densities: ply densities, broadcastable to ``thicknesses``
+    :type densities: numpy.ndarray
+    :return: areal masses, shape (...)
+    :rtype: numpy.ndarray
+    """
+    return np.sum(np.multiply(thicknesses, densities), axis=-1)
+
+
+def calc_bucklingLoads(D, a, b, load_ratio=0.0, max_m=10, max_n=10):
+    """Critical buckling load of biaxially compressed panels.
+
+    The panels are loaded by ``N_x`` and ``N_y = load_ratio * N_x``,
+    compression positive. Modes with tension in the direction of the
+    half-waves have no buckling load.
+
+    :param D: D-matrices or ABD-matrices, shape (..., 3, 3) or (..., 6, 6)
+    :type D: numpy.ndarray
+    :param a: panel length in x, broadcastable
+    :type a: {float, numpy.ndarray}
+    :param b: panel width in y, broadcastable
+    :type b: {float, numpy.ndarray}
+    :param load_ratio: N_y / N_x, broadcastable, defaults to 0
+    :type load_ratio: {float, numpy.ndarray}, optional
+    :param max_m: maximum half-waves in x, defaults to 10
+    :type max_m: int, optional
+    :param max_n: maximum half-waves in y, defaults to 10
+    :type max_n: int, optional
+    :return: critical N_x (inf without buckling) and its half-wave numbers
+    :rtype: PanelResult
+    """
+    D11, D12_66, D22 = _plate_stiffness(D)
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    load_ratio = np.asarray(load_ratio, dtype=float)
+    shape = np.broadcast(D11, a, b, load_ratio).shape
+
+    beta = np.arange(1, max_n + 1) / b[..., np.newaxis]
+    ratio = load_ratio[..., np.newaxis]
+    loads = np.full(shape, np.inf)
+    m_critical = np.zeros(shape, dtype=int)
+    n_critical = np.zeros(shape, dtype=int)
+    for m in range(1, max_m + 1):
+        alpha = (m / a)[..., np.newaxis]
+        denominator = np.pi**2 * (alpha**2 + ratio * beta**2)
+        with np.errstate(divide="ignore"):
+            N_x = np.where(
+                denominator > 0,
+                _mode_stiffness(
+                    D11[..., np.newaxis],
+                    D12_66[..., np.newaxis],
+                    D22[..., np.newaxis],
+                    alpha,
+                    beta,
+                )
+                / denominator,
+                np.inf,
+            )
+        index = np.argmin(N_x, axis=-1)
+        N_x = np.broadcast_to(
+            np.take_along_axis(N_x, index[..., np.newaxis], -1)[..., 0], shape
+        )
+        lower = N_x < loads
+        loads = np.where(lower, N_x, loads)
+        m_critical = np.where(lower, m, m_critical)
+        n_critical = np.where(lower, np.broadcast_to(index + 1, shape), n_critical)
+    return PanelResult(loads, m_critical, n_critical)
+
+
+def calc_naturalFrequencies(D, arealMass, a, b, n_modes=1, max_m=10, max_n=10):
+    """Lowest natural frequencies of panels.
+
+    :param D: D-matrices or ABD-matrices, shape (..., 3, 3) or (..., 6, 6)
+    :type D: numpy.ndarray
+    :param arealMass: mass per area, broadcastable
+    :type arealMass: {float, numpy.ndarray}
+    :param a: panel length in x, broadcastable
+    :type a: {float, numpy.ndarray}
+    :param b: panel width in y, broadcastable
+    :type b: {float, numpy.ndarray}
+    :param n_modes: number of frequencies, defaults to 1
+    :type n_modes: int, optional
+    :param max_m: maximum half-waves in x, defaults to 10
+    :type max_m: int, optional
+    :param max_n: maximum half-waves in y, defaults to 10
+    :type max_n: int, optional
+    :return: frequencies in ascending order and their half-wave numbers, \
+        shape (..., n_modes) each. Unit=[Hz] for consistent units of D, \
+        mass and lengths
+    :rtype: PanelResult
+    """
+    D11, D12_66, D22 = _plate_stiffness(D)
+    a = np.asarray(a, dtype=float)[..., np.newaxis, np.newaxis]
+    b = np.asarray(b, dtype=float)[..., np.newaxis, np.newaxis]
+    alpha = np.arange(1, max_m + 1)[:, np.newaxis] / a
+    beta = np.arange(1, max_n + 1) / b
+    stiffness = _mode_stiffness(
+        D11[..., np.newaxis, np.newaxis],
+        D12_66[..., np.newaxis, np.newaxis],
+        D22[..., np.newaxis, np.newaxis],
+        alpha,
+        beta,
+    )
+    mass = np.asarray(arealMass, dtype=float)[..., np.newaxis, np.newaxis]
+    frequencies = np.sqrt(stiffness / mass) / (2 * np.pi)
+    frequencies = frequencies.reshape(frequencies.shape[:-2] + (-1,))
+
+    if n_modes == 1:
+        index = np.argmin(frequencies, axis=-1)[..., np.newaxis]
+    else:
+        index = np.argsort(frequencies, axis=-1)[..., :n_modes]
+    return PanelResult(
+        np.take_along_axis(frequencies, index, -1),
+        index // max_n + 1,
+        index % max_n + 1,
+    )
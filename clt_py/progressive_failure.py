@@ -0,0 +1,187 @@
+"""Progressive failure analysis from first-ply to last-ply failure.
+
+The load cases are scaled proportionally. At every event the ply with the
+lowest reserve factor fails and its stiffness is degraded in material
+axes: a matrix failure scales the transverse, coupling and shear
+stiffness by ``matrix_degradation``, a fiber failure scales the whole ply
+stiffness by ``fiber_degradation``. Only the contribution of the failed
+ply is replaced in the ABD-matrix, no ``Ply`` or ``Laminate`` is rebuilt.
+All load cases are processed together.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .clt_py import calc_rotated_stiffnessMatrix, calc_stiffnessInvariants
+from .failure import MODES, critical_failure, get_criterion, ply_strengths
+from .response import LoadResponseSolver
+
+ProgressiveFailureResult = namedtuple(
+    "ProgressiveFailureResult",
+    [
+        "loadFactors",
+        "deformations",
+        "failedPly",
+        "failedMode",
+        "modes",
+        "firstPlyFailure",
+        "lastPlyFailure",
+        "ultimateLoadFactors",
+    ],
+)
+ProgressiveFailureResult.__doc__ = """Load-displacement path of every load case.
+
+``loadFactors`` (n_cases, n_events) are the multiples of the load case at
+which a ply fails, ``deformations`` (n_cases, n_events, 6) the midplane
+strains and curvatures at that load. ``failedPly`` and ``failedMode`` name
+the failing ply and the index into ``modes``. Events after the last-ply
+failure are NaN or -1. ``firstPlyFailure`` and ``lastPlyFailure`` are the
+load factors of the first and last event, ``ultimateLoadFactors`` the
+maximum load factor of the path, all of shape (n_cases,).
+"""
+
+
+def progressive_failure(
+    laminate,
+    loads,
+    criterion="hashin",
+    matrix_degradation=0.1,
+    fiber_degradation=0.01,
+    max_events=None,
+    **kwargs
+):
+    """Progressive failure of a laminate for many proportional load cases.
+
+    :param laminate: laminate with strength allowables for all ply materials
+    :type laminate: Laminate
+    :param loads: load cases (N_x, N_y, N_xy, M_x, M_y, M_xy), shape (n_cases, 6)
+    :type loads: numpy.ndarray
+    :param criterion: criterion distinguishing fiber and matrix failure, \
+        "max_stress", "hashin" or "puck", defaults to "hashin"
+    :type criterion: str, optional
+    :param matrix_degradation: stiffness factor after matrix failure, \
+        defaults to 0.1
+    :type matrix_degradation: float, optional
+    :param fiber_degradation: stiffness factor after fiber failure, \
+        defaults to 0.01
+    :type fiber_degradation: float, optional
+    :param max_events: maximum number of failure events, defaults to \
+        2 * n_plies
+    :type max_events: int, optional
+    :param kwargs: parameters of the criterion
+    :raises ValueError: criterion without fiber and matrix modes
+    :rtype: ProgressiveFailureResult
+    """
+    function = get_criterion(criterion)
+    modes = MODES[criterion]
+    fiber_mode = np.array([mode.startswith("fiber") for mode in modes])
+    if fiber_mode.all() or not fiber_mode.any():
+        raise ValueError(
+            "'{}'-criterion does not distinguish fiber and matrix failure".format(
+                criterion
+            )
+        )
+
+    solver = LoadResponseSolver(laminate)
+    stack = laminate.get_finalStack()
+    strength = ply_strengths(laminate)[:, np.newaxis, :]
+    rotRad = np.array([ply.rotRad for ply in stack])
+    z = np.asarray(laminate.get_z_positions(), dtype=float)
+    weights = np.stack(
+        [
+            z[1:] - z[:-1],
+            -0.5 * (z[1:] ** 2 - z[:-1] ** 2),
+            (z[1:] ** 3 - z[:-1] ** 3) / 3,
+        ],
+        axis=-1,
+    )
+    matrix_factors = np.ones((3, 3))
+    matrix_factors[[0, 1, 1, 2], [1, 0, 1, 2]] = matrix_degradation
+
+    loads = np.asarray(loads, dtype=float).reshape(-1, 6)
+    n_cases = len(loads)
+    n_plies = len(stack)
+    if max_events is None:
+        max_events = 2 * n_plies
+
+    C = np.array([ply.mat.stiffnessMatrix for ply in stack]).reshape(-1, 3, 3)
+    C = np.repeat(C[np.newaxis], n_cases, axis=0)
+    Q = np.repeat(solver.Q[np.newaxis], n_cases, axis=0)
+    ABD = np.repeat(laminate.get_stiffnessMatrix()[np.newaxis], n_cases, axis=0)
+    matrix_failed = np.zeros((n_cases, n_plies), dtype=bool)
+    fiber_failed = np.zeros((n_cases, n_plies), dtype=bool)
+
+    loadFactors = np.full((n_cases, max_events), np.nan)
+    deformations = np.full((n_cases, max_events, 6), np.nan)
+    failedPly = np.full((n_cases, max_events), -1)
+    failedMode = np.full((n_cases, max_events), -1)
+    active = np.ones(n_cases, dtype=bool)
+
+    for event in range(max_events):
+        cases = np.flatnonzero(active)
+        if len(cases) == 0:
+            break
+
+        deformation = np.linalg.solve(ABD[cases], loads[cases, :, np.newaxis])[..., 0]
+        stresses = solver.response(
+            deformation[:, :3], deformation[:, 3:], Q=Q[cases]
+        ).materialStresses
+        reserveFactors = function(stresses, strength, **kwargs)
+        excluded = fiber_failed[cases, :, np.newaxis] | (
+            matrix_failed[cases, :, np.newaxis] & ~fiber_mode
+        )
+        reserveFactors[
+            np.broadcast_to(excluded[:, :, np.newaxis, :], reserveFactors.shape)
+        ] = np.inf
+        factor, ply, mode = critical_failure(reserveFactors)
+
+        finite = np.isfinite(factor)
+        active[cases[~finite]] = False
+        cases, factor, ply, mode = (
+            cases[finite],
+            factor[finite],
+            ply[finite],
+            mode[finite],
+        )
+        loadFactors[cases, event] = factor
+        deformations[cases, event] = deformation[finite] * factor[:, np.newaxis]
+        failedPly[cases, event] = ply
+        failedMode[cases, event] = mode
+
+        # degrade the failed ply and replace its contribution to the ABD-matrix
+        fiber = fiber_mode[mode]
+        C_new = C[cases, ply] * np.where(
+            fiber[:, np.newaxis, np.newaxis], fiber_degradation, matrix_factors
+        )
+        Q_new = calc_rotated_stiffnessMatrix(
+            calc_stiffnessInvariants(C_new), rotRad[ply]
+        )
+        dQ = Q_new - Q[cases, ply]
+        w = weights[ply][:, :, np.newaxis, np.newaxis]
+        ABD[cases, :3, :3] += w[:, 0] * dQ
+        ABD[cases, :3, 3:] += w[:, 1] * dQ
+        ABD[cases, 3:, :3] += w[:, 1] * dQ
+        ABD[cases, 3:, 3:] += w[:, 2] * dQ
+        C[cases, ply] = C_new
+        Q[cases, ply] = Q_new
+
+        matrix_failed[cases, ply] = True
+        fiber_failed[cases[fiber], ply[fiber]] = True
+        active[cases] &= ~fiber_failed[cases].all(axis=1)
+
+    n_events = np.sum(failedPly >= 0, axis=1)
+    last = loadFactors[np.arange(n_cases), np.maximum(n_events - 1, 0)]
+    reached = np.where(np.isnan(loadFactors), -np.inf, loadFactors).max(axis=1)
+    return ProgressiveFailureResult(
+        loadFactors=loadFactors,
+        deformations=deformations,
+        failedPly=failedPly,
+        failedMode=failedMode,
+        modes=modes,
+        firstPlyFailure=np.where(
+            np.isnan(loadFactors[:, 0]), np.inf, loadFactors[:, 0]
+        ),
+        lastPlyFailure=np.where(n_events > 0, last, np.inf),
+        ultimateLoadFactors=np.where(np.isinf(reached), np.inf, reached),
+    )
@@ -0,0 +1,146 @@
+"""Response of laminates to force and moment resultants.
+
+Sign convention of the ABD-matrix of ``Laminate``: the strains through the
+thickness are ``strain(z) = midplaneStrain - z * curvature``. Temperature
+and moisture changes are loads of their hygrothermal resultants, the ply
+stresses follow from the strains minus the free expansion of the plies.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .clt_py import calc_rotationStressMatrix, calc_rotationElongationMatrix
+
+LoadResponse = namedtuple(
+    "LoadResponse",
+    [
+        "midplaneStrains",
+        "curvatures",
+        "strains",
+        "stresses",
+        "materialStrains",
+        "materialStresses",
+    ],
+)
+LoadResponse.__doc__ = """Response to ``n_cases`` load cases of a laminate with ``n_plies`` plies.
+
+``midplaneStrains`` and ``curvatures`` have the shape (n_cases, 3). Strains and
+stresses are evaluated at the bottom and top of every ply, shape
+(n_cases, n_plies, 2, 3), in laminate axes and in material axes of the ply.
+Strains are total strains including the free hygrothermal expansion.
+"""
+
+
+class LoadResponseSolver:
+    def __init__(self, laminate):
+        """Solver for many load cases of one laminate.
+
+        The compliance matrix of the laminate is computed once, every call of
+        ``solve`` is a matrix product over all load cases.
+
+        :param laminate: laminate to analyse
+        :type laminate: Laminate
+        """
+        super().__init__()
+        stack = laminate.get_finalStack()
+        z = np.asarray(laminate.get_z_positions(), dtype=float)
+        rotRad = np.array([ply.rotRad for ply in stack])
+
+        self.complianceMatrix = laminate.get_complianceMatrix()
+        self.hygrothermalResultants = laminate.get_hygrothermalResultants()
+        # expansion of the plies in laminate axes, shape (2, n_plies, 3)
+        self.expansion = np.array(
+            [[ply.alpha for ply in stack], [ply.beta for ply in stack]]
+        ).reshape(2, -1, 3)
+        self.z_points = np.stack([z[:-1], z[1:]], axis=-1)
+        self.Q = np.array([ply.Q for ply in stack]).reshape(-1, 3, 3)
+        # inverse transformations of Ply.rotStress and Ply.rotElongation
+        self.rotStress_inv = calc_rotationStressMatrix(-rotRad).reshape(-1, 3, 3)
+        self.rotElongation_inv = calc_rotationElongationMatrix(-rotRad).reshape(
+            -1, 3, 3
+        )
+
+    def solve_deformations(self, loads):
+        """Midplane strains and curvatures.
+
+        :param loads: load cases (N_x, N_y, N_xy, M_x, M_y, M_xy), shape (n_cases, 6)
+        :type loads: numpy.ndarray
+        :return: midplane strains and curvatures, shape (n_cases, 6)
+        :rtype: numpy.ndarray
+        """
+        loads = np.asarray(loads, dtype=float).reshape(-1, 6)
+        return np.matmul(loads, self.complianceMatrix.T)
+
+    def solve(self, loads=None, deltaT=None, deltaM=None):
+        """Deformations, ply strains and ply stresses.
+
+        :param loads: load cases (N_x, N_y, N_xy, M_x, M_y, M_xy), shape \
+            (n_cases, 6), defaults to no mechanical loads
+        :type loads: numpy.ndarray, optional
+        :param deltaT: temperature changes, shape (n_cases,), defaults to None
+        :type deltaT: {float, numpy.ndarray}, optional
+        :param deltaM: moisture changes, shape (n_cases,), defaults to None
+        :type deltaM: {float, numpy.ndarray}, optional
+        :raises ValueError: neither loads nor changes of temperature or moisture
+        :rtype: LoadResponse
+        """
+        if deltaT is None and deltaM is None:
+            if loads is None:
+                raise ValueError("loads or temperature/moisture changes required")
+            deformations = self.solve_deformations(loads)
+            return self.response(deformations[:, :3], deformations[:, 3:])
+
+        changes = np.stack(
+            np.broadcast_arrays(
+                np.atleast_1d(np.asarray(0.0 if deltaT is None else deltaT, float)),
+                np.atleast_1d(np.asarray(0.0 if deltaM is None else deltaM, float)),
+            ),
+            axis=-1,
+        )
+        hygrothermalLoads = changes @ self.hygrothermalResultants
+        if loads is not None:
+            hygrothermalLoads = hygrothermalLoads + np.reshape(loads, (-1, 6))
+        deformations = self.solve_deformations(hygrothermalLoads)
+        return self.response(
+            deformations[:, :3],
+            deformations[:, 3:],
+            freeStrains=np.einsum("cm,mpi->cpi", changes, self.expansion),
+        )
+
+    def response(self, midplaneStrains, curvatures, Q=None, freeStrains=None):
+        """Ply strains and stresses of given deformations.
+
+        :param midplaneStrains: midplane strains, shape (n_cases, 3)
+        :type midplaneStrains: numpy.ndarray
+        :param curvatures: curvatures, shape (n_cases, 3)
+        :type curvatures: numpy.ndarray
+        :param Q: ply stiffness matrices, shape (n_plies, 3, 3) or \
+            (n_cases, n_plies, 3, 3), defaults to ``Ply.Q`` of the laminate
+        :type Q: numpy.ndarray, optional
+        :param freeStrains: free hygrothermal expansion of the plies in \
+            laminate axes, shape (n_cases, n_plies, 3), defaults to None
+        :type freeStrains: numpy.ndarray, optional
+        :rtype: LoadResponse
+        """
+        if Q is None:
+            Q = self.Q
+        strains = (
+            midplaneStrains[:, np.newaxis, np.newaxis, :]
+            - self.z_points[np.newaxis, :, :, np.newaxis]
+            * curvatures[:, np.newaxis, np.newaxis, :]
+        )
+        mechanicalStrains = strains
+        if freeStrains is not None:
+            mechanicalStrains = strains - freeStrains[:, :, np.newaxis, :]
+        stresses = np.einsum("...pij,...pkj->...pki", Q, mechanicalStrains)
+        return LoadResponse(
+            midplaneStrains=np.ascontiguousarray(midplaneStrains),
+            curvatures=np.ascontiguousarray(curvatures),
+            strains=strains,
+            stresses=stresses,
+            materialStrains=np.einsum(
+                "pij,cpkj->cpki", self.rotElongation_inv, strains
+            ),
+            materialStresses=np.einsum("pij,cpkj->cpki", self.rotStress_inv, stresses),
+        )
@@ -0,0 +1,276 @@
+"""Analytic sensitivities of ABD-matrices and effective constants.
+
+Derivatives with respect to every ply rotation, every ply thickness and the
+fiber-volume-ratio of every material are computed in one vectorized pass,
+replacing finite differences with ``2 n + 1`` evaluations of the laminate.
+The arguments equal those of ``batch.calc_ABD_matrices``. The derivatives
+of the ply stiffness matrices follow from the closed form of
+``calc_rotated_stiffnessMatrix`` and the derivatives of the micromechanics
+models of ``FiberReinforcedMaterialUD``.
+
+Jacobians have the parameter axis in front of the matrix axes, e.g. shape
+(n_laminates, n_plies, 6, 6) for the ply rotations.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from . import micromechanics
+from .batch import calc_z_positions, material_stiffnessMatrices
+from .clt_py import (
+    FiberReinforcedMaterialUD,
+    _block_ABD,
+    _cos_sin,
+    _split_invariants,
+    _stack_matrix,
+    calc_ABD_matrix,
+    calc_effectiveConstants,
+    calc_rotated_stiffnessMatrix,
+    calc_stiffnessInvariants,
+)
+
+ABDJacobian = namedtuple(
+    "ABDJacobian",
+    [
+        "ABD",
+        "thickness",
+        "d_thickness",
+        "d_rotations",
+        "d_thicknesses",
+        "d_fibVolRatios",
+    ],
+)
+ABDJacobian.__doc__ = """ABD-matrices, laminate thicknesses and their derivatives.
+
+``d_thickness`` is the derivative of the laminate thickness with respect to
+the ply thicknesses, shape (n_laminates, n_plies). ``d_rotations`` in 1/°,
+shape (n_laminates, n_plies, 6, 6), ``d_thicknesses`` of the same shape and
+``d_fibVolRatios`` of shape (n_laminates, n_materials, 6, 6). For symmetric
+laminates the plies are those of the lower half.
+"""
+
+ConstantsJacobian = namedtuple(
+    "ConstantsJacobian",
+    ["constants", "d_rotations", "d_thicknesses", "d_fibVolRatios"],
+)
+ConstantsJacobian.__doc__ = """Effective constants and their derivatives.
+
+``constants`` as of ``calc_effectiveConstants``, shape (n_laminates, 2, 4),
+the derivatives of shape (n_laminates, n_parameters, 2, 4).
+"""
+
+
+def calc_rotated_stiffnessDerivative(stiffnessInvariants, rotRad):
+    """Derivatives of ``calc_rotated_stiffnessMatrix`` with respect to the
+    rotation in radian.
+
+    :param stiffnessInvariants: invariants U1 to U5, shape (..., 5)
+    :type stiffnessInvariants: numpy.ndarray
+    :param rotRad: rotation angle(s) in radian, broadcastable to (...)
+    :type rotRad: {float, numpy.ndarray}
+    :return: derivatives of the stiffness matrices, shape (..., 3, 3)
+    :rtype: numpy.ndarray
+    """
+    U1, U2, U3, U4, U5 = _split_invariants(stiffnessInvariants)
+    c2, s2 = _cos_sin(2 * rotRad)
+    c4, s4 = _cos_sin(4 * rotRad)
+    # the rotation matrices of this module rotate in negative direction
+    s2 = -s2
+    s4 = -s4
+
+    dQ11 = 2 * U2 * s2 + 4 * U3 * s4
+    dQ22 = -2 * U2 * s2 + 4 * U3 * s4
+    dQ12 = -4 * U3 * s4
+    dQ16 = -U2 * c2 - 4 * U3 * c4
+    dQ26 = -U2 * c2 + 4 * U3 * c4
+    return _stack_matrix([[dQ11, dQ12, dQ16], [dQ12, dQ22, dQ26], [dQ16, dQ26, dQ12]])
+
+
+def material_stiffnessDerivatives(materials):
+    """Derivatives of the material stiffness matrices with respect to their
+    fiber-volume-ratio, zero for materials without fibers.
+
+    :param materials: materials of the plies
+    :type materials: list of Material2D
+    :return: derivatives, shape (n_materials, 3, 3)
+    :rtype: numpy.ndarray
+    """
+    derivatives = np.zeros((len(materials), 3, 3))
+    for k, material in enumerate(materials):
+        if isinstance(material, FiberReinforcedMaterialUD):
+            material.update_if_stale()
+            derivatives[k] = micromechanics.calc_ud_stiffnessDerivative(
+                material.fibVolRatio,
+                material.matFib,
+                material.matMat,
+                material.kapa,
+                material.computed_system,
+            )
+    return derivatives
+
+
+def _ply_ABD(Q, z_bot, z_top):
+    """Contributions of every ply to the ABD-matrix, shape (..., n_plies, 6, 6)."""
+    return _block_ABD(
+        (z_top - z_bot)[..., np.newaxis, np.newaxis] * Q,
+        -0.5 * (z_top**2 - z_bot**2)[..., np.newaxis, np.newaxis] * Q,
+        1 / 3 * (z_top**3 - z_bot**3)[..., np.newaxis, np.newaxis] * Q,
+    )
+
+
+def _suffix_sum(values):
+    """Sums over the plies k to n - 1 for every k along axis -3."""
+    return np.cumsum(values[..., ::-1, :, :], axis=-3)[..., ::-1, :, :]
+
+
+def _thickness_derivative(Q, z_bot, z_top, ABD, move_reference_plane):
+    # z_top[i] depends on the thicknesses of plies k <= i, z_bot[i] on k < i,
+    # the moved reference plane shifts all z-positions by -1/2 per thickness
+    zt = z_top[..., np.newaxis, np.newaxis]
+    zb = z_bot[..., np.newaxis, np.newaxis]
+    dB = -(_suffix_sum(Q * zt) - _suffix_sum(Q * zb) + Q * zb)
+    dD = _suffix_sum(Q * zt**2) - _suffix_sum(Q * zb**2) + Q * zb**2
+    if move_reference_plane:
+        dB = dB + 0.5 * ABD[..., np.newaxis, :3, :3]
+        dD = dD + ABD[..., np.newaxis, :3, 3:]
+    return _block_ABD(Q, dB, dD)
+
+
+def calc_ABD_jacobian(
+    rotations,
+    thicknesses,
+    materials,
+    material_indices=None,
+    symetric=False,
+    move_reference_plane=True,
+):
+    """ABD-matrices and their derivatives of many laminates.
+
+    :param rotations: ply rotations. Unit=[°], shape (n_laminates, n_plies)
+    :type rotations: numpy.ndarray
+    :param thicknesses: ply thicknesses, broadcastable to ``rotations``
+    :type thicknesses: {float, numpy.ndarray}
+    :param materials: materials of the plies
+    :type materials: list of Material2D
+    :param material_indices: index into ``materials`` for every ply, \
+        broadcastable to ``rotations``, defaults to the first material
+    :type material_indices: numpy.ndarray, optional
+    :param symetric: mirror the stacks like ``Laminate(symetric=True)``, \
+        defaults to False
+    :type symetric: bool, optional
+    :param move_reference_plane: reference plane in the middle of the laminate, \
+        defaults to True
+    :type move_reference_plane: bool, optional
+    :return: ABD-matrices, thicknesses and derivatives
+    :rtype: ABDJacobian
+    """
+    rotations = np.atleast_2d(np.asarray(rotations, dtype=float))
+    if rotations.ndim != 2:
+        raise ValueError("rotations must have shape (n_laminates, n_plies)")
+    n_plies = rotations.shape[1]
+    thicknesses = np.broadcast_to(np.asarray(thicknesses, dtype=float), rotations.shape)
+    if material_indices is None:
+        material_indices = 0
+    material_indices = np.broadcast_to(material_indices, rotations.shape)
+    if symetric:
+        rotations = np.concatenate([rotations, rotations[:, ::-1]], axis=1)
+        thicknesses = np.concatenate([thicknesses, thicknesses[:, ::-1]], axis=1)
+        material_indices = np.concatenate(
+            [material_indices, material_indices[:, ::-1]], axis=1
+        )
+
+    rotRad = np.radians(rotations)
+    U = calc_stiffnessInvariants(material_stiffnessMatrices(materials))[
+        material_indices
+    ]
+    Q = calc_rotated_stiffnessMatrix(U, rotRad)
+    z = calc_z_positions(thicknesses, move_reference_plane)
+    z_bot, z_top = z[:, :-1], z[:, 1:]
+    ABD = calc_ABD_matrix(Q, z)
+
+    dQ_rotation = np.radians(calc_rotated_stiffnessDerivative(U, rotRad))
+    d_rotations = _ply_ABD(dQ_rotation, z_bot, z_top)
+    d_thicknesses = _thickness_derivative(Q, z_bot, z_top, ABD, move_reference_plane)
+
+    dU = calc_stiffnessInvariants(material_stiffnessDerivatives(materials))
+    dQ_fibVolRatio = calc_rotated_stiffnessMatrix(dU[material_indices], rotRad)
+    one_hot = (material_indices[..., np.newaxis] == np.arange(len(materials))).astype(
+        float
+    )
+    d_fibVolRatios = np.einsum(
+        "lkm,lkij->lmij", one_hot, _ply_ABD(dQ_fibVolRatio, z_bot, z_top)
+    )
+
+    d_thickness = np.ones((len(rotations), n_plies))
+    if symetric:
+        # a ply of the lower half changes both mirrored plies
+        d_rotations = d_rotations[:, :n_plies] + d_rotations[:, : n_plies - 1 : -1]
+        d_thicknesses = (
+            d_thicknesses[:, :n_plies] + d_thicknesses[:, : n_plies - 1 : -1]
+        )
+        d_thickness *= 2
+    return ABDJacobian(
+        ABD,
+        z[:, -1] - z[:, 0],
+        d_thickness,
+        d_rotations,
+        d_thicknesses,
+        d_fibVolRatios,
+    )
+
+
+def _constants_derivative(abd, d_ABD, constants, thickness, d_thickness):
+    # derivative of the inverse: -abd * dABD * abd
+    d_abd = -abd[:, np.newaxis] @ d_ABD @ abd[:, np.newaxis]
+    # E ~ 1 / h for membrane and 1 / h**3 for flexural constants
+    relative = (d_thickness / thickness[:, np.newaxis])[
+        ..., np.newaxis, np.newaxis
+    ] * np.array([[1.0], [3.0]])
+    blocks = np.stack([abd[:, :3, :3], abd[:, 3:, 3:]], axis=-3)[:, np.newaxis]
+    d_blocks = np.stack([d_abd[..., :3, :3], d_abd[..., 3:, 3:]], axis=-3)
+    diagonal = np.diagonal(blocks, axis1=-2, axis2=-1)
+    d_diagonal = np.diagonal(d_blocks, axis1=-2, axis2=-1)
+    moduli = constants[:, np.newaxis, :, :3]
+    d_moduli = -moduli * (relative + d_diagonal / diagonal)
+    d_poisson = (
+        -(
+            d_blocks[..., 0, 1] * blocks[..., 0, 0]
+            - blocks[..., 0, 1] * d_blocks[..., 0, 0]
+        )
+        / blocks[..., 0, 0] ** 2
+    )
+    return np.concatenate([d_moduli, d_poisson[..., np.newaxis]], axis=-1)
+
+
+def calc_effectiveConstants_jacobian(jacobian):
+    """Effective constants and their derivatives, see ``calc_effectiveConstants``.
+
+    :param jacobian: result of ``calc_ABD_jacobian``
+    :type jacobian: ABDJacobian
+    :return: effective constants and derivatives
+    :rtype: ConstantsJacobian
+    """
+    abd = np.linalg.inv(jacobian.ABD)
+    thickness = jacobian.thickness
+    constants = calc_effectiveConstants(abd, thickness)
+    return ConstantsJacobian(
+        constants,
+        _constants_derivative(
+            abd,
+            jacobian.d_rotations,
+            constants,
+            thickness,
+            np.zeros(jacobian.d_rotations.shape[:2]),
+        ),
+        _constants_derivative(
+            abd, jacobian.d_thicknesses, constants, thickness, jacobian.d_thickness
+        ),
+        _constants_derivative(
+            abd,
+            jacobian.d_fibVolRatios,
+            constants,
+            thickness,
+            np.zeros(jacobian.d_fibVolRatios.shape[:2]),
+        ),
+    )
@@ -0,0 +1,137 @@
+"""Enumeration of stacking sequences under common design rules.
+
+Sequences are built ply by ply in a depth-first search. Prefixes that can
+no longer satisfy the rules are pruned before their sequences are
+generated. The sequences are streamed as chunks of angle arrays, which
+are input of ``batch.calc_ABD_matrices`` without creating ``Ply`` objects::
+
+    for rotations in iter_stackingSequences(n_plies=16):
+        ABD = calc_ABD_matrices(rotations, 0.125, [material], symetric=True)
+"""
+
+import math
+
+import numpy as np
+
+
+def _is_multiple(angle, period):
+    rest = angle % period
+    return math.isclose(rest, 0, abs_tol=1e-9) or math.isclose(rest, period)
+
+
+def _partners(angles):
+    """Index of the balancing angle of every angle, itself for 0° and 90°."""
+    partners = []
+    for angle in angles:
+        if _is_multiple(angle, 90):
+            partners.append(len(partners))
+            continue
+        matches = [
+            k for k, other in enumerate(angles) if _is_multiple(angle + other, 180)
+        ]
+        partners.append(matches[0] if matches else None)
+    return partners
+
+
+def iter_stackingSequences(
+    angles=(0.0, 45.0, -45.0, 90.0),
+    n_plies=16,
+    symetric=True,
+    balanced=True,
+    max_contiguous=4,
+    min_ratio=0.1,
+    chunk_size=10000,
+):
+    """Stacking sequences satisfying the design rules, in chunks.
+
+    The rules apply to the complete stack of ``n_plies`` plies. Symmetric
+    stacks are enumerated as the lower half, which is mirrored like
+    ``Laminate(symetric=True)``, so every laminate is generated once. Stacks
+    without symmetry are equivalent to their reversed stack, only the
+    lexicographically smaller one of both is generated.
+
+    :param angles: ply rotations. Unit=[°], defaults to (0, 45, -45, 90)
+    :type angles: list of float, optional
+    :param n_plies: plies of the complete stack, defaults to 16
+    :type n_plies: int, optional
+    :param symetric: symmetric stacks, defaults to True
+    :type symetric: bool, optional
+    :param balanced: as many +angle as -angle plies, defaults to True
+    :type balanced: bool, optional
+    :param max_contiguous: maximum number of neighbouring plies with the same \
+        rotation, None for no limit, defaults to 4
+    :type max_contiguous: int, optional
+    :param min_ratio: minimum share of plies of every angle, defaults to 0.1
+    :type min_ratio: float, optional
+    :param chunk_size: sequences per chunk, defaults to 10000
+    :type chunk_size: int, optional
+    :raises ValueError: symmetric stack of an odd number of plies
+    :yield: ply rotations, shape (n_sequences, n_plies // 2) for symmetric \
+        stacks, (n_sequences, n_plies) otherwise
+    :rtype: numpy.ndarray
+    """
+    if symetric and n_plies % 2:
+        raise ValueError("symmetric stacks require an even number of plies")
+    angles = np.asarray(angles, dtype=float)
+    n_angles = len(angles)
+    factor = 2 if symetric else 1
+    length = n_plies // factor
+    if max_contiguous is None:
+        max_contiguous = n_plies
+    # required plies per angle in the enumerated (half) stack
+    required = math.ceil(math.ceil(min_ratio * n_plies - 1e-9) / factor)
+    partners = _partners(angles.tolist())
+    pairs = [
+        (k, partner)
+        for k, partner in enumerate(partners)
+        if partner is None or partner > k
+    ]
+
+    counts = [0] * n_angles
+    sequence = [0] * length
+    chunk = []
+
+    def feasible(remaining):
+        deficit = sum(max(0, required - count) for count in counts)
+        if balanced:
+            deficit = max(
+                deficit,
+                sum(
+                    counts[k] if partner is None else abs(counts[k] - counts[partner])
+                    for k, partner in pairs
+                ),
+            )
+        return deficit <= remaining
+
+    def complete(run):
+        if symetric:
+            # the last ply is neighbour of its mirrored copy
+            return 2 * run <= max_contiguous
+        return sequence <= sequence[::-1]
+
+    def extend(position, run):
+        if position == length:
+            if complete(run):
+                chunk.append(list(sequence))
+                if len(chunk) == chunk_size:
+                    yield angles[np.array(chunk, dtype=int)]
+                    chunk.clear()
+            return
+        for k in range(n_angles):
+            k_run = run + 1 if position and sequence[position - 1] == k else 1
+            if k_run > max_contiguous:
+                continue
+            counts[k] += 1
+            sequence[position] = k
+            if feasible(length - position - 1):
+                yield from extend(position + 1, k_run)
+            counts[k] -= 1
+
+    yield from extend(0, 0)
+    if chunk:
+        yield angles[np.array(chunk, dtype=int).reshape(-1, length)]
+
+
+def count_stackingSequences(**kwargs):
+    """Number of stacking sequences of ``iter_stackingSequences``."""
+    return sum(len(chunk) for chunk in iter_stackingSequences(**kwargs))
@@ -0,0 +1,202 @@
+"""Parameter sweeps of laminate design studies on a process pool.
+
+The workers receive the compact axes of a ``ParameterGrid`` and the index
+range of their chunk, not pickled ``FiberReinforcedMaterialUD``, ``Ply``
+or ``Laminate`` objects. Materials among the constants of a sweep are
+converted to ``Constituent`` tuples once, before the chunks are submitted.
+The micromechanics model is passed explicitly to every chunk, the
+class-level ``FiberReinforcedMaterialUD.system`` is neither read nor
+changed in the workers.
+"""
+
+from collections import deque
+import concurrent.futures
+import os
+
+import numpy as np
+
+from .batch import calc_ABD_matrices
+from .clt_py import Material2D
+from .micromechanics import as_constituent, calc_ud_material
+
+
+class ParameterGrid:
+    def __init__(self, **axes):
+        """Cartesian product of parameter axes.
+
+        The first dimension of every axis are the options of the parameter,
+        further dimensions belong to a single option, e.g. ``rotations`` of
+        shape (n_sequences, n_plies).
+
+        :param axes: options of every parameter
+        :type axes: numpy.ndarray
+        """
+        super().__init__()
+        self.names = list(axes)
+        self.axes = [np.asarray(axes[name]) for name in self.names]
+        self.shape = tuple(len(axis) for axis in self.axes)
+
+    def __len__(self):
+        return int(np.prod(self.shape, dtype=np.int64))
+
+    def points(self, start=0, stop=None):
+        """Parameters of the grid points ``start`` to ``stop``.
+
+        :return: parameter name to values, first dimension ``stop - start``
+        :rtype: dict
+        """
+        if stop is None:
+            stop = len(self)
+        indices = np.unravel_index(np.arange(start, stop), self.shape)
+        return {
+            name: axis[index]
+            for name, axis, index in zip(self.names, self.axes, indices)
+        }
+
+
+def _evaluate_chunk(function, grid, start, stop, constants):
+    return function(grid.points(start, stop), **constants)
+
+
+def iter_map(function, arguments, max_workers=None, executor=None, max_pending=None):
+    """Ordered map over a process pool with a bounded number of tasks in flight.
+
+    ``arguments`` is consumed lazily, so a generator of chunks, e.g. read
+    from a file, is processed with constant memory.
+
+    :param function: picklable module level function
+    :type function: callable
+    :param arguments: argument tuples of ``function``
+    :type arguments: iterable
+    :param max_workers: number of processes, 0 evaluates in this process, \
+        defaults to the number of processors
+    :type max_workers: int, optional
+    :param executor: running executor used instead of a new process pool, \
+        e.g. for repeated maps, defaults to None
+    :type executor: concurrent.futures.Executor, optional
+    :param max_pending: tasks in flight, defaults to twice ``max_workers``
+    :type max_pending: int, optional
+    :yield: results in order of ``arguments``
+    """
+    if max_workers == 0 and executor is None:
+        for args in arguments:
+            yield function(*args)
+        return
+    if max_pending is None:
+        max_pending = 2 * (max_workers or os.cpu_count() or 1)
+
+    if executor is not None:
+        yield from _iter_submitted(executor, function, arguments, max_pending)
+        return
+    with concurrent.futures.ProcessPoolExecutor(max_workers) as executor:
+        yield from _iter_submitted(executor, function, arguments, max_pending)
+
+
+def _iter_submitted(executor, function, arguments, max_pending):
+    # bounded number of chunks in flight keeps the memory constant
+    pending = deque()
+    for args in arguments:
+        pending.append(executor.submit(function, *args))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def iter_sweep(
+    function, grid, chunk_size=10000, max_workers=None, progress=None, **constants
+):
+    """Evaluate a parameter grid chunk by chunk.
+
+    :param function: picklable module level function \
+        ``function(points, **constants)`` evaluating the dict of parameter \
+        arrays of one chunk
+    :type function: callable
+    :param grid: parameters to sweep
+    :type grid: ParameterGrid
+    :param chunk_size: grid points per chunk, defaults to 10000
+    :type chunk_size: int, optional
+    :param max_workers: number of processes, 0 evaluates in this process, \
+        defaults to the number of processors
+    :type max_workers: int, optional
+    :param progress: called with (finished points, total points) after \
+        every chunk, defaults to None
+    :type progress: callable, optional
+    :param constants: further arguments of ``function``, e.g. constituents, \
+        materials are passed as ``Constituent``
+    :yield: results of the chunks in order of the grid
+    """
+    constants = {
+        name: as_constituent(value) if isinstance(value, Material2D) else value
+        for name, value in constants.items()
+    }
+    total = len(grid)
+    bounds = [
+        (start, min(start + chunk_size, total)) for start in range(0, total, chunk_size)
+    ]
+    results = iter_map(
+        _evaluate_chunk,
+        ((function, grid, start, stop, constants) for start, stop in bounds),
+        max_workers,
+    )
+    for (_, stop), result in zip(bounds, results):
+        if progress is not None:
+            progress(stop, total)
+        yield result
+
+
+def run_sweep(function, grid, **kwargs):
+    """Evaluate a parameter grid and concatenate the results.
+
+    Arguments as ``iter_sweep``. Chunk results are arrays or dicts of
+    arrays, which are concatenated along the first dimension.
+    """
+    results = list(iter_sweep(function, grid, **kwargs))
+    if results and isinstance(results[0], dict):
+        return {
+            name: np.concatenate([result[name] for result in results])
+            for name in results[0]
+        }
+    return np.concatenate(results)
+
+
+def laminate_stiffness(points, matFib, matMat, system="hsb"):
+    """Evaluator of ``run_sweep`` for laminates of one UD material each.
+
+    :param points: ``fibVolRatio`` (n,), ``rotations`` (n, n_plies) and \
+        optional ``kapa`` (n, 3), ``thicknesses`` (n, n_plies) or (n,)
+    :type points: dict
+    :param matFib: fiber material
+    :type matFib: {AnisotropicMaterial, Constituent}
+    :param matMat: matrix material
+    :type matMat: {IsotropicMaterial, Constituent}
+    :param system: "prismatic_jones" or "hsb", defaults to "hsb"
+    :type system: str, optional
+    :return: ``ABD`` (n, 6, 6) and the elastic properties of the UD materials
+    :rtype: dict
+    """
+    kapa = points.get("kapa", (1.0, 1.0, 1.0))
+    ud = calc_ud_material(
+        points["fibVolRatio"],
+        as_constituent(matFib),
+        as_constituent(matMat),
+        kapa,
+        system=system,
+    )
+    rotations = np.asarray(points["rotations"], dtype=float)
+    thicknesses = np.asarray(points.get("thicknesses", 1.0), dtype=float)
+    if thicknesses.ndim == 1:
+        thicknesses = thicknesses[:, np.newaxis]
+    stiffnessMatrix = np.broadcast_to(ud.stiffnessMatrix, (len(rotations), 3, 3))
+    ABD = calc_ABD_matrices(
+        rotations,
+        thicknesses,
+        stiffnessMatrix,
+        material_indices=np.arange(len(rotations))[:, np.newaxis],
+    )
+    result = {
+        name: np.broadcast_to(getattr(ud, name), (len(rotations),))
+        for name in ("rho", "E_para", "E_ortho", "G", "v_para_ortho")
+    }
+    result["ABD"] = ABD
+    return result
@@ -0,0 +1,452 @@
+"""Compact struct-of-arrays storage of many plies and laminates.
+
+``PlyTable`` and ``LaminateTable`` keep the data of all plies in a few
+contiguous arrays instead of one ``Ply`` object per ply. Items are accessed
+through light ``PlyView`` and ``LaminateView`` objects, which expose the
+attributes of ``Ply`` and the getters of ``Laminate`` without copying.
+"""
+
+import math
+
+import numpy as np
+
+from .clt_py import (
+    calc_rotated_complianceMatrix,
+    calc_rotated_stiffnessMatrix,
+    calc_rotationElongationMatrix,
+    calc_rotationStressMatrix,
+    Ply,
+    _block_ABD,
+)
+
+
+class PlyTable:
+    def __init__(self, materials, rotations, thicknesses=1.0, material_indices=None):
+        """Plies stored as arrays.
+
+        The materials are stored once, every ply references its material
+        by index.
+
+        :param materials: materials of the plies
+        :type materials: list of Material2D
+        :param rotations: ply rotations in relation to laminate axis. \
+            Unit=[°], shape (n_plies,)
+        :type rotations: numpy.ndarray
+        :param thicknesses: ply thicknesses, broadcastable to ``rotations``, \
+            defaults to 1
+        :type thicknesses: {float, numpy.ndarray}, optional
+        :param material_indices: index into ``materials`` for every ply, \
+            broadcastable to ``rotations``, defaults to the first material
+        :type material_indices: numpy.ndarray, optional
+        :raises IndexError: material index out of range
+        """
+        super().__init__()
+        self.materials = list(materials)
+        self.rotRad = np.radians(np.asarray(rotations, dtype=float).ravel())
+        shape = self.rotRad.shape
+        self.thickness = np.array(np.broadcast_to(thicknesses, shape), dtype=float)
+        if material_indices is None:
+            material_indices = 0
+        self.material_indices = np.array(
+            np.broadcast_to(material_indices, shape), dtype=np.int32
+        )
+        if len(self) and (
+            self.material_indices.min() < 0
+            or self.material_indices.max() >= len(self.materials)
+        ):
+            raise IndexError("material index out of range")
+        self.update()
+
+    @classmethod
+    def from_plies(cls, plies):
+        """Table of existing plies.
+
+        :param plies: plies to store
+        :type plies: list of Ply
+        :rtype: PlyTable
+        """
+        plies = list(plies)
+        material_index = {}
+        for ply in plies:
+            material_index.setdefault(id(ply.mat), (len(material_index), ply.mat))
+        table = cls.__new__(cls)
+        table.materials = [mat for _, mat in material_index.values()]
+        table.rotRad = np.array([ply.rotRad for ply in plies], dtype=float)
+        table.thickness = np.array([ply.thickness for ply in plies], dtype=float)
+        table.material_indices = np.array(
+            [material_index[id(ply.mat)][0] for ply in plies], dtype=np.int32
+        )
+        table.update()
+        return table
+
+    def __len__(self):
+        return len(self.rotRad)
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("ply index out of range")
+        return PlyView(self, index % len(self))
+
+    def __iter__(self):
+        return (PlyView(self, index) for index in range(len(self)))
+
+    def subset(self, indices):
+        """Table of selected plies, sharing the materials.
+
+        The matrices of the plies are taken over, not recomputed.
+
+        :param indices: plies to select
+        :type indices: numpy.ndarray
+        :rtype: PlyTable
+        """
+        table = self.__class__.__new__(self.__class__)
+        table.materials = self.materials
+        table.rotRad = self.rotRad[indices]
+        table.thickness = self.thickness[indices]
+        table.material_indices = self.material_indices[indices]
+        table.Q = self.Q[indices]
+        table.S = self.S[indices]
+        return table
+
+    def update(self):
+        """Recalculate the stiffness and compliance matrices of all plies."""
+        U = np.array([mat.stiffnessInvariants for mat in self.materials], float)
+        W = np.array([mat.complianceInvariants for mat in self.materials], float)
+        U = U.reshape(-1, 5)[self.material_indices]
+        W = W.reshape(-1, 5)[self.material_indices]
+        self.Q = calc_rotated_stiffnessMatrix(U, self.rotRad).reshape(-1, 3, 3)
+        self.S = calc_rotated_complianceMatrix(W, self.rotRad).reshape(-1, 3, 3)
+
+    def set_rotations(self, rotations, indices=slice(None)):
+        """Change the rotation of plies.
+
+        :param rotations: new rotations. Unit=[°]
+        :type rotations: {float, numpy.ndarray}
+        :param indices: plies to change, defaults to all plies
+        :type indices: {slice, numpy.ndarray}, optional
+        """
+        self.rotRad[indices] = np.radians(rotations)
+        self.update()
+
+    @property
+    def E_1(self):
+        return 1 / self.S[:, 0, 0]
+
+    @property
+    def E_2(self):
+        return 1 / self.S[:, 1, 1]
+
+    @property
+    def G(self):
+        return 1 / self.S[:, 2, 2]
+
+    @property
+    def v_12(self):
+        return -self.E_1 * self.S[:, 0, 1]
+
+    @property
+    def nbytes(self):
+        """Memory of the ply arrays in bytes."""
+        return sum(
+            array.nbytes
+            for array in (
+                self.rotRad,
+                self.thickness,
+                self.material_indices,
+                self.Q,
+                self.S,
+            )
+        )
+
+
+class PlyView:
+    """Single ply of a ``PlyTable`` with the attributes of ``Ply``."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __repr__(self):
+        return "PlyView(index={}, rotation={:g}, thickness={:g})".format(
+            self.index, math.degrees(self.rotRad), self.thickness
+        )
+
+    @property
+    def mat(self):
+        return self.table.materials[self.table.material_indices[self.index]]
+
+    @property
+    def rotRad(self):
+        return float(self.table.rotRad[self.index])
+
+    @property
+    def thickness(self):
+        return float(self.table.thickness[self.index])
+
+    @property
+    def Q(self):
+        return self.table.Q[self.index]
+
+    @property
+    def S(self):
+        return self.table.S[self.index]
+
+    @property
+    def rotElongation(self):
+        return calc_rotationElongationMatrix(self.rotRad)
+
+    @property
+    def rotStress(self):
+        return calc_rotationStressMatrix(self.rotRad)
+
+    @property
+    def E_1(self):
+        return 1 / self.S[0, 0]
+
+    @property
+    def E_2(self):
+        return 1 / self.S[1, 1]
+
+    @property
+    def G(self):
+        return 1 / self.S[2, 2]
+
+    @property
+    def v_12(self):
+        return -self.E_1 * self.S[0, 1]
+
+    def to_ply(self):
+        """Independent ``Ply`` object of this ply.
+
+        :rtype: Ply
+        """
+        return Ply(
+            self.mat, thickness=self.thickness, rotation=math.degrees(self.rotRad)
+        )
+
+
+class LaminateTable:
+    def __init__(self, plies, offsets, move_reference_plane=True):
+        """Laminates stored as consecutive plies of a ``PlyTable``.
+
+        The plies of laminate ``k`` are ``plies[offsets[k]:offsets[k + 1]]``
+        and build the final stack from bottom to top, symmetric laminates
+        contain both halves.
+
+        :param plies: plies of all laminates
+        :type plies: PlyTable
+        :param offsets: start of every laminate in ``plies`` and the number \
+            of plies at the end, shape (n_laminates + 1,)
+        :type offsets: numpy.ndarray
+        :param move_reference_plane: reference plane in the middle of the \
+            laminates, broadcastable to (n_laminates,), defaults to True
+        :type move_reference_plane: {bool, numpy.ndarray}, optional
+        :raises ValueError: offsets not increasing from 0 to the number of plies
+        """
+        super().__init__()
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if (
+            offsets.ndim != 1
+            or len(offsets) < 1
+            or offsets[0] != 0
+            or offsets[-1] != len(plies)
+            or np.any(np.diff(offsets) < 0)
+        ):
+            raise ValueError("offsets must increase from 0 to the number of plies")
+        self.plies = plies
+        self.offsets = offsets
+        self.move_reference_plane = np.array(
+            np.broadcast_to(move_reference_plane, (len(offsets) - 1,)), dtype=bool
+        )
+        self.ABD = None
+
+    @classmethod
+    def from_laminates(cls, laminates):
+        """Table of the final stacks of existing laminates.
+
+        :param laminates: laminates to store
+        :type laminates: list of Laminate
+        :rtype: LaminateTable
+        """
+        laminates = list(laminates)
+        stacks = [laminate.get_finalStack() for laminate in laminates]
+        offsets = np.zeros(len(stacks) + 1, dtype=np.int64)
+        np.cumsum([len(stack) for stack in stacks], out=offsets[1:])
+        plies = PlyTable.from_plies(ply for stack in stacks for ply in stack)
+        return cls(
+            plies,
+            offsets,
+            [laminate.move_reference_plane for laminate in laminates],
+        )
+
+    @classmethod
+    def from_arrays(
+        cls,
+        materials,
+        rotations,
+        thicknesses=1.0,
+        material_indices=None,
+        move_reference_plane=True,
+    ):
+        """Table of laminates with the same number of plies.
+
+        :param materials: materials of the plies
+        :type materials: list of Material2D
+        :param rotations: ply rotations. Unit=[°], shape (n_laminates, n_plies)
+        :type rotations: numpy.ndarray
+        :param thicknesses: ply thicknesses, broadcastable to ``rotations``
+        :type thicknesses: {float, numpy.ndarray}, optional
+        :param material_indices: index into ``materials`` for every ply, \
+            broadcastable to ``rotations``, defaults to the first material
+        :type material_indices: numpy.ndarray, optional
+        :param move_reference_plane: reference plane in the middle of the \
+            laminates, defaults to True
+        :type move_reference_plane: {bool, numpy.ndarray}, optional
+        :rtype: LaminateTable
+        """
+        rotations = np.atleast_2d(np.asarray(rotations, dtype=float))
+        if rotations.ndim != 2:
+            raise ValueError("rotations must have shape (n_laminates, n_plies)")
+        n_laminates, n_plies = rotations.shape
+        if material_indices is None:
+            material_indices = 0
+        plies = PlyTable(
+            materials,
+            rotations,
+            np.broadcast_to(thicknesses, rotations.shape).ravel(),
+            np.broadcast_to(material_indices, rotations.shape).ravel(),
+        )
+        offsets = np.arange(n_laminates + 1, dtype=np.int64) * n_plies
+        return cls(plies, offsets, move_reference_plane)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError("laminate index out of range")
+        return LaminateView(self, index % len(self))
+
+    def __iter__(self):
+        return (LaminateView(self, index) for index in range(len(self)))
+
+    def subset(self, indices):
+        """Table of selected laminates, sharing the materials.
+
+        Ply matrices and computed ABD-matrices are taken over.
+
+        :param indices: laminates to select
+        :type indices: numpy.ndarray
+        :rtype: LaminateTable
+        """
+        indices = np.asarray(indices, dtype=np.int64).reshape(-1)
+        counts = self.get_plyCounts()[indices]
+        offsets = np.zeros(len(indices) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        ply_indices = np.arange(offsets[-1]) + np.repeat(
+            self.offsets[indices] - offsets[:-1], counts
+        )
+        table = LaminateTable(
+            self.plies.subset(ply_indices),
+            offsets,
+            self.move_reference_plane[indices],
+        )
+        if self.ABD is not None:
+            table.ABD = self.ABD[indices]
+        return table
+
+    def changed(self):
+        """Mark the stiffness matrices as outdated after changing plies."""
+        self.ABD = None
+
+    def get_plyCounts(self):
+        return np.diff(self.offsets)
+
+    def calc_z_positions(self):
+        """Upper and lower z-position of every ply.
+
+        :return: z_bot and z_top, shape (n_plies,) each
+        :rtype: tuple of numpy.ndarray
+        """
+        counts = self.get_plyCounts()
+        z_top = np.cumsum(self.plies.thickness)
+        z_start = np.concatenate([[0.0], z_top])[self.offsets[:-1]]
+        z_end = np.concatenate([[0.0], z_top])[self.offsets[1:]]
+        shift = z_start + np.where(self.move_reference_plane, (z_end - z_start) / 2, 0)
+        z_top = z_top - np.repeat(shift, counts)
+        return z_top - self.plies.thickness, z_top
+
+    def calc_completeStiffnessmatrices(self):
+        z_bot, z_top = self.calc_z_positions()
+        Q = self.plies.Q
+        contributions = [
+            np.einsum("k,kij->kij", z_top - z_bot, Q),
+            -0.5 * np.einsum("k,kij->kij", z_top**2 - z_bot**2, Q),
+            1 / 3 * np.einsum("k,kij->kij", z_top**3 - z_bot**3, Q),
+        ]
+
+        # segment sums, laminates without plies keep zero stiffness
+        filled = self.get_plyCounts() > 0
+        A, B, D = np.zeros((3, len(self), 3, 3))
+        for result, contribution in zip((A, B, D), contributions):
+            if np.any(filled):
+                result[filled] = np.add.reduceat(
+                    contribution, self.offsets[:-1][filled], axis=0
+                )
+        self.ABD = _block_ABD(A, B, D)
+
+    def get_stiffnessMatrices(self):
+        """Complete stiffness matrices (ABD-matrices) of all laminates.
+
+        :return: ABD-matrices, shape (n_laminates, 6, 6)
+        :rtype: numpy.ndarray
+        """
+        if self.ABD is None:
+            self.calc_completeStiffnessmatrices()
+        return self.ABD
+
+    @property
+    def nbytes(self):
+        """Memory of the laminate and ply arrays in bytes."""
+        nbytes = self.plies.nbytes
+        nbytes += self.offsets.nbytes + self.move_reference_plane.nbytes
+        if self.ABD is not None:
+            nbytes += self.ABD.nbytes
+        return nbytes
+
+
+class LaminateView:
+    """Single laminate of a ``LaminateTable`` with the getters of ``Laminate``."""
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table, index):
+        self.table = table
+        self.index = index
+
+    def __repr__(self):
+        return "LaminateView(index={}, plies={})".format(self.index, len(self))
+
+    def __len__(self):
+        return int(self.table.offsets[self.index + 1] - self.table.offsets[self.index])
+
+    @property
+    def move_reference_plane(self):
+        return bool(self.table.move_reference_plane[self.index])
+
+    def get_finalStack(self):
+        start = self.table.offsets[self.index]
+        return [self.table.plies[int(k)] for k in range(start, start + len(self))]
+
+    def get_z_positions(self):
+        start = self.table.offsets[self.index]
+        thickness = self.table.plies.thickness[start : start + len(self)]
+        z = np.concatenate([[0.0], np.cumsum(thickness)])
+        if self.move_reference_plane:
+            z -= z[-1] / 2
+        return list(z)
+
+    def get_stiffnessMatrix(self):
+        return self.table.get_stiffnessMatrices()[self.index]
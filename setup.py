@@ -33,6 +33,7 @@ setup(
         "Programming Language :: Python :: 3.7",
         "Programming Language :: Python :: 3.8",
     ],
+    entry_points={"console_scripts": ["clt-py=clt_py.cli:main"]},
     description="This packages provides methodes for calculating fiber-reinforced materials.",
     install_requires=requirements,
     license="MIT license",
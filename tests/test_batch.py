@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.batch` module."""
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.batch import *
+
+
+def materials():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    mat_FRM2 = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    return [mat_FRM, mat_FRM2, matMat]
+
+
+def object_ABD(rotations, thicknesses, mats, indices, symetric=False):
+    laminate = Laminate(symetric=symetric)
+    for rotation, thickness, index in zip(rotations, thicknesses, indices):
+        laminate.addPly(Ply(mats[index], thickness=thickness, rotation=rotation))
+    return laminate.get_stiffnessMatrix()
+
+
+@pytest.mark.parametrize("symetric", [False, True])
+def test_calc_ABD_matrices_matches_Laminate(symetric):
+    mats = materials()
+    rng = np.random.RandomState(0)
+    rotations = rng.choice([0, 45, -45, 90, 30], size=(5, 4))
+    thicknesses = rng.uniform(0.1, 2, size=(5, 4))
+    indices = rng.randint(0, len(mats), size=(5, 4))
+
+    ABD = calc_ABD_matrices(rotations, thicknesses, mats, indices, symetric=symetric)
+
+    assert ABD.shape == (5, 6, 6)
+    for k in range(5):
+        assert np.allclose(
+            ABD[k],
+            object_ABD(rotations[k], thicknesses[k], mats, indices[k], symetric),
+        )
+
+
+def test_calc_ABD_matrices_broadcast_thickness():
+    mats = materials()
+    ABD = calc_ABD_matrices([[0, 90, 0]], 1.0, mats[:1], move_reference_plane=False)
+    laminate = Laminate()
+    for rotation in [0, 90, 0]:
+        laminate.addPly(Ply(mats[0], rotation=rotation))
+    laminate.set_move_reference_plane(False)
+
+    assert np.allclose(ABD[0], laminate.get_stiffnessMatrix())
+
+
+def test_calc_ply_stiffnessMatrices():
+    mats = materials()
+    Q = calc_ply_stiffnessMatrices([0, 45, -30], mats)
+    for k, rotation in enumerate([0, 45, -30]):
+        assert np.allclose(Q[k], Ply(mats[0], rotation=rotation).Q)
+
+
+def test_calc_z_positions():
+    z = calc_z_positions([[1, 2, 1]])
+    assert np.array_equal(z, [[-2, -1, 1, 2]])
+    z = calc_z_positions([[1, 2, 1]], move_reference_plane=False)
+    assert np.array_equal(z, [[0, 1, 3, 4]])
+
+
+def test_calc_engineeringConstants():
+    mats = materials()
+    laminate = Laminate(symetric=True)
+    laminate.addPlies(Ply(mats[0], thickness=0.5, rotation=r) for r in [0, 90])
+    ABD = laminate.get_stiffnessMatrix()
+    a = np.linalg.inv(ABD[:3, :3])
+
+    constants = calc_engineeringConstants(np.stack([ABD, ABD]), [2, 2])
+    assert np.allclose(constants["E_x"], 1 / (2 * a[0, 0]))
+    assert np.allclose(constants["E_x"], constants["E_y"])
+    assert np.allclose(constants["v_xy"], -a[0, 1] / a[0, 0])
+
+    isotropic = calc_ABD_matrices([[0]], 2, [mats[2]])
+    constants = calc_engineeringConstants(isotropic, 2)
+    assert np.allclose(constants["E_x"], 1)
+    assert np.allclose(constants["G_xy"], 0.4)
+    assert np.allclose(constants["v_xy"], 0.25)
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.cache` module."""
+
+import numpy as np
+import pytest
+
+from clt_py.cache import LRUCache, ResultCache
+
+
+def test_LRUCache_eviction():
+    cache = LRUCache(maxsize=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+
+    assert "b" not in cache
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.info() == (2, 1, 2, 2)
+
+
+def test_LRUCache_invalidate():
+    cache = LRUCache()
+    cache.put("a", 1, tag="x")
+    cache.put("b", 2, tag="x")
+    cache.put("c", 3, tag="y")
+    cache.invalidate("x")
+
+    assert len(cache) == 1
+    assert cache.get("c") == 3
+    cache.clear()
+    assert cache.info() == (0, 0, 1024, 0)
+
+
+def test_LRUCache_disabled():
+    cache = LRUCache(maxsize=0)
+    cache.put("a", 1)
+    assert cache.get("a") is None
+
+
+def test_ResultCache_memory():
+    cache = ResultCache(maxsize=2)
+    value = cache.put("a", np.zeros((6, 6)))
+    with pytest.raises(ValueError):
+        value[0, 0] = 1
+    cache.put("b", np.zeros(3))
+    assert cache.info().nbytes == 36 * 8 + 3 * 8
+    cache.put("c", np.zeros(2))
+    assert cache.get("a") is None
+    assert cache.info() == (0, 1, 2, 2, 5 * 8, 0, 0)
+    cache.clear()
+    assert cache.info().nbytes == 0
+
+
+def test_ResultCache_disk(tmp_path):
+    cache = ResultCache(maxsize=1, directory=str(tmp_path / "cache"))
+    cache.put("a", np.arange(3.0))
+    cache.put("b", np.arange(4.0))
+    assert "a" not in cache
+    assert np.array_equal(cache.get("a"), np.arange(3.0))
+    assert cache.get("c") is None
+    info = cache.info()
+    assert (info.disk_hits, info.disk_misses, info.currsize) == (1, 1, 1)
+
+    other = ResultCache(directory=str(tmp_path / "cache"))
+    assert np.array_equal(other.get("b"), np.arange(4.0))
+    assert list(tmp_path.joinpath("cache").glob("*.npy")) != []
+    assert len(list(tmp_path.joinpath("cache").iterdir())) == 2
@@ -0,0 +1,211 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.cli` module."""
+
+import json
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.cli import *
+from clt_py.failure import MODES, evaluate_failure
+
+DEFINITIONS = {
+    "ud": {
+        "type": "fiber_reinforced",
+        "matFib": "fiber",
+        "matMat": "epoxy",
+        "fibVolRatio": 0.6,
+        "strength": [1, 0.8, 0.1, 0.3, 0.1],
+    },
+    "epoxy": {"type": "isotropic", "rho": 1, "E": 1, "v": 0.25},
+    "fiber": {
+        "type": "anisotropic",
+        "rho": 2,
+        "v_para_ortho": 0.25,
+        "E_para": 10,
+        "E_ortho": 2,
+        "G": 3,
+    },
+}
+
+
+def test_build_materials():
+    materials = build_materials(DEFINITIONS)
+    assert isinstance(materials["ud"], FiberReinforcedMaterialUD)
+    assert materials["ud"].matMat is materials["epoxy"]
+    assert materials["ud"].label == "ud"
+    assert list(materials["ud"].strength) == [1, 0.8, 0.1, 0.3, 0.1]
+    with pytest.raises(ValueError):
+        build_materials({"ud": dict(DEFINITIONS["ud"], matFib="test")})
+    with pytest.raises(ValueError):
+        build_materials({"test": {"type": "test"}})
+    for definitions in [
+        {"a": {"kind": "isotropic", "rho": 1}},
+        {"a": {"type": "isotropic", "rho": 1, "E": 1}},
+        {"a": {"type": "anisotropic", "rho": 1, "modulus": 1}},
+        {"ud": dict(DEFINITIONS["ud"], matMat="fiber"), "fiber": DEFINITIONS["fiber"]},
+        {"ud": {"type": "fiber_reinforced", "matFib": "fiber"}},
+    ]:
+        with pytest.raises(ValueError, match="'(a|ud)'"):
+            build_materials(definitions)
+
+
+def test_material_parameters():
+    materials = build_materials(DEFINITIONS)
+    parameters = material_parameters(materials)
+    assert set(parameters) == set(materials)
+    assert all(type(value) is MaterialParameters for value in parameters.values())
+    assert parameters["epoxy"].strength is None
+    records = [
+        parse_record({"rotations": "0/45", "materials": "ud", "N_x": 0.1}, 1),
+        parse_record({"rotations": "90", "materials": "epoxy"}, 2),
+    ]
+    assert evaluate_records(records, parameters) == evaluate_records(records, materials)
+
+
+def test_parse_record():
+    name, rotations, thicknesses, names, move_reference, load = parse_record(
+        {
+            "rotations": "0/45",
+            "thicknesses": "0.5",
+            "materials": "ud/epoxy",
+            "symetric": "true",
+            "N_x": "1",
+            "M_xy": "",
+        },
+        3,
+    )
+    assert name == "3"
+    assert rotations == [0, 45, 45, 0]
+    assert thicknesses == [0.5] * 4
+    assert names == ["ud", "epoxy", "epoxy", "ud"]
+    assert move_reference
+    assert load == [1, 0, 0, 0, 0, 0]
+
+    record = parse_record({"id": 0, "rotations": [0, 90], "materials": "ud"}, 1)
+    assert record[0] == 0
+    assert record[5] is None
+    with pytest.raises(ValueError):
+        parse_record({"rotations": "", "materials": "ud"}, 1)
+    with pytest.raises(ValueError):
+        parse_record({"rotations": "0/90", "thicknesses": "1/2/3"}, 1)
+
+
+def write_input(path):
+    records = [
+        {
+            "id": "a",
+            "rotations": [0, 45, 90],
+            "thicknesses": 0.5,
+            "materials": "ud",
+            "symetric": True,
+            "N_x": 1,
+            "N_xy": 0.1,
+        },
+        {
+            "id": "b",
+            "rotations": [30, -30],
+            "thicknesses": [1, 2],
+            "materials": ["ud", "epoxy"],
+            "move_reference": False,
+        },
+        {"id": "c", "rotations": [0], "materials": "ud", "M_x": 0.1},
+    ]
+    with open(path, "w") as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+    return records
+
+
+def expected_laminate(record, materials):
+    _, rotations, thicknesses, names, move_reference, load = parse_record(record, 0)
+    laminate = Laminate()
+    laminate.addPlies(
+        Ply(materials[name], thickness=thickness, rotation=rotation)
+        for rotation, thickness, name in zip(rotations, thicknesses, names)
+    )
+    laminate.set_move_reference_plane(move_reference)
+    return laminate, load
+
+
+@pytest.mark.parametrize("workers", [0, 2])
+def test_run_jsonl(tmp_path, workers):
+    materials = build_materials(DEFINITIONS)
+    records = write_input(tmp_path / "input.jsonl")
+
+    n_laminates = run(
+        materials,
+        str(tmp_path / "input.jsonl"),
+        str(tmp_path / "output.jsonl"),
+        chunk_size=2,
+        workers=workers,
+    )
+    assert n_laminates == 3
+    with open(tmp_path / "output.jsonl") as file:
+        rows = [json.loads(line) for line in file]
+
+    assert [row["id"] for row in rows] == ["a", "b", "c"]
+    for record, row in zip(records, rows):
+        laminate, load = expected_laminate(record, materials)
+        assert np.allclose(row["ABD"], laminate.get_stiffnessMatrix())
+        if load is None:
+            assert "reserveFactor" not in row
+        else:
+            failure = evaluate_failure(laminate, [load])
+            assert np.isclose(row["reserveFactor"], failure.reserveFactors[0])
+            assert row["criticalPly"] == failure.criticalPly[0]
+            assert row["criticalMode"] == "tsai_wu"
+    assert np.isclose(rows[2]["E_x"], materials["ud"].E_para)
+
+
+def test_main_csv(tmp_path):
+    with open(tmp_path / "materials.json", "w") as file:
+        json.dump(DEFINITIONS, file)
+    with open(tmp_path / "input.csv", "w") as file:
+        file.write("id,rotations,materials,N_x\n")
+        file.write("a,0/90,ud,1\n")
+        file.write("b,45,ud,\n")
+
+    assert (
+        main(
+            [
+                str(tmp_path / "materials.json"),
+                str(tmp_path / "input.csv"),
+                "-o",
+                str(tmp_path / "output.csv"),
+                "--criterion",
+                "max_stress",
+            ]
+        )
+        == 0
+    )
+    with open(tmp_path / "output.csv") as file:
+        lines = file.read().splitlines()
+    assert lines[0].split(",")[:2] == ["id", "ABD_11"]
+    assert len(lines[0].split(",")) == 1 + 36 + 4 + 3
+    assert lines[1].split(",")[-1] in MODES["max_stress"]
+    assert lines[2].endswith(",,,")
+
+    with open(tmp_path / "input.csv", "a") as file:
+        file.write("c,0,test,\n")
+    with pytest.raises(SystemExit):
+        main([str(tmp_path / "materials.json"), str(tmp_path / "input.csv")])
+
+
+@pytest.mark.parametrize(
+    "definitions",
+    [{"a": {"kind": "isotropic", "rho": 1}}, {"a": {"type": "isotropic", "E": 1}}],
+)
+def test_main_malformed_materials(tmp_path, capsys, definitions):
+    with open(tmp_path / "materials.json", "w") as file:
+        json.dump(definitions, file)
+    with open(tmp_path / "input.csv", "w") as file:
+        file.write("id,rotations,materials\na,0,a\n")
+
+    with pytest.raises(SystemExit) as exit_info:
+        main([str(tmp_path / "materials.json"), str(tmp_path / "input.csv")])
+    assert exit_info.value.code == 1
+    assert "clt-py: error: " in capsys.readouterr().err
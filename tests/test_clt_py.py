@@ -2,6 +2,13 @@
 
 """Tests for `clt_py` package."""
 
+import concurrent.futures
+import gc
+import pickle
+import subprocess
+import sys
+import threading
+
 import pytest
 
 
@@ -487,3 +494,574 @@ def test_Laminate_stiffnessMatrix_antimetric_middle_layer():
         lam_matrix[x, y] = 1
 
     assert np.array_equal(lam_matrix, compare_matrix)
+
+
+def test_Laminate_stiffnessMatrix_matches_ply_loop():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    laminate = Laminate()
+    for rotation, thickness in [(0, 1), (45, 0.5), (-30, 2), (90, 1.5), (15, 0.25)]:
+        laminate.addPly(Ply(mat_FRM, rotation=rotation, thickness=thickness))
+    laminate.set_move_reference_plane(False)
+
+    z = laminate.get_z_positions()
+    A = np.zeros((3, 3))
+    B = np.zeros((3, 3))
+    D = np.zeros((3, 3))
+    for k_ply, ply in enumerate(laminate.get_finalStack()):
+        A += ply.Q * (z[k_ply + 1] - z[k_ply])
+        B += -ply.Q * 0.5 * (z[k_ply + 1] ** 2 - z[k_ply] ** 2)
+        D += ply.Q / 3 * (z[k_ply + 1] ** 3 - z[k_ply] ** 3)
+
+    assert np.allclose(laminate.get_stiffnessMatrix(), np.block([[A, B], [B, D]]))
+    assert Laminate().get_stiffnessMatrix().shape == (6, 6)
+
+
+def test_Laminate_lazy():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    plies = [Ply(mat_FRM, rotation=r, thickness=t) for r, t in [(0, 1), (45, 2)]]
+    plyCore = Ply(matMat, thickness=5)
+
+    laminate_eager = Laminate(symetric=True)
+    for ply in plies:
+        laminate_eager.addPly(ply)
+    laminate_eager.addCore(plyCore)
+
+    laminate_lazy = Laminate(symetric=True, lazy=True)
+    laminate_lazy.addPlies(plies)
+    laminate_lazy.addCore(plyCore)
+    assert laminate_lazy.dirty
+
+    assert np.allclose(
+        laminate_lazy.get_stiffnessMatrix(), laminate_eager.get_stiffnessMatrix()
+    )
+    assert not laminate_lazy.dirty
+    assert laminate_lazy.get_z_positions() == laminate_eager.get_z_positions()
+    assert laminate_lazy.get_finalStack() == laminate_eager.get_finalStack()
+
+    laminate_lazy.set_move_reference_plane(False)
+    assert laminate_lazy.dirty
+    laminate_lazy.set_lazy(False)
+    assert not laminate_lazy.dirty
+    assert laminate_lazy.z_position[0] == 0
+
+
+def test_Laminate_addPlies_single_update():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+
+    laminate = Laminate()
+    calls = []
+    calc = laminate.calc_completeStiffnessmatrix
+    laminate.calc_completeStiffnessmatrix = lambda: calls.append(calc())
+    laminate.addPlies(Ply(matMat) for _ in range(10))
+
+    assert len(calls) == 1
+    assert len(laminate.get_finalStack()) == 10
+    with pytest.raises(TypeError):
+        laminate.addPlies([Ply(matMat), matMat])
+    assert len(laminate.get_finalStack()) == 10
+
+
+def test_Laminate_incremental_ply_update():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    ply0 = Ply(mat_FRM, rotation=0, thickness=1)
+    ply45 = Ply(mat_FRM, rotation=45, thickness=0.5)
+    plyCore = Ply(matMat, thickness=3)
+
+    laminate = Laminate(symetric=True)
+    laminate.addPlies([ply0, ply45, ply0])
+    laminate.addCore(plyCore)
+    other = Laminate()
+    other.addPly(Ply(mat_FRM))
+    other_ABD = other.get_stiffnessMatrix()
+
+    ply0.set_rotation(30)
+    ply45.set_thickness(2)
+    plyCore.set_rotation(10)
+
+    reference = Laminate(symetric=True)
+    reference.addPlies(
+        [
+            Ply(mat_FRM, rotation=30, thickness=1),
+            Ply(mat_FRM, rotation=45, thickness=2),
+            Ply(mat_FRM, rotation=30, thickness=1),
+        ]
+    )
+    reference.addCore(Ply(matMat, thickness=3, rotation=10))
+
+    assert np.allclose(laminate.get_stiffnessMatrix(), reference.get_stiffnessMatrix())
+    assert np.allclose(laminate.get_z_positions(), reference.get_z_positions())
+    assert other.get_stiffnessMatrix() is other_ABD
+
+
+def test_MaterialRegistry_weak_references():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    gc.collect()
+    n_materials = len(GLOBAL_FRM_REGISTRY)
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    assert len(GLOBAL_FRM_REGISTRY) == n_materials + 1
+    assert mat_FRM in list(GLOBAL_FRM_REGISTRY)
+
+    del mat_FRM
+    gc.collect()
+    assert len(GLOBAL_FRM_REGISTRY) == n_materials
+
+
+def test_MaterialRegistry_scope():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    FiberReinforcedMaterialUD.set_system("hsb")
+    outside = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    with GLOBAL_FRM_REGISTRY.scope() as scope:
+        inside = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+        assert list(scope) == [inside]
+        FiberReinforcedMaterialUD.set_system("prismatic_jones")
+        assert inside.E_para == 5.5
+        assert round(outside.E_ortho, 3) != round(inside.E_ortho, 3)
+    assert GLOBAL_FRM_REGISTRY.current() is GLOBAL_FRM_REGISTRY
+
+    FiberReinforcedMaterialUD.set_system("prismatic_jones", scope=[outside])
+    assert round(outside.E_ortho, 3) == round(inside.E_ortho, 3)
+
+
+def test_MaterialRegistry_scope_threads():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+    barrier = threading.Barrier(2)
+
+    def job(system):
+        with GLOBAL_FRM_REGISTRY.scope() as scope:
+            # both scopes are active while the materials are created
+            barrier.wait()
+            mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+            barrier.wait()
+            FiberReinforcedMaterialUD.set_system(system)
+            barrier.wait()
+            return list(scope) == [mat_FRM], mat_FRM.system
+
+    FiberReinforcedMaterialUD.set_system("hsb")
+    systems = ["hsb", "prismatic_jones"]
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(job, systems))
+    assert results == [(True, system) for system in systems]
+    assert FiberReinforcedMaterialUD.system == "hsb"
+
+
+def test_FiberReinforcedMaterialUD_lazy_system():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    FiberReinforcedMaterialUD.set_system("hsb")
+    following = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    pinned = FiberReinforcedMaterialUD(
+        matFib=matFib, matMat=matMat, system="prismatic_jones"
+    )
+    assert pinned.E_para == 5.5
+    E_ortho_hsb = following.E_ortho
+
+    FiberReinforcedMaterialUD.set_system("prismatic_jones")
+    assert following.__dict__["computed_system"] == "hsb"
+    assert following.E_para == 5.5
+    assert following.__dict__["computed_system"] == "prismatic_jones"
+    FiberReinforcedMaterialUD.set_system("hsb")
+    assert pinned.system == "prismatic_jones"
+    assert round(pinned.E_ortho, 3) != round(E_ortho_hsb, 3)
+
+    pinned.set_instanceSystem(None)
+    assert pinned.E_ortho == E_ortho_hsb
+    with pytest.raises(ValueError):
+        pinned.set_instanceSystem("test")
+
+
+def test_FiberReinforcedMaterialUD_use_system():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    def stiffness(system):
+        with FiberReinforcedMaterialUD.use_system(system):
+            mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+        ply = Ply(mat_FRM, thickness=1, rotation=30)
+        return ply.Q
+
+    FiberReinforcedMaterialUD.set_system("hsb")
+    expected = {
+        system: Ply(
+            FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, system=system),
+            thickness=1,
+            rotation=30,
+        ).Q
+        for system in FiberReinforcedMaterialUD.possible_systems
+    }
+    assert not np.allclose(expected["hsb"], expected["prismatic_jones"])
+
+    systems = FiberReinforcedMaterialUD.possible_systems * 50
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(stiffness, systems))
+    for system, result in zip(systems, results):
+        assert np.allclose(result, expected[system])
+    assert FiberReinforcedMaterialUD.system == "hsb"
+
+
+def test_Ply_stiffness_cache():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    PLY_STIFFNESS_CACHE.clear()
+    ply = Ply(mat_FRM, rotation=45)
+    ply2 = Ply(mat_FRM, rotation=45, thickness=2)
+    assert PLY_STIFFNESS_CACHE.info()[:2] == (1, 1)
+    assert ply2.Q is ply.Q
+    for name in ("Q", "S", "rotStress", "rotElongation", "alpha", "beta"):
+        with pytest.raises(ValueError):
+            getattr(ply, name)[0] = 1
+    # a copy changes a single ply only
+    ply.Q = ply.Q.copy()
+    ply.Q[0, 0] = 1
+    assert ply2.Q[0, 0] != 1
+    ply.update()
+    assert ply.Q is ply2.Q
+
+    mat_FRM.set_fibVolRatio(0.6)
+    assert len(PLY_STIFFNESS_CACHE) == 0
+    ply2.update()
+    assert not np.allclose(ply2.Q, ply.Q)
+    assert PLY_STIFFNESS_CACHE.info()[:2] == (2, 2)
+
+
+def test_Ply_stiffness_cache_pickled_material():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    # a fresh process, like the workers of a process pool, creates materials
+    # before it receives the pickled one
+    script = (
+        "import pickle, sys\n"
+        "from clt_py.clt_py import *\n"
+        "materials = [IsotropicMaterial(rho=1, E=1, v=0.3) for _ in range(5)]\n"
+        "plies = [Ply(material, rotation=30) for material in materials]\n"
+        "mat_FRM = pickle.loads(sys.stdin.buffer.read())\n"
+        "print(Ply(mat_FRM, rotation=30).Q[0, 0])\n"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        input=pickle.dumps(mat_FRM),
+        stdout=subprocess.PIPE,
+        check=True,
+    ).stdout
+    assert float(output) == pytest.approx(Ply(mat_FRM, rotation=30).Q[0, 0])
+
+
+def test_Ply_closed_form_matches_rotation_matrices():
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    rotRad = np.radians(np.linspace(-180, 180, 37))
+    rotStress = calc_rotationStressMatrix(rotRad)
+    rotElongation = calc_rotationElongationMatrix(rotRad)
+    Q = np.matmul(
+        rotStress, np.matmul(matFib.stiffnessMatrix, np.linalg.inv(rotElongation))
+    )
+    S = np.matmul(
+        rotElongation, np.matmul(matFib.complianceMatrix, np.linalg.inv(rotStress))
+    )
+
+    assert np.allclose(
+        calc_rotated_stiffnessMatrix(matFib.stiffnessInvariants, rotRad), Q
+    )
+    assert np.allclose(
+        calc_rotated_complianceMatrix(matFib.complianceInvariants, rotRad), S
+    )
+
+
+def test_Ply_calc_matrices():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25, alpha=2e-5, beta=1e-3)
+    matFib = AnisotropicMaterial(
+        rho=2,
+        v_para_ortho=0.25,
+        E_para=10,
+        E_ortho=2,
+        G=3,
+        alpha=[-1e-6, 1e-5],
+        beta=[0, 2e-4],
+    )
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    for material in (mat_FRM, matMat):
+        for rotation in (-90, -45, 0, 30, 77, 90):
+            ply = Ply(material, rotation=rotation)
+            rotElongation = calc_rotationElongationMatrix(ply.rotRad)
+            expected = (
+                rotElongation,
+                calc_rotationStressMatrix(ply.rotRad),
+                calc_rotated_stiffnessMatrix(material.stiffnessInvariants, ply.rotRad),
+                calc_rotated_complianceMatrix(
+                    material.complianceInvariants, ply.rotRad
+                ),
+                rotElongation @ material.alpha,
+                rotElongation @ material.beta,
+            )
+            for result, value in zip(ply.calc_matrices(), expected):
+                assert result.shape == value.shape
+                assert not result.flags.writeable
+                atol = 1e-12 * np.abs(value).max()
+                assert np.allclose(result, value, rtol=1e-12, atol=atol)
+
+
+def test_Laminate_laminationParameters():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    laminate = Laminate()
+    for rotation, thickness in [(0, 1), (45, 0.5), (-30, 2), (90, 1.5)]:
+        laminate.addPly(Ply(mat_FRM, rotation=rotation, thickness=thickness))
+
+    for move_reference_plane in [True, False]:
+        laminate.set_move_reference_plane(move_reference_plane)
+        z = laminate.get_z_positions()
+        ABD = calc_ABD_from_laminationParameters(
+            laminate.get_stiffnessInvariants(),
+            z[-1] - z[0],
+            laminate.get_laminationParameters(),
+            offset=(z[-1] + z[0]) / 2,
+        )
+        assert np.allclose(ABD, laminate.get_stiffnessMatrix())
+
+    quasi_isotropic = Laminate(symetric=True)
+    quasi_isotropic.addPlies(Ply(mat_FRM, rotation=r) for r in [0, 45, -45, 90])
+    xi = quasi_isotropic.get_laminationParameters()
+    assert np.allclose(xi[0:2], 0)
+    assert not np.allclose(xi[2], 0)
+
+    laminate.addPly(Ply(matMat))
+    with pytest.raises(ValueError):
+        laminate.get_laminationParameters()
+
+
+def test_calc_ABD_from_laminationParameters_batch():
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    xi = np.random.RandomState(1).uniform(-1, 1, size=(7, 3, 4))
+    ABD = calc_ABD_from_laminationParameters(matFib.stiffnessInvariants, 2.0, xi)
+
+    assert ABD.shape == (7, 6, 6)
+    assert np.allclose(
+        ABD[3],
+        calc_ABD_from_laminationParameters(matFib.stiffnessInvariants, 2.0, xi[3]),
+    )
+
+
+def test_Laminate_hash_and_cache():
+    def build(E_ortho=2, rotation=45, symetric=True):
+        matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+        matFib = AnisotropicMaterial(
+            rho=2, v_para_ortho=0.25, E_para=10, E_ortho=E_ortho, G=3
+        )
+        mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+        laminate = Laminate(symetric=symetric)
+        laminate.addPly(Ply(mat_FRM, rotation=0))
+        laminate.addPly(Ply(mat_FRM, rotation=rotation, thickness=0.5))
+        return laminate
+
+    laminate = build()
+    hits = LAMINATE_CACHE.info().hits
+    same = build()
+    assert same.get_hash() == laminate.get_hash()
+    assert LAMINATE_CACHE.info().hits > hits
+    assert same.get_stiffnessMatrix() is laminate.get_stiffnessMatrix()
+    assert LAMINATE_CACHE.info().nbytes > 0
+
+    assert build(E_ortho=3).get_hash() != laminate.get_hash()
+    assert build(rotation=-45).get_hash() != laminate.get_hash()
+    assert build(symetric=False).get_hash() != laminate.get_hash()
+    moved = build()
+    moved.set_move_reference_plane(False)
+    assert moved.get_hash() != laminate.get_hash()
+
+    ABD = same.get_stiffnessMatrix()
+    same.finalStack[1].set_thickness(1)
+    assert same.get_hash() != laminate.get_hash()
+    assert not np.allclose(same.get_stiffnessMatrix(), ABD)
+    with pytest.raises(ValueError):
+        laminate.get_stiffnessMatrix()[0, 0] = 0
+
+
+def test_Laminate_hash_stale_ply():
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+
+    def build(plies):
+        laminate = Laminate()
+        laminate.addPlies(plies)
+        return laminate
+
+    def plies(material):
+        return [Ply(material, rotation=0), Ply(material, rotation=45)]
+
+    def expected(laminate):
+        plies = laminate.get_finalStack()
+        return calc_ABD_matrix([ply.Q for ply in plies], laminate.get_z_positions())
+
+    # plies keep the matrices of the material state they were built with
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.3)
+    stale = plies(mat_FRM)
+    mat_FRM.set_fibVolRatio(0.6)
+    stale = build(stale)
+    fresh = build(plies(mat_FRM))
+    assert fresh.get_hash() != stale.get_hash()
+    assert np.allclose(fresh.get_stiffnessMatrix(), expected(fresh))
+
+    # lazily recomputed materials after a change of the class-wide model
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    stale = plies(mat_FRM)
+    try:
+        FiberReinforcedMaterialUD.set_system("prismatic_jones")
+        stale = build(stale)
+        fresh = build(plies(mat_FRM))
+        assert np.allclose(fresh.get_stiffnessMatrix(), expected(fresh))
+    finally:
+        FiberReinforcedMaterialUD.set_system("hsb")
+
+
+def test_expansion_coefficients():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25, alpha=6e-5, beta=3e-3)
+    matFib = AnisotropicMaterial(
+        rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3, alpha=[-1e-6, 1e-5]
+    )
+    assert np.allclose(matMat.alpha, [6e-5, 6e-5, 0])
+    assert np.allclose(matFib.beta, 0)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    # stiff fibers restrain the expansion parallel to them
+    assert matFib.alpha[0] < mat_FRM.alpha[0] < matMat.alpha[0]
+    assert mat_FRM.alpha[1] > mat_FRM.alpha[0]
+    assert mat_FRM.beta[0] < mat_FRM.beta[1] < matMat.beta[1] * 2
+    alpha = mat_FRM.alpha.copy()
+    mat_FRM.set_fibVolRatio(0.6)
+    assert mat_FRM.alpha[0] < alpha[0]
+
+    ply = Ply(mat_FRM, rotation=90)
+    assert np.allclose(ply.alpha, mat_FRM.alpha[[1, 0, 2]])
+    ply.set_rotation(45)
+    # free strains of the rotated ply equal those of the compliance matrix
+    strains = ply.S @ ply.Q @ ply.alpha
+    assert np.allclose(strains, ply.alpha)
+    assert ply.alpha[0] == pytest.approx(mat_FRM.alpha[:2].mean())
+    assert abs(ply.alpha[2]) == pytest.approx(np.ptp(mat_FRM.alpha[:2]))
+
+
+def test_Laminate_hygrothermalResultants():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25, alpha=6e-5, beta=3e-3)
+    matFib = AnisotropicMaterial(
+        rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3, alpha=[-1e-6, 1e-5]
+    )
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    # isotropic plies expand freely without curvature
+    isotropic = Laminate()
+    isotropic.addPlies([Ply(matMat, thickness=1), Ply(matMat, thickness=2)])
+    deformations = (
+        isotropic.get_complianceMatrix() @ isotropic.get_hygrothermalLoads(2.0, 1.0).T
+    )
+    assert np.allclose(deformations[:, 0], [2 * 6e-5 + 3e-3] * 2 + [0, 0, 0, 0])
+
+    laminate = Laminate()
+    laminate.addPlies(
+        [Ply(mat_FRM, rotation=0), Ply(mat_FRM, rotation=90, thickness=0.5)]
+    )
+    unit = laminate.get_hygrothermalResultants()
+    assert unit.shape == (2, 6)
+    # unsymmetric laminates bend
+    assert np.any(np.abs(unit[:, 3:]) > 1e-12)
+    assert laminate.get_hygrothermalResultants() is unit
+    deltaT = np.linspace(-150, 80, 5)
+    loads = laminate.get_hygrothermalLoads(deltaT, 0.01)
+    assert loads.shape == (5, 6)
+    assert np.allclose(loads, deltaT[:, None] * unit[0] + 0.01 * unit[1])
+
+    # expansion coefficients are part of the hash
+    other = FiberReinforcedMaterialUD(
+        matFib=matFib, matMat=IsotropicMaterial(rho=1, E=1, v=0.25)
+    )
+    same_stiffness = Laminate()
+    same_stiffness.addPlies(
+        [Ply(other, rotation=0), Ply(other, rotation=90, thickness=0.5)]
+    )
+    assert np.allclose(
+        same_stiffness.get_stiffnessMatrix(), laminate.get_stiffnessMatrix()
+    )
+    assert same_stiffness.get_hash() != laminate.get_hash()
+    assert not np.allclose(same_stiffness.get_hygrothermalResultants(), unit)
+
+
+def test_Laminate_complianceMatrix_and_constants():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    isotropic = Laminate(symetric=True)
+    isotropic.addPly(Ply(matMat, thickness=2))
+    for constants in [
+        isotropic.get_membraneConstants(),
+        isotropic.get_flexuralConstants(),
+    ]:
+        assert constants["E_x"] == pytest.approx(1)
+        assert constants["E_y"] == pytest.approx(1)
+        assert constants["G_xy"] == pytest.approx(0.4)
+        assert constants["v_xy"] == pytest.approx(0.25)
+
+    for symetric in [True, False]:
+        laminate = Laminate(symetric=symetric)
+        laminate.addPlies(Ply(mat_FRM, rotation=r) for r in [0, 45, 90])
+        ABD = laminate.get_stiffnessMatrix()
+        abd = laminate.get_complianceMatrix()
+        assert np.allclose(abd, np.linalg.inv(ABD))
+        assert laminate.get_complianceMatrix() is abd
+        L = laminate.get_choleskyFactor()
+        assert np.allclose(L, np.tril(L))
+        assert np.allclose(L @ L.T, ABD)
+
+        h = laminate.get_thickness()
+        constants = laminate.get_effectiveConstants()
+        assert constants[0, 0] == pytest.approx(1 / (h * abd[0, 0]))
+        assert constants[1, 2] == pytest.approx(12 / (h**3 * abd[5, 5]))
+        assert constants[1, 3] == pytest.approx(-abd[3, 4] / abd[3, 3])
+
+    laminate.addPly(Ply(mat_FRM, rotation=30))
+    assert not np.allclose(laminate.get_complianceMatrix(), abd)
+    assert np.allclose(
+        laminate.get_complianceMatrix(),
+        np.linalg.inv(laminate.get_stiffnessMatrix()),
+    )
+    laminate.finalStack[0].set_rotation(10)
+    assert np.allclose(
+        laminate.get_complianceMatrix(),
+        np.linalg.inv(laminate.get_stiffnessMatrix()),
+    )
+
+    moved = Laminate(symetric=True)
+    moved.addPly(Ply(mat_FRM, rotation=45))
+    moved.set_move_reference_plane(False)
+    assert not moved.is_decoupled()
+    assert np.allclose(
+        moved.get_complianceMatrix(), np.linalg.inv(moved.get_stiffnessMatrix())
+    )
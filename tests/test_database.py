@@ -0,0 +1,159 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.database` module."""
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.database import *
+from clt_py.table import LaminateTable
+
+
+def laminates():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25, label="matrix")
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+    mat_FRM = FiberReinforcedMaterialUD(
+        matFib=matFib, matMat=matMat, system="prismatic_jones"
+    )
+    mat_FRM.set_strength(1, 2, 3, 4, 5)
+
+    symetric = Laminate(symetric=True)
+    symetric.addPly(Ply(mat_FRM, thickness=0.5, rotation=30))
+    symetric.addCore(Ply(matMat, thickness=3))
+    cored = Laminate()
+    cored.addPly(Ply(mat_FRM, rotation=45))
+    cored.addCore(Ply(matMat))
+    cored.addPly(Ply(mat_FRM, thickness=0.5, rotation=-45))
+    cored.set_move_reference_plane(False)
+    return [symetric, cored, Laminate()]
+
+
+def test_write_and_load_laminates(tmp_path):
+    path = tmp_path / "laminates.cltdb"
+    original = laminates()
+    write_database(path, original)
+
+    with open_database(path) as database:
+        assert len(database) == 3
+        assert isinstance(database.laminates, np.memmap)
+        assert len(database.materials) == 3
+        assert len(database.plies) == 6
+        for k, laminate in enumerate(original):
+            assert np.allclose(
+                database.get_stiffnessMatrix(k), laminate.get_stiffnessMatrix()
+            )
+            loaded = database.load_laminate(k)
+            assert np.allclose(
+                loaded.get_stiffnessMatrix(), laminate.get_stiffnessMatrix()
+            )
+            assert loaded.symetric == laminate.symetric
+            assert loaded.core == laminate.core
+            assert len(loaded.stack) == len(laminate.stack)
+            assert len(loaded.stack2) == len(laminate.stack2)
+            assert loaded.move_reference_plane == laminate.move_reference_plane
+        assert np.allclose(database.get_z_positions(1), original[1].get_z_positions())
+        assert np.allclose(database.get_rotations(0), [30, 0, 30])
+
+        mat_FRM = database.load_laminate(0).get_finalStack()[0].mat
+        assert mat_FRM is database.load_material(database.plies["material"][0])
+        assert mat_FRM.system == "prismatic_jones"
+        assert mat_FRM.E_para == 5.5
+        assert list(mat_FRM.strength) == [1, 2, 3, 4, 5]
+        assert mat_FRM.matMat.label == "matrix"
+        assert mat_FRM.matMat.strength is None
+
+
+def test_write_and_load_hygrothermal(tmp_path):
+    path = tmp_path / "hygrothermal.cltdb"
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25, alpha=6e-5, beta=3e-3)
+    matFib = AnisotropicMaterial(
+        rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3, alpha=[-1e-6, 1e-5]
+    )
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    laminate = Laminate()
+    laminate.addPlies(
+        [Ply(mat_FRM, rotation=0), Ply(mat_FRM, rotation=90), Ply(matMat)]
+    )
+    write_database(path, [laminate])
+
+    with open_database(path) as database:
+        loaded = database.load_laminate(0)
+        assert np.allclose(
+            loaded.get_hygrothermalResultants(),
+            laminate.get_hygrothermalResultants(),
+            rtol=1e-12,
+            atol=0,
+        )
+        loaded_FRM = loaded.get_finalStack()[0].mat
+        assert np.allclose(loaded_FRM.matFib.alpha, [-1e-6, 1e-5, 0])
+        assert np.allclose(loaded_FRM.matMat.beta, [3e-3, 3e-3, 0])
+
+
+def test_write_and_load_labels_and_systems(tmp_path):
+    path = tmp_path / "materials.cltdb"
+    # "ö" takes two bytes and is cut at byte 32
+    label = "a" * 31 + "ö"
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25, label=label)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+    default = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    own = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, system="hsb")
+    write_database(path, [], materials=[default, own])
+
+    with open_database(path) as database:
+        loaded = [database.load_material(k) for k in range(len(database.materials))]
+    assert loaded[1].label == "a" * 31
+    try:
+        FiberReinforcedMaterialUD.set_system("prismatic_jones")
+        assert loaded[2].system == "prismatic_jones"
+        assert loaded[3].system == "hsb"
+    finally:
+        FiberReinforcedMaterialUD.set_system("hsb")
+
+
+def test_write_LaminateTable(tmp_path):
+    path = tmp_path / "table.cltdb"
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    table = LaminateTable.from_arrays(
+        [mat_FRM, matMat], [[0, 45, 90], [90, 0, 45]], 0.25, [0, 1, 0]
+    )
+    write_database(path, table)
+
+    database = open_database(path)
+    assert np.allclose(database.get_stiffnessMatrices(), table.get_stiffnessMatrices())
+    assert np.allclose(database.get_z_positions(1), table[1].get_z_positions())
+    loaded = database.load_laminate(1)
+    assert np.allclose(loaded.get_stiffnessMatrix(), table[1].get_stiffnessMatrix())
+    assert loaded.get_finalStack()[1].mat.E_para == 1
+
+
+def test_open_database_errors(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_bytes(b"no database")
+    with pytest.raises(DatabaseFormatError):
+        open_database(path)
+
+    write_database(path, [])
+    header = np.fromfile(path, dtype=HEADER_DTYPE)
+    header["version"] = FORMAT_VERSION + 1
+    header.tofile(path)
+    with pytest.raises(DatabaseFormatError):
+        open_database(path)
+
+
+def test_open_truncated_database(tmp_path):
+    path = tmp_path / "truncated.cltdb"
+    write_database(path, laminates())
+    data = path.read_bytes()
+    with open_database(path) as database:
+        assert len(database) == 3
+
+    path.write_bytes(data[:-1])
+    with pytest.raises(DatabaseFormatError):
+        open_database(path)
+    path.write_bytes(data[: HEADER_DTYPE.itemsize + 10])
+    with pytest.raises(DatabaseFormatError):
+        open_database(path)
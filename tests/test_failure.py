@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.failure` module."""
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.failure import *
+
+STRENGTH = np.array([1500.0, 1200.0, 50.0, 200.0, 80.0])
+
+
+@pytest.mark.parametrize("criterion", sorted(CRITERIA))
+def test_criteria_uniaxial_strength(criterion):
+    R_para_t, R_para_c, R_ortho_t, R_ortho_c, R_shear = STRENGTH
+    stresses = np.array(
+        [
+            [R_para_t, 0, 0],
+            [-R_para_c, 0, 0],
+            [0, R_ortho_t, 0],
+            [0, -R_ortho_c, 0],
+            [0, 0, R_shear],
+            [0, 0, -R_shear],
+        ]
+    )
+    reserveFactors = CRITERIA[criterion](stresses, STRENGTH)
+
+    assert reserveFactors.shape == (6, len(MODES[criterion]))
+    assert np.allclose(reserveFactors.min(axis=-1), 1)
+    assert np.allclose(CRITERIA[criterion](stresses / 2, STRENGTH).min(axis=-1), 2)
+    assert np.all(np.isinf(CRITERIA[criterion](np.zeros(3), STRENGTH)))
+
+
+def test_max_stress_modes():
+    reserveFactors = max_stress([[100, -50, 0]], STRENGTH)
+    assert reserveFactors[0, 0] == 15
+    assert reserveFactors[0, 3] == 4
+    assert np.isinf(reserveFactors[0, [1, 2, 4]]).all()
+
+
+def laminate_with_strength():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    mat_FRM.set_strength(*STRENGTH)
+
+    laminate = Laminate(symetric=True)
+    laminate.addPlies(Ply(mat_FRM, rotation=r) for r in [0, 90])
+    return laminate
+
+
+def test_evaluate_failure_critical_ply_and_mode():
+    laminate = laminate_with_strength()
+    loads = np.array([[1, 0, 0, 0, 0, 0], [0, 1, 0, 0, 0, 0], [-1, 0, 0, 0, 0, 0]])
+
+    result = evaluate_failure(laminate, loads, criterion="max_stress")
+
+    assert result.criticalPly[0] in (1, 2)
+    assert result.modes[result.criticalMode[0]] == "matrix_tension"
+    assert result.criticalPly[1] in (0, 3)
+    assert result.modes[result.criticalMode[2]] == "matrix_compression"
+
+    # reserve factor scales the load to failure
+    unity = evaluate_failure(
+        laminate, loads * result.reserveFactors[:, None], criterion="max_stress"
+    )
+    assert np.allclose(unity.reserveFactors, 1)
+
+
+@pytest.mark.parametrize("criterion", sorted(CRITERIA))
+def test_evaluate_failure_chunks(criterion):
+    laminate = laminate_with_strength()
+    loads = np.random.RandomState(4).uniform(-100, 100, size=(25, 6))
+
+    result = evaluate_failure(laminate, loads, criterion=criterion)
+    chunked = evaluate_failure(laminate, loads, criterion=criterion, chunk_size=7)
+
+    for a, b in zip(result[:3], chunked[:3]):
+        assert np.array_equal(a, b)
+
+
+def test_evaluate_failure_errors():
+    laminate = laminate_with_strength()
+    with pytest.raises(ValueError):
+        evaluate_failure(laminate, np.zeros((1, 6)), criterion="test")
+    laminate.addCore(Ply(IsotropicMaterial(rho=1, E=1, v=0.25)))
+    with pytest.raises(ValueError):
+        evaluate_failure(laminate, np.zeros((1, 6)))
+    with pytest.raises(ValueError):
+        IsotropicMaterial(rho=1, E=1, v=0.25).set_strength(1, 1, 0, 1, 1)
+
+
+@pytest.mark.parametrize("criterion", sorted(CRITERIA))
+def test_evaluate_table_failure(criterion):
+    from clt_py.table import LaminateTable
+
+    laminate = laminate_with_strength()
+    other = Laminate()
+    other.addPlies(
+        Ply(laminate.stack[0].mat, thickness=t, rotation=r)
+        for r, t in [(30, 1), (-30, 0.5), (90, 2)]
+    )
+    laminates = [laminate, other, laminate]
+    loads = np.random.RandomState(5).uniform(-100, 100, size=(3, 6))
+
+    result = evaluate_table_failure(
+        LaminateTable.from_laminates(laminates), loads, criterion=criterion
+    )
+    for k, laminate in enumerate(laminates):
+        expected = evaluate_failure(laminate, loads[k : k + 1], criterion=criterion)
+        assert np.isclose(result.reserveFactors[k], expected.reserveFactors[0])
+        assert result.criticalPly[k] == expected.criticalPly[0]
+        assert result.criticalMode[k] == expected.criticalMode[0]
+    with pytest.raises(ValueError):
+        evaluate_table_failure(LaminateTable.from_laminates([Laminate()]), loads[:1])
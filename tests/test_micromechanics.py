@@ -0,0 +1,109 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.micromechanics` module."""
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.micromechanics import *
+
+
+@pytest.mark.parametrize("system", ["prismatic_jones", "hsb"])
+def test_calc_ud_material_matches_FiberReinforcedMaterialUD(system):
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    fibVolRatio = np.linspace(0.1, 0.7, 7)
+    kapa = np.array([0.9, 0.8, 0.95])
+    ud = calc_ud_material(fibVolRatio, matFib, matMat, kapa, system=system)
+
+    FiberReinforcedMaterialUD.set_system(system)
+    for k, phi in enumerate(fibVolRatio):
+        mat_FRM = FiberReinforcedMaterialUD(
+            matFib=matFib, matMat=matMat, fibVolRatio=phi, kapa=list(kapa)
+        )
+        for name in UDProperties._fields:
+            assert np.isclose(getattr(ud, name)[k], getattr(mat_FRM, name))
+        assert np.allclose(ud.stiffnessMatrix[k], mat_FRM.stiffnessMatrix)
+        assert np.allclose(ud.complianceMatrix[k], mat_FRM.complianceMatrix)
+    FiberReinforcedMaterialUD.set_system("hsb")
+
+
+def test_hsb_model_constituent_arrays():
+    E_fib = np.array([1.5e5, 2.2e5, 3e5])
+    matFib = Constituent(
+        rho=1.74e3, E_para=E_fib, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    matMat = Constituent(
+        rho=1.32e3, E_para=3.65e3, E_ortho=3.65e3, G=1.4e3, v_para_ortho=0.3
+    )
+
+    properties = hsb_model(0.6, matFib, matMat, kapa=np.ones((3, 3)))
+
+    assert properties.E_para.shape == (3,)
+    assert np.allclose(properties.E_ortho, properties.E_ortho[0])
+    assert np.isclose(properties.E_para[1], 0.6 * 2.2e5 + 0.4 * 3.65e3)
+
+
+def test_calc_ud_material_nonValid_system():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    with pytest.raises(ValueError):
+        calc_ud_material(0.5, matFib, matMat, system="test")
+
+
+def test_calc_stiffnessMatrix_inverse_of_complianceMatrix():
+    rng = np.random.RandomState(2)
+    E_para = rng.uniform(1e4, 2e5, 50)
+    E_ortho = rng.uniform(1e3, 1e4, 50)
+    G = rng.uniform(1e3, 5e3, 50)
+    v_para_ortho = rng.uniform(0.1, 0.4, 50)
+
+    C = calc_stiffnessMatrix(E_para, E_ortho, G, v_para_ortho)
+    S = calc_complianceMatrix(E_para, E_ortho, G, v_para_ortho)
+
+    assert np.allclose(C, np.linalg.inv(S))
+    mat = AnisotropicMaterial(1, E_para[0], E_ortho[0], G[0], v_para_ortho[0])
+    assert np.allclose(mat.stiffnessMatrix, np.linalg.inv(mat.complianceMatrix))
+    assert np.allclose(mat.stiffnessMatrix, C[0])
+
+
+@pytest.mark.parametrize("system", ["prismatic_jones", "hsb"])
+def test_model_derivatives_finite_differences(system):
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.2, E_para=10, E_ortho=2, G=3)
+    fibVolRatio = np.linspace(0.1, 0.7, 7)
+    h = 1e-6
+    derivatives = MODEL_DERIVATIVES[system](fibVolRatio, matFib, matMat)
+    upper = MODELS[system](fibVolRatio + h, matFib, matMat)
+    lower = MODELS[system](fibVolRatio - h, matFib, matMat)
+    for name in UDProperties._fields:
+        assert np.allclose(
+            getattr(derivatives, name),
+            (getattr(upper, name) - getattr(lower, name)) / (2 * h),
+            rtol=1e-6,
+        )
+
+    dC = calc_ud_stiffnessDerivative(fibVolRatio, matFib, matMat, system=system)
+    upper = calc_ud_material(fibVolRatio + h, matFib, matMat, system=system)
+    lower = calc_ud_material(fibVolRatio - h, matFib, matMat, system=system)
+    assert np.allclose(
+        dC, (upper.stiffnessMatrix - lower.stiffnessMatrix) / (2 * h), rtol=1e-6
+    )
+
+
+def test_schapery_model():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.2, E_para=10, E_ortho=2, G=3)
+    fibVolRatio = np.linspace(0, 1, 5)
+    # equal constituent expansion
+    assert np.allclose(schapery_model(fibVolRatio, matMat, matMat, [2, 2], [2, 2]), 2)
+    expansion = schapery_model(fibVolRatio, matFib, matMat, [0, 0], [1, 1])
+    assert expansion.shape == (5, 2)
+    assert np.allclose(expansion[0], 1)
+    assert np.allclose(expansion[-1], 0)
+    assert np.all(np.diff(expansion[:, 0]) < 0)
+    assert np.all(expansion[1:-1, 1] > expansion[1:-1, 0])
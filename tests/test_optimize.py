@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.optimize` module."""
+
+import itertools
+
+import pytest
+
+import numpy as np
+
+from clt_py.batch import calc_ABD_matrices
+from clt_py.clt_py import *
+from clt_py.optimize import *
+
+ANGLES = (0.0, 45.0, -45.0, 90.0)
+
+
+@pytest.fixture
+def crp():
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    return FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+
+
+def brute_force(crp, objective, constraints):
+    chromosomes = np.array(list(itertools.product(range(4), repeat=4)))
+    values, violation = evaluate_chromosomes(
+        chromosomes, ANGLES, 0.25, [crp], None, True, objective, constraints
+    )
+    return np.max(values[violation == 0])
+
+
+def test_evaluate_chromosomes(crp):
+    chromosomes = np.array([[0, 1, 2, 3], [3, 3, 0, 0], [1, 1, 1, 1]])
+    values, violation = evaluate_chromosomes(
+        chromosomes,
+        ANGLES,
+        0.25,
+        [crp],
+        None,
+        True,
+        BucklingLoad(400, 200),
+        [Bound(EngineeringConstant("E_x", 2.0), upper=60e3), Balance()],
+    )
+    for k, chromosome in enumerate(chromosomes):
+        laminate = Laminate(symetric=True)
+        laminate.addPlies(
+            Ply(crp, thickness=0.25, rotation=ANGLES[gene]) for gene in chromosome
+        )
+        laminate.update()
+        ABD = laminate.get_stiffnessMatrix()
+        assert values[k] == pytest.approx(BucklingLoad(400, 200)(ABD[None], None)[0])
+        E_x = laminate.get_membraneConstants()["E_x"]
+        balance = (abs(ABD[0, 2]) + abs(ABD[1, 2])) / ABD[0, 0]
+        assert violation[k] == pytest.approx(
+            max(E_x - 60e3, 0) + max(balance - 1e-6, 0)
+        )
+    assert violation[0] == 0
+    assert violation[1] > 0
+    assert violation[2] > 0
+
+
+def test_Bound():
+    function = lambda ABD, rotations: np.array([1.0, 5.0, 9.0])
+    assert np.allclose(Bound(function, lower=3)(None, None), [2, -2, -6])
+    assert np.allclose(Bound(function, 3, 7)(None, None), [2, -2, 2])
+
+
+def test_GeneticOptimizer_finds_optimum(crp):
+    objective = BucklingLoad(400, 200)
+    constraints = [Balance(), Bound(EngineeringConstant("E_x", 2.0), lower=60e3)]
+    optimizer = GeneticOptimizer(
+        ANGLES,
+        4,
+        0.25,
+        [crp],
+        objective,
+        constraints,
+        population_size=30,
+        n_generations=30,
+        seed=0,
+    )
+    result = optimizer.run()
+    assert result.violation == 0
+    assert result.objective == pytest.approx(brute_force(crp, objective, constraints))
+    assert result.rotations.shape == (8,)
+    assert np.all(np.diff(result.history) >= 0)
+    # repeated chromosomes are evaluated once
+    assert result.n_evaluations < 31 * 30
+    assert result.n_evaluations == len(optimizer.cache)
+
+
+def test_GeneticOptimizer_minimize(crp):
+    objective = EngineeringConstant("E_x", 2.0)
+    result = GeneticOptimizer(
+        ANGLES,
+        4,
+        0.25,
+        [crp],
+        objective,
+        maximize=False,
+        population_size=20,
+        n_generations=20,
+        seed=3,
+    ).run()
+    assert -result.objective == pytest.approx(
+        brute_force(crp, lambda *args: -objective(*args), [])
+    )
+
+
+def test_GeneticOptimizer_reproducible(crp):
+    def run(workers):
+        return GeneticOptimizer(
+            ANGLES,
+            6,
+            0.125,
+            [crp],
+            BucklingLoad(300, 300, load_ratio=0.5),
+            [Balance()],
+            population_size=20,
+            n_generations=5,
+            workers=workers,
+            seed=42,
+        ).run()
+
+    serial = run(0)
+    assert np.array_equal(serial.chromosome, run(0).chromosome)
+    parallel = run(2)
+    assert np.array_equal(serial.chromosome, parallel.chromosome)
+    assert np.allclose(serial.history, parallel.history)
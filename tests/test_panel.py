@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.panel` module."""
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.panel import *
+
+
+def isotropic_D(E=70e3, v=0.3, h=2.0):
+    D = E * h**3 / (12 * (1 - v**2))
+    return np.array([[D, v * D, 0], [v * D, D, 0], [0, 0, (1 - v) / 2 * D]]), D
+
+
+def test_calc_bucklingLoads_isotropic():
+    D, D_plate = isotropic_D()
+    # uniaxial compression, buckling coefficient 4 for integer aspect ratios
+    result = calc_bucklingLoads(D, 300, 100)
+    assert result.values == pytest.approx(4 * np.pi**2 * D_plate / 100**2)
+    assert (result.m, result.n) == (3, 1)
+    # equal biaxial compression of a square plate
+    result = calc_bucklingLoads(D, 100, 100, load_ratio=1)
+    assert result.values == pytest.approx(2 * np.pi**2 * D_plate / 100**2)
+    # no buckling in tension
+    assert np.isinf(calc_bucklingLoads(D, 100, 100, load_ratio=-1e6, max_m=1).values)
+
+
+def test_calc_bucklingLoads_broadcast():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    laminates = []
+    for rotations in [[0, 90], [45, -45]]:
+        laminate = Laminate(symetric=True)
+        laminate.addPlies(Ply(mat_FRM, rotation=r, thickness=0.25) for r in rotations)
+        laminates.append(laminate)
+    ABD = np.array([laminate.get_stiffnessMatrix() for laminate in laminates])
+    a = np.array([[10.0], [20.0], [30.0]])
+    ratio = np.array([0, 0.5, -0.2])[:, np.newaxis, np.newaxis]
+
+    result = calc_bucklingLoads(ABD, a, 10, ratio)
+    assert result.values.shape == (3, 3, 2)
+    for i, j, k in np.ndindex(*result.values.shape):
+        single = calc_bucklingLoads(ABD[k, 3:, 3:], a[j, 0], 10, ratio[i, 0, 0])
+        assert result.values[i, j, k] == pytest.approx(single.values)
+        assert result.m[i, j, k] == single.m
+        assert result.n[i, j, k] == single.n
+
+
+def test_calc_naturalFrequencies():
+    D, D_plate = isotropic_D()
+    mass = 2.7e-9 * 2.0
+    result = calc_naturalFrequencies(D, mass, 100, 200, n_modes=3)
+    omega = np.pi**2 * np.sqrt(D_plate / mass)
+    expected = [
+        omega * ((m / 100) ** 2 + (n / 200) ** 2) / (2 * np.pi)
+        for m, n in [(1, 1), (1, 2), (1, 3)]
+    ]
+    assert np.allclose(result.values, expected)
+    assert list(result.m) == [1, 1, 1]
+    assert list(result.n) == [1, 2, 3]
+
+    batch = calc_naturalFrequencies(np.stack([D, 4 * D]), [mass, mass], 100, 200)
+    assert batch.values.shape == (2, 1)
+    assert batch.values[1, 0] == pytest.approx(2 * expected[0])
+
+
+def test_arealMass():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=3, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    laminate = Laminate(symetric=True)
+    laminate.addPly(Ply(matMat, thickness=2))
+    laminate.addPly(Ply(mat_FRM, thickness=0.5))
+    assert laminate.get_arealMass() == pytest.approx(2 * (2 + 0.5 * mat_FRM.rho))
+    assert np.allclose(calc_arealMass([[2, 0.5], [1, 1]], [1, 3]), [3.5, 4])
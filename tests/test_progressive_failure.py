@@ -0,0 +1,63 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.progressive_failure` module."""
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.failure import evaluate_failure
+from clt_py.progressive_failure import *
+
+
+def cross_ply():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    mat_FRM.set_strength(1500, 1200, 50, 200, 80)
+
+    laminate = Laminate(symetric=True)
+    laminate.addPlies(Ply(mat_FRM, rotation=r) for r in [0, 90])
+    return laminate
+
+
+def test_progressive_failure_cross_ply_tension():
+    laminate = cross_ply()
+
+    result = progressive_failure(laminate, [[1, 0, 0, 0, 0, 0]])
+    modes = [result.modes[m] for m in result.failedMode[0] if m >= 0]
+    plies = result.failedPly[0][result.failedPly[0] >= 0]
+
+    assert modes[:2] == ["matrix_tension", "matrix_tension"]
+    assert set(plies[:2]) == {1, 2}
+    assert "fiber_tension" in modes
+    assert result.firstPlyFailure[0] == result.loadFactors[0, 0]
+    assert result.ultimateLoadFactors[0] > result.firstPlyFailure[0]
+    assert result.lastPlyFailure[0] == result.loadFactors[0, len(plies) - 1]
+    first = evaluate_failure(laminate, [[1, 0, 0, 0, 0, 0]], criterion="hashin")
+    assert np.isclose(result.firstPlyFailure[0], first.reserveFactors[0])
+
+
+def test_progressive_failure_cases_in_parallel():
+    laminate = cross_ply()
+    loads = np.random.RandomState(5).uniform(-1, 1, size=(6, 6))
+
+    result = progressive_failure(laminate, loads, criterion="puck")
+    for k_case in range(6):
+        single = progressive_failure(laminate, loads[k_case], criterion="puck")
+        assert np.allclose(
+            single.loadFactors[0], result.loadFactors[k_case], equal_nan=True
+        )
+        assert np.array_equal(single.failedPly[0], result.failedPly[k_case])
+
+
+def test_progressive_failure_errors():
+    laminate = cross_ply()
+    with pytest.raises(ValueError):
+        progressive_failure(laminate, np.ones(6), criterion="tsai_wu")
+
+    result = progressive_failure(laminate, np.zeros(6))
+    assert np.isinf(result.ultimateLoadFactors[0])
+    assert np.all(result.failedPly == -1)
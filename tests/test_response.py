@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.response` module."""
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.response import *
+
+
+def laminate_and_material():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    laminate = Laminate()
+    laminate.addPlies(
+        Ply(mat_FRM, rotation=r, thickness=t) for r, t in [(0, 1), (45, 0.5), (90, 2)]
+    )
+    return laminate, mat_FRM
+
+
+def test_LoadResponseSolver_equilibrium():
+    laminate, mat_FRM = laminate_and_material()
+    loads = np.random.RandomState(3).uniform(-1, 1, size=(10, 6))
+
+    response = LoadResponseSolver(laminate).solve(loads)
+
+    assert response.strains.shape == (10, 3, 2, 3)
+    deformations = np.hstack([response.midplaneStrains, response.curvatures])
+    assert np.allclose(np.matmul(deformations, laminate.get_stiffnessMatrix().T), loads)
+
+    # resultants of the ply stresses, strain(z) = midplaneStrain - z * curvature
+    z = laminate.get_z_positions()
+    for k_case in range(10):
+        N = np.zeros(3)
+        M = np.zeros(3)
+        for k_ply, ply in enumerate(laminate.get_finalStack()):
+            bottom, top = response.stresses[k_case, k_ply]
+            dz = z[k_ply + 1] - z[k_ply]
+            z_mid = (z[k_ply + 1] + z[k_ply]) / 2
+            slope = (top - bottom) / dz
+            N += (bottom + top) / 2 * dz
+            M += -((bottom + top) / 2 * z_mid * dz + slope * dz**3 / 12)
+        assert np.allclose(N, loads[k_case, :3])
+        assert np.allclose(M, loads[k_case, 3:])
+
+
+def test_LoadResponseSolver_material_axes():
+    laminate, mat_FRM = laminate_and_material()
+
+    response = LoadResponseSolver(laminate).solve([1, 0, 0, 0, 0, 0])
+
+    for k_ply, ply in enumerate(laminate.get_finalStack()):
+        for k_point in range(2):
+            strain = response.materialStrains[0, k_ply, k_point]
+            stress = response.materialStresses[0, k_ply, k_point]
+            assert np.allclose(np.matmul(mat_FRM.stiffnessMatrix, strain), stress)
+
+    # 90° ply: laminate x-axis is the transverse material axis
+    assert np.allclose(
+        response.materialStresses[0, 2, :, 1], response.stresses[0, 2, :, 0]
+    )
+    assert np.allclose(
+        response.materialStresses[0, 2, :, 0], response.stresses[0, 2, :, 1]
+    )
+
+
+def test_LoadResponseSolver_hygrothermal():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25, alpha=6e-5, beta=3e-3)
+    matFib = AnisotropicMaterial(
+        rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3, alpha=[-1e-6, 1e-5]
+    )
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+
+    single = Laminate()
+    single.addPly(Ply(mat_FRM, rotation=30))
+    response = LoadResponseSolver(single).solve(deltaT=[-100, 50])
+    # a single ply expands freely
+    assert np.allclose(response.stresses, 0, atol=1e-12)
+    assert np.allclose(
+        response.midplaneStrains, np.outer([-100, 50], single.get_finalStack()[0].alpha)
+    )
+
+    laminate = Laminate()
+    laminate.addPlies(
+        Ply(mat_FRM, rotation=r, thickness=t) for r, t in [(0, 1), (45, 0.5), (90, 2)]
+    )
+    solver = LoadResponseSolver(laminate)
+    deltaT = np.array([-120.0, 0.0, 30.0])
+    deltaM = np.array([0.0, 0.01, 0.005])
+    response = solver.solve(deltaT=deltaT, deltaM=deltaM)
+    assert np.any(np.abs(response.stresses) > 1e-6)
+    # residual stresses are self-equilibrated
+    z = laminate.get_z_positions()
+    for k_case in range(3):
+        N = np.zeros(3)
+        M = np.zeros(3)
+        for k_ply in range(3):
+            bottom, top = response.stresses[k_case, k_ply]
+            dz = z[k_ply + 1] - z[k_ply]
+            z_mid = (z[k_ply + 1] + z[k_ply]) / 2
+            N += (bottom + top) / 2 * dz
+            M += -((bottom + top) / 2 * z_mid * dz + (top - bottom) * dz**2 / 12)
+        assert np.allclose(N, 0, atol=1e-12)
+        assert np.allclose(M, 0, atol=1e-12)
+
+    # mechanical loads superpose
+    loads = np.random.RandomState(0).uniform(-1, 1, (3, 6))
+    combined = solver.solve(loads, deltaT, deltaM)
+    mechanical = solver.solve(loads)
+    assert np.allclose(combined.stresses, response.stresses + mechanical.stresses)
+    with pytest.raises(ValueError):
+        solver.solve()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.sensitivity` module."""
+
+import pytest
+
+import numpy as np
+
+from clt_py.batch import calc_ABD_matrices
+from clt_py.clt_py import *
+from clt_py.sensitivity import *
+
+
+@pytest.fixture
+def constituents():
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    return matFib, matMat
+
+
+def materials(constituents, fibVolRatios=(0.6, 0.5)):
+    matFib, matMat = constituents
+    return [
+        FiberReinforcedMaterialUD(
+            matFib=matFib, matMat=matMat, fibVolRatio=fibVolRatios[0], system="hsb"
+        ),
+        FiberReinforcedMaterialUD(
+            matFib=matFib,
+            matMat=matMat,
+            fibVolRatio=fibVolRatios[1],
+            system="prismatic_jones",
+        ),
+        IsotropicMaterial(rho=2.7e3, E=7e4, v=0.3),
+    ]
+
+
+def central_difference(function, x, h):
+    return (function(x + h) - function(x - h)) / (2 * h)
+
+
+def constants(ABD, thickness):
+    return calc_effectiveConstants(np.linalg.inv(ABD), thickness)
+
+
+def test_calc_rotated_stiffnessDerivative():
+    U = np.array([5.0, 3.0, 1.0, 1.5, 2.0])
+    rotRad = np.linspace(-1.5, 1.5, 7)
+    assert np.allclose(
+        calc_rotated_stiffnessDerivative(U, rotRad),
+        central_difference(lambda x: calc_rotated_stiffnessMatrix(U, x), rotRad, 1e-6),
+        atol=1e-8,
+    )
+
+
+@pytest.mark.parametrize(
+    "symetric, move_reference_plane", [(False, True), (True, True), (False, False)]
+)
+def test_calc_ABD_jacobian_finite_differences(
+    constituents, symetric, move_reference_plane
+):
+    random = np.random.RandomState(0)
+    rotations = random.uniform(-90, 90, (3, 4))
+    thicknesses = random.uniform(0.1, 0.3, (3, 4))
+    indices = random.randint(3, size=(3, 4))
+    mats = materials(constituents)
+
+    def evaluate(rotations=rotations, thicknesses=thicknesses, mats=mats):
+        ABD = calc_ABD_matrices(
+            rotations, thicknesses, mats, indices, symetric, move_reference_plane
+        )
+        thickness = thicknesses.sum(axis=1) * (2 if symetric else 1)
+        return ABD, constants(ABD, thickness)
+
+    jacobian = calc_ABD_jacobian(
+        rotations, thicknesses, mats, indices, symetric, move_reference_plane
+    )
+    constants_jacobian = calc_effectiveConstants_jacobian(jacobian)
+    ABD, reference = evaluate()
+    assert np.allclose(jacobian.ABD, ABD)
+    assert np.allclose(constants_jacobian.constants, reference)
+
+    for k in range(4):
+        unit = np.zeros((3, 4))
+        unit[:, k] = 1
+        for name, arguments, h in [
+            ("d_rotations", "rotations", 1e-5),
+            ("d_thicknesses", "thicknesses", 1e-7),
+        ]:
+            base = rotations if arguments == "rotations" else thicknesses
+            upper = evaluate(**{arguments: base + h * unit})
+            lower = evaluate(**{arguments: base - h * unit})
+            for analytic, index in [(jacobian, 0), (constants_jacobian, 1)]:
+                difference = (upper[index] - lower[index]) / (2 * h)
+                assert np.allclose(
+                    getattr(analytic, name)[:, k],
+                    difference,
+                    rtol=1e-5,
+                    atol=1e-6 * np.abs(difference).max(),
+                )
+
+    for m, fibVolRatios in enumerate([(0.6 + 1e-6, 0.5), (0.6, 0.5 + 1e-6)]):
+        upper = evaluate(mats=materials(constituents, fibVolRatios))
+        lower = evaluate(
+            mats=materials(constituents, 2 * np.array([0.6, 0.5]) - fibVolRatios)
+        )
+        for analytic, index in [(jacobian, 0), (constants_jacobian, 1)]:
+            difference = (upper[index] - lower[index]) / 2e-6
+            assert np.allclose(
+                analytic.d_fibVolRatios[:, m],
+                difference,
+                rtol=1e-5,
+                atol=1e-6 * np.abs(difference).max(),
+            )
+    # no fibers, no derivative
+    assert np.all(jacobian.d_fibVolRatios[:, 2] == 0)
+
+
+def test_calc_ABD_jacobian_matches_Laminate(constituents):
+    crp = materials(constituents)[0]
+    laminate = Laminate(symetric=True)
+    laminate.addPlies(Ply(crp, thickness=0.125, rotation=r) for r in (0, 45, -45, 90))
+    laminate.update()
+    jacobian = calc_ABD_jacobian([[0, 45, -45, 90]], 0.125, [crp], symetric=True)
+    assert np.allclose(jacobian.ABD[0], laminate.get_stiffnessMatrix())
+    assert jacobian.thickness[0] == pytest.approx(laminate.get_thickness())
+    assert jacobian.d_rotations.shape == (1, 4, 6, 6)
+    # symmetric laminates stay decoupled
+    assert np.allclose(jacobian.d_rotations[..., :3, 3:], 0, atol=1e-9)
+    assert np.allclose(jacobian.d_thicknesses[..., :3, 3:], 0, atol=1e-9)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.stacking` module."""
+
+import itertools
+
+import pytest
+
+import numpy as np
+
+from clt_py.batch import calc_ABD_matrices
+from clt_py.clt_py import *
+from clt_py.stacking import *
+
+ANGLES = (0.0, 45.0, -45.0, 90.0)
+
+
+def max_run(stack):
+    return max(len(list(group)) for _, group in itertools.groupby(stack))
+
+
+def brute_force(n_plies, symetric, max_contiguous, min_ratio):
+    required = np.ceil(min_ratio * n_plies - 1e-9)
+    stacks = set()
+    for stack in itertools.product(ANGLES, repeat=n_plies):
+        if symetric and stack != stack[::-1]:
+            continue
+        if stack.count(45.0) != stack.count(-45.0):
+            continue
+        if max_run(stack) > max_contiguous:
+            continue
+        if any(stack.count(angle) < required for angle in ANGLES):
+            continue
+        stacks.add(min(stack, stack[::-1]))
+    return stacks
+
+
+@pytest.mark.parametrize(
+    "n_plies, symetric, max_contiguous, min_ratio",
+    [(8, True, 4, 0.1), (12, True, 2, 0.1), (10, True, 3, 0.0), (6, False, 2, 0.1)],
+)
+def test_iter_stackingSequences_brute_force(
+    n_plies, symetric, max_contiguous, min_ratio
+):
+    chunks = list(
+        iter_stackingSequences(
+            ANGLES,
+            n_plies,
+            symetric=symetric,
+            max_contiguous=max_contiguous,
+            min_ratio=min_ratio,
+            chunk_size=7,
+        )
+    )
+    assert all(len(chunk) <= 7 for chunk in chunks)
+    stacks = np.concatenate(chunks)
+    if symetric:
+        stacks = np.concatenate([stacks, stacks[:, ::-1]], axis=1)
+    # no duplicates, also not as reversed stack
+    stacks = [min(tuple(stack), tuple(stack[::-1])) for stack in stacks.tolist()]
+    assert len(set(stacks)) == len(stacks)
+    assert set(stacks) == brute_force(n_plies, symetric, max_contiguous, min_ratio)
+
+
+def test_iter_stackingSequences_options():
+    assert count_stackingSequences(n_plies=4, angles=(0, 90), min_ratio=0) == 4
+    # 10% rule, both angles in the lower half
+    assert count_stackingSequences(n_plies=4, angles=(0, 90)) == 2
+    # +30 cannot be balanced without -30
+    stacks = np.concatenate(
+        list(iter_stackingSequences((0, 30), 6, max_contiguous=None, min_ratio=0))
+    )
+    assert np.all(stacks == 0)
+    assert list(iter_stackingSequences(n_plies=4, min_ratio=0.5)) == []
+    with pytest.raises(ValueError):
+        next(iter_stackingSequences(n_plies=7))
+
+
+def test_iter_stackingSequences_ABD():
+    matFib = AnisotropicMaterial(
+        rho=1.74e3, E_para=2.2e5, E_ortho=2.8e4, G=5e4, v_para_ortho=0.23
+    )
+    matMat = IsotropicMaterial(rho=1.32e3, E=3.65e3, v=0.3)
+    crp = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat, fibVolRatio=0.6)
+    rotations = next(iter_stackingSequences(n_plies=8))
+    ABD = calc_ABD_matrices(rotations, 0.125, [crp], symetric=True)
+
+    laminate = Laminate(symetric=True)
+    laminate.addPlies(Ply(crp, thickness=0.125, rotation=r) for r in rotations[0])
+    laminate.update()
+    assert np.allclose(ABD[0], laminate.get_stiffnessMatrix())
+    # symmetric and balanced
+    assert np.allclose(ABD[:, :3, 3:], 0, atol=1e-6)
+    assert np.allclose(ABD[:, :2, 2], 0, atol=1e-6)
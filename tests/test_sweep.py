@@ -0,0 +1,161 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.sweep` module."""
+
+import concurrent.futures
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.micromechanics import Constituent
+from clt_py.sweep import *
+
+
+def constituents():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+    return matFib, matMat
+
+
+def grid():
+    return ParameterGrid(
+        fibVolRatio=np.linspace(0.4, 0.6, 3),
+        kapa=np.array([[1.0, 1.0, 1.0], [0.9, 0.8, 0.9]]),
+        rotations=np.array([[0, 90, 90, 0], [45, -45, -45, 45]]),
+        thicknesses=np.array([0.5, 1.0]),
+    )
+
+
+def test_ParameterGrid_points():
+    parameters = grid()
+    points = parameters.points(5, 9)
+
+    assert len(parameters) == 24
+    assert points["rotations"].shape == (4, 4)
+    assert np.array_equal(points["thicknesses"], [1.0, 0.5, 1.0, 0.5])
+    assert np.allclose(points["fibVolRatio"], [0.4, 0.4, 0.4, 0.5])
+
+
+def test_run_sweep_matches_objects():
+    matFib, matMat = constituents()
+    parameters = grid()
+    result = run_sweep(
+        laminate_stiffness,
+        parameters,
+        chunk_size=5,
+        max_workers=0,
+        matFib=matFib,
+        matMat=matMat,
+        system="prismatic_jones",
+    )
+    assert result["ABD"].shape == (24, 6, 6)
+
+    points = parameters.points()
+    FiberReinforcedMaterialUD.set_system("prismatic_jones")
+    for k in [0, 13, 23]:
+        mat_FRM = FiberReinforcedMaterialUD(
+            matFib, matMat, points["fibVolRatio"][k], list(points["kapa"][k])
+        )
+        laminate = Laminate()
+        laminate.addPlies(
+            Ply(mat_FRM, thickness=points["thicknesses"][k], rotation=r)
+            for r in points["rotations"][k]
+        )
+        assert np.allclose(result["ABD"][k], laminate.get_stiffnessMatrix())
+        assert np.isclose(result["E_ortho"][k], mat_FRM.E_ortho)
+    FiberReinforcedMaterialUD.set_system("hsb")
+
+
+def test_iter_sweep_process_pool_in_order():
+    matFib, matMat = constituents()
+    calls = []
+
+    serial = run_sweep(
+        laminate_stiffness,
+        grid(),
+        chunk_size=7,
+        max_workers=0,
+        matFib=matFib,
+        matMat=matMat,
+    )
+    chunks = list(
+        iter_sweep(
+            laminate_stiffness,
+            grid(),
+            chunk_size=7,
+            max_workers=2,
+            progress=lambda done, total: calls.append((done, total)),
+            matFib=matFib,
+            matMat=matMat,
+        )
+    )
+
+    assert calls == [(7, 24), (14, 24), (21, 24), (24, 24)]
+    assert np.allclose(np.concatenate([c["ABD"] for c in chunks]), serial["ABD"])
+
+
+def test_iter_sweep_passes_constituents():
+    matFib, matMat = constituents()
+    received = []
+
+    def function(points, matFib, matMat, system):
+        received.append((matFib, matMat, system))
+        return laminate_stiffness(points, matFib, matMat, system)
+
+    result = run_sweep(
+        function,
+        grid(),
+        chunk_size=10,
+        max_workers=0,
+        matFib=matFib,
+        matMat=matMat,
+        system="hsb",
+    )
+    assert len(received) == 3
+    for fiber, matrix, system in received:
+        assert type(fiber) is Constituent and type(matrix) is Constituent
+        assert fiber.E_para == matFib.E_para and matrix.rho == matMat.rho
+        assert system == "hsb"
+    reference = run_sweep(
+        laminate_stiffness, grid(), max_workers=0, matFib=matFib, matMat=matMat
+    )
+    assert np.allclose(result["ABD"], reference["ABD"])
+
+
+def test_iter_map_consumes_lazily():
+    consumed = []
+
+    def arguments():
+        for k in range(10):
+            consumed.append(k)
+            yield (k, 2)
+
+    results = iter_map(pow, arguments(), max_workers=1)
+    assert next(results) == 0
+    assert len(consumed) < 10
+    assert list(results) == [k**2 for k in range(1, 10)]
+    assert list(iter_map(pow, arguments(), max_workers=0)) == [k**2 for k in range(10)]
+
+
+def test_iter_map_executor():
+    with concurrent.futures.ProcessPoolExecutor(2) as executor:
+        arguments = [(k, 2) for k in range(6)]
+        assert list(iter_map(pow, arguments, executor=executor)) == [
+            k**2 for k in range(6)
+        ]
+        # the executor is reused and stays open
+        assert list(iter_map(pow, arguments[:2], executor=executor)) == [0, 1]
+
+        consumed = []
+
+        def generator():
+            for args in arguments:
+                consumed.append(args)
+                yield args
+
+        results = iter_map(pow, generator(), executor=executor, max_pending=2)
+        assert next(results) == 0
+        assert len(consumed) == 2
+        assert list(results) == [k**2 for k in range(1, 6)]
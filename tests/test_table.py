@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+
+"""Tests for `clt_py.table` module."""
+
+import pytest
+
+import numpy as np
+
+from clt_py.clt_py import *
+from clt_py.table import *
+
+
+def materials():
+    matMat = IsotropicMaterial(rho=1, E=1, v=0.25)
+    matFib = AnisotropicMaterial(rho=2, v_para_ortho=0.25, E_para=10, E_ortho=2, G=3)
+
+    mat_FRM = FiberReinforcedMaterialUD(matFib=matFib, matMat=matMat)
+    return [mat_FRM, matMat]
+
+
+def test_PlyTable_matches_Ply():
+    mats = materials()
+    plies = [
+        Ply(mats[0], thickness=0.5, rotation=30),
+        Ply(mats[1], thickness=2, rotation=0),
+        Ply(mats[0], thickness=1, rotation=-60),
+    ]
+    table = PlyTable.from_plies(plies)
+    assert len(table) == 3
+    assert table.materials == mats
+    assert list(table.material_indices) == [0, 1, 0]
+
+    for ply, view in zip(plies, table):
+        assert view.mat is ply.mat
+        assert view.rotRad == ply.rotRad
+        assert view.thickness == ply.thickness
+        for attribute in ["Q", "S", "rotStress", "rotElongation"]:
+            assert np.allclose(getattr(view, attribute), getattr(ply, attribute))
+        for attribute in ["E_1", "E_2", "G", "v_12"]:
+            assert getattr(view, attribute) == pytest.approx(getattr(ply, attribute))
+    assert np.allclose(table.E_1, [ply.E_1 for ply in plies])
+    assert table[-1].index == 2
+    assert np.allclose(table[0].to_ply().Q, plies[0].Q)
+    with pytest.raises(IndexError):
+        table[3]
+    with pytest.raises(AttributeError):
+        table[0].label = "ply"
+
+
+def test_PlyTable_set_rotations():
+    mats = materials()
+    table = PlyTable(mats, [0, 45, 90], 0.5, [0, 0, 1])
+    assert table.nbytes == 3 * (2 * 9 * 8 + 2 * 8 + 4)
+
+    table.set_rotations(30, [0])
+    assert np.allclose(table[0].Q, Ply(mats[0], rotation=30).Q)
+    with pytest.raises(IndexError):
+        PlyTable(mats, [0, 45], material_indices=[0, 2])
+
+
+def test_LaminateTable_matches_Laminate():
+    mats = materials()
+    symetric = Laminate(symetric=True)
+    symetric.addPly(Ply(mats[0], thickness=1, rotation=0))
+    symetric.addPly(Ply(mats[0], thickness=0.5, rotation=45))
+    cored = Laminate()
+    cored.addPly(Ply(mats[0], rotation=30))
+    cored.addCore(Ply(mats[1], thickness=3))
+    cored.set_move_reference_plane(False)
+    laminates = [symetric, Laminate(), cored]
+
+    table = LaminateTable.from_laminates(laminates)
+    assert len(table) == 3
+    assert list(table.get_plyCounts()) == [4, 0, 2]
+    ABD = table.get_stiffnessMatrices()
+    assert ABD.shape == (3, 6, 6)
+    for laminate, view in zip(laminates[::2], [table[0], table[2]]):
+        assert np.allclose(view.get_stiffnessMatrix(), laminate.get_stiffnessMatrix())
+        assert np.allclose(view.get_z_positions(), laminate.get_z_positions())
+        assert [ply.rotRad for ply in view.get_finalStack()] == [
+            ply.rotRad for ply in laminate.get_finalStack()
+        ]
+    assert not np.any(table[1].get_stiffnessMatrix())
+    assert len(table[1]) == 0
+
+
+def test_LaminateTable_from_arrays():
+    mats = materials()
+    rotations = np.array([[0, 45, -45, 90], [90, 0, 30, 30]])
+    table = LaminateTable.from_arrays(mats, rotations, 0.25, [0, 0, 1, 0])
+    for stack, view in zip(rotations, table):
+        laminate = Laminate()
+        for rotation, index in zip(stack, [0, 0, 1, 0]):
+            laminate.addPly(Ply(mats[index], thickness=0.25, rotation=rotation))
+        assert np.allclose(view.get_stiffnessMatrix(), laminate.get_stiffnessMatrix())
+
+    table.plies.set_rotations(0)
+    table.changed()
+    assert np.allclose(table[0].get_stiffnessMatrix(), table[1].get_stiffnessMatrix())
+
+
+def test_LaminateTable_offsets():
+    table = PlyTable(materials(), [0, 45])
+    with pytest.raises(ValueError):
+        LaminateTable(table, [0, 1])
+    with pytest.raises(ValueError):
+        LaminateTable(table, [0, 2, 1, 2])
+
+
+def test_LaminateTable_subset():
+    mats = materials()
+    plies = PlyTable(mats, [0, 45, 90, 30, -30, 60], [1, 1, 2, 1, 1, 0.5], 0)
+    table = LaminateTable(plies, [0, 1, 3, 3, 6], [True, False, True, True])
+    table.get_stiffnessMatrices()
+
+    subset = table.subset([3, 1, 2])
+    assert np.array_equal(subset.offsets, [0, 3, 5, 5])
+    assert np.allclose(np.degrees(subset.plies.rotRad), [30, -30, 60, 45, 90])
+    assert list(subset.move_reference_plane) == [True, False, True]
+    assert subset.plies.materials is table.plies.materials
+    assert np.allclose(subset.get_stiffnessMatrices(), table.ABD[[3, 1, 2]])
+    subset.changed()
+    assert np.allclose(subset.get_stiffnessMatrices(), table.ABD[[3, 1, 2]])